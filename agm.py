@@ -0,0 +1,735 @@
+import csv
+import heapq
+import io
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from itertools import islice
+from operator import length_hint
+
+import numpy as np
+
+from instrumentacao import fase
+
+# Acima deste número de arestas, a ordenação do Kruskal usa numpy.argsort
+# sobre o vetor de custos em vez de sorted() sobre as tuplas.
+LIMITE_ARGSORT = 10_000
+
+# Na matriz de custos, o Kruskal (extração das arestas + ordenação) vence o
+# Prim em O(V²) enquanto o grafo tem menos de V² / DIVISOR_DENSO arestas.
+DIVISOR_DENSO = 8
+
+# Número de linhas acumuladas por escrita em escrever_agm.
+TAMANHO_BLOCO_ESCRITA = 8192
+
+# Cabeçalho do formato binário de escrever_agm: assinatura, número de
+# vértices e tipo dos custos ("q" inteiros, "d" reais).
+CABECALHO_BINARIO = struct.Struct("<4sqc")
+ASSINATURA_BINARIO = b"AGM1"
+
+# A partir deste número de vértices, o Prim denso roda vetorizado com NumPy
+# (prim_numpy) mesmo quando a matriz é uma lista de listas.
+LIMITE_NUMPY = 500
+
+
+def prim_matriz(grafo, V):
+    # Algoritmo de Prim sobre a matriz de custos V x V (0 = sem conexão), em
+    # O(V²): a cada passo, escolhe o vértice de menor custo ainda fora da
+    # árvore e atualiza os custos dos vizinhos varrendo a sua linha.
+    # Retorna (origem, custos): origem[v] = vértice que liga v à árvore (-1 na
+    # raiz) e custos[v] = custo dessa ligação (0 na raiz).
+    infinito = float("inf")
+    selecionado = [False] * V  # Marca os vértices incluídos na AGM
+    custo_minimo = [infinito] * V  # Custo mínimo para incluir cada vértice
+    origem = [-1] * V  # Armazena a estrutura da AGM
+
+    # Começa pelo primeiro vértice
+    if V:
+        custo_minimo[0] = 0
+
+    for _ in range(V):
+        # Escolhe o vértice de menor custo que ainda não foi incluído na AGM
+        min_custo = infinito
+        u = -1
+        for v in range(V):
+            if not selecionado[v] and custo_minimo[v] < min_custo:
+                min_custo = custo_minimo[v]
+                u = v
+
+        if u == -1:
+            u = selecionado.index(False)  # Grafo desconexo: começa outra árvore
+            custo_minimo[u] = 0
+
+        selecionado[u] = True  # Marca o vértice como incluído na AGM
+
+        # Atualiza os custos mínimos para os vértices vizinhos
+        for v in range(V):
+            if 0 < grafo[u][v] < custo_minimo[v] and not selecionado[v]:
+                custo_minimo[v] = grafo[u][v]
+                origem[v] = u
+
+    return origem, custo_minimo
+
+
+def prim_matriz_instrumentado(grafo, V, estatisticas):
+    # prim_matriz contando o trabalho em estatisticas. Cada vértice incluído
+    # examina a sua linha inteira da matriz.
+    infinito = float("inf")
+    selecionado = [False] * V
+    custo_minimo = [infinito] * V
+    origem = [-1] * V
+    melhorias = 0
+
+    if V:
+        custo_minimo[0] = 0
+
+    for _ in range(V):
+        min_custo = infinito
+        u = -1
+        for v in range(V):
+            if not selecionado[v] and custo_minimo[v] < min_custo:
+                min_custo = custo_minimo[v]
+                u = v
+
+        if u == -1:
+            u = selecionado.index(False)
+            custo_minimo[u] = 0
+
+        selecionado[u] = True
+
+        for v in range(V):
+            if 0 < grafo[u][v] < custo_minimo[v] and not selecionado[v]:
+                custo_minimo[v] = grafo[u][v]
+                origem[v] = u
+                melhorias += 1
+
+    estatisticas.somar(assentados=V, relaxadas=V * V, melhorias=melhorias)
+    return origem, custo_minimo
+
+
+def prim_numpy(grafo, V, estatisticas=None):
+    # O mesmo Prim em O(V²) de prim_matriz, vetorizado com NumPy sobre uma
+    # matriz densa (ndarray ou lista de listas, custo <= 0 = sem conexão, como
+    # em prim_matriz). Cada passo faz um argmin sobre os custos dos vértices
+    # ainda fora da árvore e atualiza esses custos com a linha do vértice
+    # escolhido num só np.minimum. Devolve a mesma árvore de prim_matriz,
+    # inclusive nos empates. Com estatisticas, conta também as melhorias de
+    # cada passo (um teste por passo, desprezível diante das operações
+    # vetorizadas).
+    matriz = np.asarray(grafo)
+    infinito = np.inf
+    selecionado = np.zeros(V, dtype=bool)
+    origem = np.full(V, -1, dtype=np.int64)
+    # Custo mínimo para incluir cada vértice; os já incluídos ficam em infinito
+    chave = np.full(V, infinito)
+    linha = np.empty(V)
+    melhora = np.empty(V, dtype=bool)
+    melhorias = 0
+
+    if V:
+        chave[0] = 0
+
+    for _ in range(V):
+        u = int(chave.argmin())
+        if chave[u] == infinito:
+            u = int(np.flatnonzero(~selecionado)[0])  # Grafo desconexo
+        selecionado[u] = True
+        chave[u] = infinito
+
+        # Sem conexão (custo <= 0) e vértices já incluídos contam como infinito
+        np.copyto(linha, matriz[u])
+        linha[linha <= 0] = infinito
+        linha[selecionado] = infinito
+        np.less(linha, chave, out=melhora)
+        origem[melhora] = u
+        np.minimum(chave, linha, out=chave)
+        if estatisticas is not None:
+            melhorias += int(np.count_nonzero(melhora))
+
+    if estatisticas is not None:
+        estatisticas.somar(assentados=V, relaxadas=V * V, melhorias=melhorias)
+
+    # Custo de cada ligação lido da matriz, preservando o tipo dos custos
+    custos = np.where(origem >= 0, matriz[np.maximum(origem, 0), np.arange(V)], 0)
+    return origem.tolist(), custos.tolist()
+
+
+def prim_heap(adjacencias, V):
+    # Algoritmo de Prim com fila de prioridade e remoção preguiçosa, em
+    # O(E log V), sobre listas de adjacência (adjacencias[u] = {v: custo}).
+    # Entradas obsoletas na fila são descartadas ao serem retiradas. Se o
+    # grafo for desconexo, cada componente ganha sua própria árvore.
+    # Retorna (origem, custos) no mesmo formato de prim_matriz.
+    infinito = float("inf")
+    selecionado = [False] * V
+    custo_minimo = [infinito] * V
+    origem = [-1] * V
+
+    for raiz in range(V):
+        if selecionado[raiz]:
+            continue
+        custo_minimo[raiz] = 0
+        fila = [(0, raiz)]
+        while fila:
+            custo, u = heapq.heappop(fila)
+            if selecionado[u] or custo > custo_minimo[u]:
+                continue  # Entrada obsoleta
+            selecionado[u] = True
+
+            for v, custo_v in adjacencias[u].items():
+                if not selecionado[v] and custo_v < custo_minimo[v]:
+                    custo_minimo[v] = custo_v
+                    origem[v] = u
+                    heapq.heappush(fila, (custo_v, v))
+
+    return origem, custo_minimo
+
+
+def prim_heap_instrumentado(adjacencias, V, estatisticas):
+    # prim_heap contando o trabalho em estatisticas.
+    infinito = float("inf")
+    selecionado = [False] * V
+    custo_minimo = [infinito] * V
+    origem = [-1] * V
+    assentados = relaxadas = melhorias = operacoes_heap = 0
+
+    for raiz in range(V):
+        if selecionado[raiz]:
+            continue
+        custo_minimo[raiz] = 0
+        fila = [(0, raiz)]
+        operacoes_heap += 1
+        while fila:
+            custo, u = heapq.heappop(fila)
+            operacoes_heap += 1
+            if selecionado[u] or custo > custo_minimo[u]:
+                continue
+            selecionado[u] = True
+            assentados += 1
+
+            for v, custo_v in adjacencias[u].items():
+                relaxadas += 1
+                if not selecionado[v] and custo_v < custo_minimo[v]:
+                    custo_minimo[v] = custo_v
+                    origem[v] = u
+                    heapq.heappush(fila, (custo_v, v))
+                    melhorias += 1
+                    operacoes_heap += 1
+
+    estatisticas.somar(assentados, relaxadas, melhorias, operacoes_heap)
+    return origem, custo_minimo
+
+
+def congelar_esparsa(grafo, V):
+    # Congela o dicionário de dicionários ({u: {v: custo}}) do armazenamento
+    # "esparsa" em linhas comprimidas (CSR): os vizinhos de u ficam em
+    # destinos[deslocamentos[u]:deslocamentos[u + 1]], com os custos nas
+    # mesmas posições de pesos. A memória cresce com as conexões, não com V².
+    inteiros = all(
+        isinstance(custo, int)
+        for vizinhos in grafo.values()
+        for custo in vizinhos.values()
+    )
+    deslocamentos = array("q", [0])
+    destinos = array("q")
+    pesos = array("q" if inteiros else "d")
+    for u in range(V):
+        vizinhos = grafo.get(u)
+        if vizinhos:
+            destinos.extend(vizinhos.keys())
+            pesos.extend(vizinhos.values())
+        deslocamentos.append(len(destinos))
+    return deslocamentos, destinos, pesos
+
+
+def congelar_armazenamento(grafo, V, armazenamento):
+    # Vetores CSR (deslocamentos, destinos, pesos) de qualquer armazenamento.
+    if armazenamento == "csr":
+        return grafo
+    if armazenamento != "esparsa":
+        grafo = dict(enumerate(listar_adjacencias(grafo, V, armazenamento)))
+    return congelar_esparsa(grafo, V)
+
+
+def descongelar_csr(deslocamentos, destinos, pesos):
+    # Dicionário de dicionários do armazenamento "esparsa" a partir dos
+    # vetores CSR, para voltar a aceitar conexões.
+    grafo = defaultdict(dict)
+    for u in range(len(deslocamentos) - 1):
+        inicio, fim = deslocamentos[u], deslocamentos[u + 1]
+        if inicio < fim:
+            grafo[u] = dict(zip(destinos[inicio:fim], pesos[inicio:fim]))
+    return grafo
+
+
+def prim_csr(deslocamentos, destinos, pesos, V):
+    # O mesmo Prim com fila de prioridade de prim_heap, sobre o grafo
+    # congelado por congelar_esparsa. Retorna (origem, custos).
+    infinito = float("inf")
+    selecionado = bytearray(V)
+    custo_minimo = [infinito] * V
+    origem = [-1] * V
+
+    for raiz in range(V):
+        if selecionado[raiz]:
+            continue
+        custo_minimo[raiz] = 0
+        fila = [(0, raiz)]
+        while fila:
+            custo, u = heapq.heappop(fila)
+            if selecionado[u] or custo > custo_minimo[u]:
+                continue  # Entrada obsoleta
+            selecionado[u] = 1
+
+            for posicao in range(deslocamentos[u], deslocamentos[u + 1]):
+                v = destinos[posicao]
+                custo_v = pesos[posicao]
+                if not selecionado[v] and custo_v < custo_minimo[v]:
+                    custo_minimo[v] = custo_v
+                    origem[v] = u
+                    heapq.heappush(fila, (custo_v, v))
+
+    return origem, custo_minimo
+
+
+def prim_csr_instrumentado(deslocamentos, destinos, pesos, V, estatisticas):
+    # prim_csr contando o trabalho em estatisticas.
+    infinito = float("inf")
+    selecionado = bytearray(V)
+    custo_minimo = [infinito] * V
+    origem = [-1] * V
+    assentados = relaxadas = melhorias = operacoes_heap = 0
+
+    for raiz in range(V):
+        if selecionado[raiz]:
+            continue
+        custo_minimo[raiz] = 0
+        fila = [(0, raiz)]
+        operacoes_heap += 1
+        while fila:
+            custo, u = heapq.heappop(fila)
+            operacoes_heap += 1
+            if selecionado[u] or custo > custo_minimo[u]:
+                continue
+            selecionado[u] = 1
+            assentados += 1
+
+            relaxadas += deslocamentos[u + 1] - deslocamentos[u]
+            for posicao in range(deslocamentos[u], deslocamentos[u + 1]):
+                v = destinos[posicao]
+                custo_v = pesos[posicao]
+                if not selecionado[v] and custo_v < custo_minimo[v]:
+                    custo_minimo[v] = custo_v
+                    origem[v] = u
+                    heapq.heappush(fila, (custo_v, v))
+                    melhorias += 1
+                    operacoes_heap += 1
+
+    estatisticas.somar(assentados, relaxadas, melhorias, operacoes_heap)
+    return origem, custo_minimo
+
+
+def ordenar_arestas(arestas):
+    # Arestas (u, v, custo) em ordem crescente de custo, com ordenação estável.
+    if len(arestas) < LIMITE_ARGSORT:
+        return sorted(arestas, key=lambda aresta: aresta[2])
+    custos = np.array([aresta[2] for aresta in arestas])
+    return [arestas[i] for i in np.argsort(custos, kind="stable").tolist()]
+
+
+def kruskal(arestas, V, estatisticas=None):
+    # Algoritmo de Kruskal, em O(E log E), direto sobre a lista de arestas
+    # (u, v, custo): percorre as arestas em ordem de custo e aceita as que
+    # unem dois componentes diferentes, controlados por uma estrutura de
+    # conjuntos disjuntos (union-find) com compressão de caminho e união por
+    # posto. Para assim que a árvore tem V - 1 arestas.
+    # Retorna (origem, custos) no mesmo formato de prim_matriz.
+    # Com estatisticas, as arestas examinadas e aceitas são contadas depois do
+    # laço, pelo que restou do iterador, sem custo por aresta.
+    pai = list(range(V))
+    posto = [0] * V
+
+    def encontrar(x):
+        raiz = x
+        while pai[raiz] != raiz:
+            raiz = pai[raiz]
+        while pai[x] != raiz:  # Compressão de caminho
+            pai[x], x = raiz, pai[x]
+        return raiz
+
+    arvore = [{} for _ in range(V)]
+    restantes = V - 1
+    with fase(estatisticas, "ordenacao"):
+        ordenadas = ordenar_arestas(arestas)
+    with fase(estatisticas, "unioes"):
+        pendentes = iter(ordenadas)
+        for u, v, custo in pendentes:
+            a, b = encontrar(u), encontrar(v)
+            if a == b:
+                continue  # A aresta fecharia um ciclo
+            if posto[a] < posto[b]:  # União por posto
+                a, b = b, a
+            pai[b] = a
+            if posto[a] == posto[b]:
+                posto[a] += 1
+            arvore[u][v] = custo
+            arvore[v][u] = custo
+            restantes -= 1
+            if restantes == 0:
+                break
+
+    if estatisticas is not None:
+        estatisticas.somar(
+            assentados=V,
+            relaxadas=len(ordenadas) - length_hint(pendentes),
+            melhorias=max(V - 1 - restantes, 0),
+        )
+    return orientar_floresta(arvore, V)
+
+
+def orientar_floresta(arvore, V):
+    # Converte a floresta dada por adjacências (arvore[u] = {v: custo}) no
+    # formato (origem, custos) de prim_matriz, orientando cada árvore a partir
+    # do seu vértice de menor índice, como o Prim.
+    origem = [-1] * V
+    custos = [0] * V
+    visitado = [False] * V
+    for raiz in range(V):
+        if visitado[raiz]:
+            continue
+        visitado[raiz] = True
+        pilha = [raiz]
+        while pilha:
+            u = pilha.pop()
+            for v, custo in arvore[u].items():
+                if not visitado[v]:
+                    visitado[v] = True
+                    origem[v] = u
+                    custos[v] = custo
+                    pilha.append(v)
+
+    return origem, custos
+
+
+class AGMDinamica:
+    # Árvore (ou floresta) geradora mínima mantida conexão a conexão, sem
+    # recalcular tudo. Uma conexão nova ou mais barata (u, v) fecha um ciclo
+    # com o caminho de u a v na árvore; se ela custa menos que a aresta mais
+    # cara desse caminho, as duas trocam de lugar (propriedade do ciclo).
+    # Cada atualização custa O(V): uma busca em profundidade na árvore.
+    def __init__(self, origem, custos):
+        self.V = len(origem)
+        self.arvore = [{} for _ in range(self.V)]  # arvore[u] = {v: custo}
+        self.total = 0
+        for v, u in enumerate(origem):
+            if u != -1:
+                self.ligar(u, v, custos[v])
+
+    def ligar(self, u, v, custo):
+        # Acrescenta a aresta (u, v) à árvore.
+        self.arvore[u][v] = custo
+        self.arvore[v][u] = custo
+        self.total += custo
+
+    def desligar(self, u, v):
+        # Retira a aresta (u, v) da árvore.
+        self.total -= self.arvore[u].pop(v)
+        del self.arvore[v][u]
+
+    def caminho(self, u, v):
+        # Arestas (a, b) do caminho de u até v na árvore, ou None se u e v
+        # estão em componentes diferentes.
+        anterior = {u: u}
+        pilha = [u]
+        while pilha:
+            a = pilha.pop()
+            if a == v:
+                break
+            for b in self.arvore[a]:
+                if b not in anterior:
+                    anterior[b] = a
+                    pilha.append(b)
+        else:
+            return None
+
+        arestas = []
+        while v != u:
+            arestas.append((anterior[v], v))
+            v = anterior[v]
+        return arestas
+
+    def atualizar(self, u, v, custo):
+        # Incorpora a conexão (u, v) com o custo dado. Retorna False quando a
+        # árvore não pode ser mantida assim (uma aresta dela ficou mais cara) e
+        # precisa ser recalculada.
+        if u == v:
+            return True
+        atual = self.arvore[u].get(v)
+        if atual is not None:
+            if custo > atual:
+                return False
+            self.desligar(u, v)
+            self.ligar(u, v, custo)
+            return True
+
+        caminho = self.caminho(u, v)
+        if caminho is None:
+            self.ligar(u, v, custo)  # A conexão une dois componentes
+            return True
+
+        a, b = max(caminho, key=lambda aresta: self.arvore[aresta[0]][aresta[1]])
+        if custo < self.arvore[a][b]:
+            self.desligar(a, b)
+            self.ligar(u, v, custo)
+        return True
+
+    def exportar(self):
+        # A árvore atual no formato (origem, custos) de prim_matriz.
+        return orientar_floresta(self.arvore, self.V)
+
+
+def listar_arestas(grafo, armazenamento):
+    # Lista de arestas (u, v, custo), com u < v, de qualquer armazenamento.
+    if armazenamento == "arestas":
+        return [(u, v, custo) for (u, v), custo in grafo.items()]
+    if armazenamento == "densa":
+        u, v = np.nonzero(np.triu(grafo, 1) > 0)
+        return list(zip(u.tolist(), v.tolist(), grafo[u, v].tolist()))
+    if armazenamento == "lista":
+        return [
+            (u, v, custo)
+            for u, vizinhos in enumerate(grafo)
+            for v, custo in vizinhos.items()
+            if u < v
+        ]
+    if armazenamento == "esparsa":
+        return [
+            (u, v, custo)
+            for u, vizinhos in grafo.items()
+            for v, custo in vizinhos.items()
+            if u < v
+        ]
+    if armazenamento == "csr":
+        deslocamentos, destinos, pesos = grafo
+        return [
+            (u, destinos[posicao], pesos[posicao])
+            for u in range(len(deslocamentos) - 1)
+            for posicao in range(deslocamentos[u], deslocamentos[u + 1])
+            if u < destinos[posicao]
+        ]
+    return [
+        (u, v, linha[v])
+        for u, linha in enumerate(grafo)
+        for v in range(u + 1, len(linha))
+        if linha[v] > 0
+    ]
+
+
+def listar_adjacencias(grafo, V, armazenamento):
+    # Listas de adjacência ({vizinho: custo}) de qualquer armazenamento.
+    if armazenamento == "lista":
+        return grafo
+    adjacencias = [{} for _ in range(V)]
+    for u, v, custo in listar_arestas(grafo, armazenamento):
+        adjacencias[u][v] = custo
+        adjacencias[v][u] = custo
+    return adjacencias
+
+
+def escolher_motor(V, E, armazenamento):
+    # Escolhe o algoritmo da AGM para V vértices, E arestas e o armazenamento
+    # dado. A lista de arestas vai direto para o Kruskal, e as listas de
+    # adjacência (ou os armazenamentos esparso e CSR), para o Prim com heap:
+    # convertê-las custaria mais do que a diferença entre os dois. Na matriz,
+    # o Prim em O(V²) só compensa quando o grafo é denso; se não, vale extrair
+    # as arestas e usar o Kruskal. A matriz NumPy ("densa") e as matrizes
+    # grandes usam o Prim vetorizado.
+    if armazenamento == "arestas":
+        return "kruskal"
+    if armazenamento in ("lista", "esparsa", "csr"):
+        return "heap"
+    if armazenamento == "densa":
+        return "numpy"
+    if E * DIVISOR_DENSO < V * V:
+        return "kruskal"
+    return "numpy" if V >= LIMITE_NUMPY else "matriz"
+
+
+def custos_informados(grafo, armazenamento, origem, custos):
+    # Custos das ligações da árvore como estão no armazenamento, com o tipo em
+    # que foram informados (int ou float): os motores sobre vetores CSR ou
+    # NumPy devolvem todos como float quando há algum custo real.
+    if armazenamento in ("densa", "csr") or all(type(custo) is int for custo in custos):
+        return custos  # Não há tipo a recuperar
+    if armazenamento == "arestas":
+        return [
+            custo if u == -1 else grafo[min(u, v), max(u, v)]
+            for v, (u, custo) in enumerate(zip(origem, custos))
+        ]
+    return [
+        custo if u == -1 else grafo[u][v]
+        for v, (u, custo) in enumerate(zip(origem, custos))
+    ]
+
+
+def contar_arestas(grafo, V, armazenamento):
+    # Número de arestas (cada par conta uma vez) de qualquer armazenamento.
+    if armazenamento == "arestas":
+        return len(grafo)
+    if armazenamento == "lista":
+        return sum(map(len, grafo)) // 2
+    if armazenamento == "esparsa":
+        return sum(map(len, grafo.values())) // 2
+    if armazenamento == "csr":
+        return len(grafo[1]) // 2
+    if armazenamento == "densa":
+        return int(np.count_nonzero(grafo)) // 2
+    return (V * V - sum(linha.count(0) for linha in grafo)) // 2
+
+
+def arvore_geradora_minima(grafo, V, armazenamento, motor=None, estatisticas=None):
+    # Calcula a AGM com o motor pedido ("matriz", "numpy", "heap" ou
+    # "kruskal") ou, se motor for None, com o escolhido por escolher_motor.
+    # Com estatisticas (instrumentacao.Estatisticas), os motores contam o
+    # trabalho feito e são medidas as fases "escolha", "preparacao" (conversão
+    # do armazenamento) e "arvore"; sem elas, rodam os laços sem contadores.
+    if motor is None:
+        with fase(estatisticas, "escolha"):
+            motor = escolher_motor(
+                V, contar_arestas(grafo, V, armazenamento), armazenamento
+            )
+
+    if motor == "kruskal":
+        with fase(estatisticas, "preparacao"):
+            arestas = listar_arestas(grafo, armazenamento)
+        return kruskal(arestas, V, estatisticas)  # Mede "ordenacao" e "unioes"
+    if motor == "heap" and armazenamento in ("esparsa", "csr"):
+        with fase(estatisticas, "preparacao"):
+            csr = congelar_armazenamento(grafo, V, armazenamento)
+        with fase(estatisticas, "arvore"):
+            if estatisticas is None:
+                return prim_csr(*csr, V)
+            return prim_csr_instrumentado(*csr, V, estatisticas)
+    if motor == "heap":
+        with fase(estatisticas, "preparacao"):
+            adjacencias = listar_adjacencias(grafo, V, armazenamento)
+        with fase(estatisticas, "arvore"):
+            if estatisticas is None:
+                return prim_heap(adjacencias, V)
+            return prim_heap_instrumentado(adjacencias, V, estatisticas)
+    if motor == "matriz":
+        if armazenamento != "matriz":
+            raise ValueError("O motor 'matriz' exige o armazenamento 'matriz'")
+        with fase(estatisticas, "arvore"):
+            if estatisticas is None:
+                return prim_matriz(grafo, V)
+            return prim_matriz_instrumentado(grafo, V, estatisticas)
+    if motor == "numpy":
+        if armazenamento not in ("matriz", "densa"):
+            raise ValueError("O motor 'numpy' exige uma matriz de custos")
+        with fase(estatisticas, "arvore"):
+            return prim_numpy(grafo, V, estatisticas)
+    raise ValueError(f"Motor desconhecido: {motor}")
+
+
+class ResultadoAGM:
+    # Resultado compacto de uma AGM: origem[v] é o vértice que liga v à árvore
+    # (-1 nas raízes), custos[v] o custo dessa ligação (0 nas raízes) e total
+    # a soma dos custos. Os vetores ficam em array.array, 8 bytes por vértice.
+    # Com custos inteiros e reais misturados, custos fica em "d" e inteiros
+    # marca as ligações de custo int, que arestas devolve como int.
+    def __init__(self, origem, custos):
+        self.origem = array("q", origem)
+        inteiros = bytearray(isinstance(custo, int) for custo in custos)
+        self.custos = array("q" if all(inteiros) else "d", custos)
+        self.inteiros = None
+        if not all(inteiros) and any(
+            inteiros[v] for v, u in enumerate(origem) if u != -1
+        ):
+            self.inteiros = inteiros
+        self.total = sum(custos)
+
+    def arestas(self):
+        # (origem, destino, custo) de cada aresta da árvore, por destino, com
+        # o custo no tipo em que foi informado.
+        custos = self.custos
+        inteiros = self.inteiros
+        if inteiros is None:
+            for v, u in enumerate(self.origem):
+                if u != -1:
+                    yield u, v, custos[v]
+            return
+        for v, u in enumerate(self.origem):
+            if u != -1:
+                yield u, v, int(custos[v]) if inteiros[v] else custos[v]
+
+    @classmethod
+    def ler_binario(cls, arquivo):
+        # Lê um resultado gravado por escrever_agm no formato "binario".
+        assinatura, V, tipo = CABECALHO_BINARIO.unpack(
+            arquivo.read(CABECALHO_BINARIO.size)
+        )
+        if assinatura != ASSINATURA_BINARIO:
+            raise ValueError("Arquivo não contém uma AGM em formato binário")
+        resultado = cls.__new__(cls)
+        resultado.origem = array("q")
+        resultado.origem.fromfile(arquivo, V)
+        resultado.custos = array(tipo.decode())
+        resultado.custos.fromfile(arquivo, V)
+        resultado.inteiros = None  # O formato binário guarda só os valores
+        resultado.total = sum(resultado.custos)
+        return resultado
+
+
+def escrever_agm(
+    resultado, nomes, arquivo=None, formato="texto", cabecalho="", linha="", rodape=""
+):
+    # Escreve a AGM em arquivo (padrão: a saída padrão) em blocos de
+    # TAMANHO_BLOCO_ESCRITA linhas, em vez de um print por aresta.
+    # "texto": cabecalho, uma linha por aresta e rodape, modelos de str.format
+    #          com os campos {origem}, {destino}, {custo} e {total};
+    # "csv": origem,destino,custo com os nomes dos vértices;
+    # "binario": cabeçalho e os vetores origem e custos (arquivo binário).
+    if arquivo is None:
+        arquivo = sys.stdout.buffer if formato == "binario" else sys.stdout
+
+    if formato == "binario":
+        arquivo.write(
+            CABECALHO_BINARIO.pack(
+                ASSINATURA_BINARIO,
+                len(resultado.origem),
+                resultado.custos.typecode.encode(),
+            )
+        )
+        resultado.origem.tofile(arquivo)
+        resultado.custos.tofile(arquivo)
+        return
+
+    if formato == "csv":
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer, lineterminator="\n")
+        escritor.writerow(["origem", "destino", "custo"])
+        linhas = ((nomes[u], nomes[v], custo) for u, v, custo in resultado.arestas())
+        while True:
+            bloco = list(islice(linhas, TAMANHO_BLOCO_ESCRITA))
+            escritor.writerows(bloco)
+            arquivo.write(buffer.getvalue())
+            if len(bloco) < TAMANHO_BLOCO_ESCRITA:
+                return
+            buffer.seek(0)
+            buffer.truncate()
+
+    if formato != "texto":
+        raise ValueError(f"Formato desconhecido: {formato}")
+
+    arquivo.write(cabecalho.format(total=resultado.total))
+    formatar = linha.format
+    bloco = []
+    for u, v, custo in resultado.arestas():
+        bloco.append(formatar(origem=nomes[u], destino=nomes[v], custo=custo))
+        if len(bloco) == TAMANHO_BLOCO_ESCRITA:
+            arquivo.write("".join(bloco))
+            bloco.clear()
+    arquivo.write("".join(bloco))
+    arquivo.write(rodape.format(total=resultado.total))
@@ -0,0 +1,88 @@
+# Compara o número de aeroportos assentados (e o tempo) entre Dijkstra e A*
+# numa malha aérea sintética espalhada pelo território brasileiro.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.a_estrela --aeroportos 500 2000 10000
+import argparse
+import math
+import random
+import time
+
+from ex3 import GrafoPoderado, distancia_ortodromica
+
+
+def gerar_malha_aerea(quantidade, vizinhos=6, semente=42):
+    # Aeroportos em posições aleatórias; cada um liga-se aos mais próximos.
+    # O peso da linha (em centenas de km, como em ex3.py) é a distância
+    # ortodrômica acrescida de um desvio aleatório de até 30%.
+    aleatorio = random.Random(semente)
+    mapa = GrafoPoderado()
+    posicoes = []
+    for i in range(quantidade):
+        lat = aleatorio.uniform(-33.0, -3.0)
+        lon = aleatorio.uniform(-70.0, -35.0)
+        posicoes.append((lat, lon))
+        mapa.adicionar_aeroporto(i, lat, lon)
+
+    # Agrupa os aeroportos em células para achar vizinhos sem O(n²) comparações
+    tamanho_celula = 30.0 / math.sqrt(quantidade / vizinhos)
+    celulas = {}
+    for i, (lat, lon) in enumerate(posicoes):
+        chave = (int(lat // tamanho_celula), int(lon // tamanho_celula))
+        celulas.setdefault(chave, []).append(i)
+
+    for i, (lat, lon) in enumerate(posicoes):
+        cl, cc = int(lat // tamanho_celula), int(lon // tamanho_celula)
+        candidatos = [
+            j
+            for dl in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+            for j in celulas.get((cl + dl, cc + dc), [])
+            if j != i
+        ]
+        candidatos.sort(key=lambda j: distancia_ortodromica(lat, lon, *posicoes[j]))
+        for j in candidatos[:vizinhos]:
+            km = distancia_ortodromica(lat, lon, *posicoes[j])
+            mapa.adicionar_linha(i, j, km * aleatorio.uniform(1.0, 1.3) / 100)
+    return mapa
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--aeroportos", type=int, nargs="+", default=[500, 2000, 10000])
+    parser.add_argument("--consultas", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'aeroportos':>10} {'assent. Dijkstra':>17} {'assent. A*':>11} "
+        f"{'tempo Dijkstra (s)':>19} {'tempo A* (s)':>13}"
+    )
+    for quantidade in args.aeroportos:
+        mapa = gerar_malha_aerea(quantidade)
+        aleatorio = random.Random(quantidade)
+        assentados_d = assentados_a = 0
+        tempo_d = tempo_a = 0.0
+
+        for _ in range(args.consultas):
+            origem, destino = aleatorio.sample(range(quantidade), 2)
+
+            inicio = time.perf_counter()
+            _, distancia_d = mapa.dijkstra(origem, destino)
+            tempo_d += time.perf_counter() - inicio
+            assentados_d += mapa.aeroportos_assentados
+
+            inicio = time.perf_counter()
+            _, distancia_a = mapa.a_estrela(origem, destino)
+            tempo_a += time.perf_counter() - inicio
+            assentados_a += mapa.aeroportos_assentados
+
+            assert math.isclose(distancia_d, distancia_a), (distancia_d, distancia_a)
+
+        print(
+            f"{quantidade:10d} {assentados_d / args.consultas:17.1f} "
+            f"{assentados_a / args.consultas:11.1f} {tempo_d:19.4f} {tempo_a:13.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
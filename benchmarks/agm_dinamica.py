@@ -0,0 +1,122 @@
+# Manutenção da AGM a cada conexão nova ou re-precificada (AGMDinamica, via
+# GrafoAlgoritmoPrim.adicionar_conexao) comparada a recalcular a árvore do
+# zero. Primeiro confere, com alterações aleatórias (conexões novas, mais
+# baratas e mais caras), que a árvore mantida é sempre uma AGM do grafo
+# atual; depois mede os tempos.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.agm_dinamica --torres 1000 10000 100000
+import argparse
+import random
+import time
+
+from agm import AGMDinamica, arvore_geradora_minima
+from benchmarks.prim import gerar_rede
+
+
+def custo_conexao(rede, u, v):
+    # Custo atual da conexão (u, v) em qualquer armazenamento.
+    if rede.armazenamento == "arestas":
+        return rede.grafo[min(u, v), max(u, v)]
+    return rede.grafo[u][v]
+
+
+def vizinhos_de(rede, u):
+    # Torres ligadas a u em qualquer armazenamento.
+    if rede.armazenamento in ("matriz", "densa"):
+        return [x for x, custo in enumerate(rede.grafo[u]) if custo]
+    if rede.armazenamento == "arestas":
+        return [b if a == u else a for a, b in rede.grafo if u in (a, b)]
+    return list(rede.grafo[u])
+
+
+def alteracao_aleatoria(aleatorio, rede):
+    # Sorteia um par de torres e um novo custo: metade das vezes uma conexão
+    # nova ou qualquer, metade re-precificando uma conexão existente.
+    u, v = aleatorio.sample(range(rede.V), 2)
+    vizinhos = vizinhos_de(rede, u)
+    if vizinhos and aleatorio.random() < 0.5:
+        v = aleatorio.choice(vizinhos)
+        return u, v, max(1, custo_conexao(rede, u, v) + aleatorio.randint(-50, 50))
+    return u, v, aleatorio.randint(1, 100)
+
+
+def conferir_arvore(rede):
+    # A árvore mantida deve usar só conexões do grafo, com o custo atual, e
+    # ter o mesmo custo total e número de componentes do recálculo completo.
+    origem, custos = rede.agm.exportar()
+    for v, u in enumerate(origem):
+        if u != -1:
+            custo = custo_conexao(rede, u, v)
+            assert custo == custo_conexao(rede, v, u) == custos[v], (u, v)
+    origem_ref, custos_ref = arvore_geradora_minima(
+        rede.grafo, rede.V, rede.armazenamento, "kruskal"
+    )
+    assert sum(custos) == sum(custos_ref) == rede.agm.total
+    assert origem.count(-1) == origem_ref.count(-1)
+
+
+def conferir(rodadas=300, semente=0):
+    aleatorio = random.Random(semente)
+    alteracoes = 0
+    for rodada in range(rodadas):
+        quantidade = aleatorio.randint(2, 40)
+        armazenamento = aleatorio.choice(
+            ["esparsa", "lista", "matriz", "densa", "arestas"]
+        )
+        rede, _ = gerar_rede(
+            quantidade, armazenamento, extras=aleatorio.randint(0, 3), semente=rodada
+        )
+        rede.agm = AGMDinamica(
+            *arvore_geradora_minima(rede.grafo, rede.V, armazenamento)
+        )
+
+        for _ in range(20):
+            u, v, custo = alteracao_aleatoria(aleatorio, rede)
+            rede.adicionar_conexao(rede.torres[u], rede.torres[v], custo)
+            if rede.agm is None:  # Aresta da árvore encareceu: recalcula
+                rede.agm = AGMDinamica(
+                    *arvore_geradora_minima(rede.grafo, rede.V, armazenamento)
+                )
+            conferir_arvore(rede)
+            alteracoes += 1
+    print(f"Conferência OK: {alteracoes} alterações idênticas ao recálculo completo")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--torres", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--alteracoes", type=int, default=50)
+    args = parser.parse_args()
+
+    conferir()
+
+    print(f"{'torres':>8} {'recálculo (s)':>14} {'atualização (ms)':>17} {'ganho':>8}")
+    aleatorio = random.Random(1)
+    for quantidade in args.torres:
+        rede, _ = gerar_rede(quantidade, "esparsa")
+        inicio = time.perf_counter()
+        rede.agm = AGMDinamica(*arvore_geradora_minima(rede.grafo, rede.V, "esparsa"))
+        tempo_completo = time.perf_counter() - inicio
+
+        # Só conexões novas ou mais baratas, que a árvore mantida absorve
+        tempo_atualizacoes = 0.0
+        for _ in range(args.alteracoes):
+            u, v = aleatorio.sample(range(quantidade), 2)
+            custo = aleatorio.randint(1, 100 * quantidade)
+            if v in rede.grafo[u]:
+                custo = min(custo, rede.grafo[u][v])
+            inicio = time.perf_counter()
+            rede.adicionar_conexao(rede.torres[u], rede.torres[v], custo)
+            tempo_atualizacoes += time.perf_counter() - inicio
+            assert rede.agm is not None
+
+        media = tempo_atualizacoes / args.alteracoes
+        print(
+            f"{quantidade:8d} {tempo_completo:14.3f} {1000 * media:17.2f} "
+            f"{tempo_completo / media:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
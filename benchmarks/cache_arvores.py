@@ -0,0 +1,63 @@
+# Mede o efeito do cache LRU de árvores de caminhos mínimos de GrafoPoderado
+# (ex1.py) num padrão de consultas típico: poucas origens (depósitos) e
+# destinos aleatórios. Também confere as respostas com o Dijkstra original,
+# inclusive depois de alterações no grafo.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.cache_arvores --lado 60 --capacidades 0 2 8 32
+import argparse
+import random
+import time
+
+from benchmarks.dijkstra import gerar_grade
+from benchmarks.referencias import dijkstra_referencia
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lado", type=int, default=60)
+    parser.add_argument("--depositos", type=int, default=8)
+    parser.add_argument("--consultas", type=int, default=500)
+    parser.add_argument("--capacidades", type=int, nargs="+", default=[0, 2, 8, 32])
+    args = parser.parse_args()
+
+    print(
+        f"{'capacidade':>10} {'tempo (s)':>10} {'acertos':>8} {'falhas':>7} "
+        f"{'descartes':>9}"
+    )
+    for capacidade in args.capacidades:
+        mapa = gerar_grade(args.lado, capacidade_cache=capacidade)
+        cidades = list(mapa.vertices)
+        aleatorio = random.Random(7)
+        depositos = aleatorio.sample(cidades, args.depositos)
+
+        inicio = time.perf_counter()
+        for _ in range(args.consultas):
+            mapa.dijkstra(aleatorio.choice(depositos), aleatorio.choice(cidades))
+        tempo = time.perf_counter() - inicio
+
+        estatisticas = mapa.estatisticas_cache()
+        print(
+            f"{capacidade:10d} {tempo:10.4f} {estatisticas['acertos']:8d} "
+            f"{estatisticas['falhas']:7d} {estatisticas['descartes']:9d}"
+        )
+
+    # Conferência: respostas do cache devem bater com o Dijkstra original,
+    # também depois de novas estradas invalidarem as árvores guardadas.
+    mapa = gerar_grade(15, capacidade_cache=4)
+    cidades = list(mapa.vertices)
+    aleatorio = random.Random(11)
+    for rodada in range(200):
+        if rodada % 20 == 0:
+            cidade1, cidade2 = aleatorio.sample(cidades, 2)
+            mapa.adicionar_estrada(cidade1, cidade2, aleatorio.randint(1, 10))
+        origem = aleatorio.choice(cidades[:5])
+        destino = aleatorio.choice(cidades)
+        _, distancia = mapa.dijkstra(origem, destino)
+        _, esperado = dijkstra_referencia(mapa.vertices, origem, destino)
+        assert distancia == esperado, (origem, destino, distancia, esperado)
+    print(f"Conferência OK ({mapa.estatisticas_cache()})")
+
+
+if __name__ == "__main__":
+    main()
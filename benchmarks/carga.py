@@ -0,0 +1,85 @@
+# Vazão da carga em massa de arestas (arestas por segundo) a partir de um
+# arquivo CSV, no GrafoAlgoritmoPrim (ex11.py) e no GrafoPoderado (ex1.py),
+# comparada à resolução de nomes com list.index usada antes.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.carga --arestas 10000 100000 1000000
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+
+from carga import ler_arestas
+from ex1 import GrafoPoderado
+from ex11 import GrafoAlgoritmoPrim
+
+
+def gravar_csv(caminho, torres, quantidade, semente=42):
+    aleatorio = random.Random(semente)
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(["torre1", "torre2", "custo"])
+        for _ in range(quantidade):
+            u, v = aleatorio.sample(range(len(torres)), 2)
+            escritor.writerow([torres[u], torres[v], aleatorio.randint(1, 100)])
+
+
+def carga_com_index(caminho, torres):
+    # Como era antes: cada aresta procura os dois nomes na lista (O(V)).
+    rede = GrafoAlgoritmoPrim(torres, armazenamento="lista")
+    inicio = time.perf_counter()
+    quantidade = 0
+    for torre1, torre2, custo in ler_arestas(caminho):
+        u = torres.index(torre1)
+        v = torres.index(torre2)
+        rede.grafo[u][v] = custo
+        rede.grafo[v][u] = custo
+        quantidade += 1
+    return quantidade / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--arestas", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    parser.add_argument(
+        "--limite-index",
+        type=int,
+        default=100000,
+        help="não mede a versão com list.index acima deste número de arestas",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'arestas':>9} {'torres':>8} {'list.index (a/s)':>17} "
+        f"{'Prim dict (a/s)':>16} {'Poderado (a/s)':>15}"
+    )
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "conexoes.csv")
+        for quantidade in args.arestas:
+            torres = [f"Torre {i}" for i in range(max(2, quantidade // 4))]
+            gravar_csv(caminho, torres, quantidade)
+
+            coluna_index = f"{'-':>17}"
+            if quantidade <= args.limite_index:
+                coluna_index = f"{carga_com_index(caminho, torres):17.0f}"
+
+            rede = GrafoAlgoritmoPrim(torres, armazenamento="lista")
+            vazao_prim = rede.carregar_conexoes(caminho)
+            assert vazao_prim["arestas"] == quantidade
+
+            mapa = GrafoPoderado()
+            vazao_mapa = mapa.carregar_estradas(caminho)
+
+            print(
+                f"{quantidade:9d} {len(torres):8d} {coluna_index} "
+                f"{vazao_prim['arestas_por_segundo']:16.0f} "
+                f"{vazao_mapa['arestas_por_segundo']:15.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
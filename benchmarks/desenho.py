@@ -0,0 +1,86 @@
+# Tempo para desenhar e salvar grafos grandes: nx.draw com
+# nx.draw_networkx_edge_labels (um artista por vértice, aresta e rótulo)
+# contra desenho.desenhar_grafo (uma LineCollection para as arestas, um
+# scatter para os vértices e uma coleção extra para a rota destacada).
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.desenho --vertices 500 2000 10000
+import argparse
+import os
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import networkx as nx
+
+from desenho import desenhar_grafo
+
+
+def gerar_rede(quantidade, semente=42):
+    # Grafo geométrico aleatório (grau médio em torno de 10), com pesos; as
+    # posições do próprio gerador dispensam o cálculo de layout.
+    raio = (10 / (3.14159 * quantidade)) ** 0.5
+    G = nx.random_geometric_graph(quantidade, raio, seed=semente)
+    for u, v in G.edges:
+        G.edges[u, v]["weight"] = (u * 7 + v * 13) % 100 + 1
+    return G, nx.get_node_attributes(G, "pos")
+
+
+def salvar(caminho, desenhar):
+    inicio = time.perf_counter()
+    plt.figure(figsize=(10, 8))
+    desenhar()
+    plt.savefig(caminho, bbox_inches="tight")
+    plt.close()
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, nargs="+", default=[500, 2000, 10000])
+    parser.add_argument(
+        "--limite-nx",
+        type=int,
+        default=20000,
+        help="não usa nx.draw acima deste número de arestas",
+    )
+    args = parser.parse_args()
+
+    print(f"{'vértices':>9} {'arestas':>8} {'nx.draw (s)':>12} {'coleções (s)':>13}")
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "grafo.png")
+        for quantidade in args.vertices:
+            G, pos = gerar_rede(quantidade)
+            rota = nx.shortest_path(G, 0, max(nx.node_connected_component(G, 0)))
+
+            def com_nx():
+                nx.draw(G, pos, with_labels=True, node_size=100, font_size=6)
+                labels = nx.get_edge_attributes(G, "weight")
+                nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=6)
+
+            def com_colecoes():
+                desenhar_grafo(
+                    G,
+                    pos,
+                    destaque=zip(rota, rota[1:]),
+                    tamanho_vertice=100,
+                    tamanho_fonte=6,
+                    tamanho_fonte_arestas=6,
+                )
+
+            coluna_nx = f"{'-':>12}"
+            if G.number_of_edges() <= args.limite_nx:
+                coluna_nx = f"{salvar(caminho, com_nx):12.2f}"
+            tempo_colecoes = salvar(caminho, com_colecoes)
+            print(
+                f"{quantidade:9d} {G.number_of_edges():8d} {coluna_nx} "
+                f"{tempo_colecoes:13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Compara o Dijkstra original (O(V²)) com o Dijkstra com fila de prioridade
+# e parada antecipada de GrafoPoderado.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.dijkstra --lados 10 30 60 100
+import argparse
+import random
+import time
+
+from benchmarks.referencias import dijkstra_referencia
+from ex1 import GrafoPoderado
+
+
+def gerar_grade(lado, semente=42, capacidade_cache=0):
+    # Malha rodoviária lado x lado com distâncias aleatórias entre 1 e 10.
+    # Por padrão sem cache de árvores, para medir cada busca a frio.
+    aleatorio = random.Random(semente)
+    mapa = GrafoPoderado(capacidade_cache=capacidade_cache)
+    for linha in range(lado):
+        for coluna in range(lado):
+            mapa.adicionar_cidade((linha, coluna))
+    for linha in range(lado):
+        for coluna in range(lado):
+            if coluna + 1 < lado:
+                mapa.adicionar_estrada(
+                    (linha, coluna), (linha, coluna + 1), aleatorio.randint(1, 10)
+                )
+            if linha + 1 < lado:
+                mapa.adicionar_estrada(
+                    (linha, coluna), (linha + 1, coluna), aleatorio.randint(1, 10)
+                )
+    return mapa
+
+
+def cronometrar(funcao, *argumentos):
+    inicio = time.perf_counter()
+    resultado = funcao(*argumentos)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lados", type=int, nargs="+", default=[10, 30, 60, 100])
+    parser.add_argument(
+        "--limite-referencia",
+        type=int,
+        default=10_000,
+        help="não executa a versão O(V²) acima deste número de cidades",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'cidades':>8} {'consulta':>8} {'original (s)':>13} {'heap (s)':>10} {'ganho':>8}"
+    )
+    for lado in args.lados:
+        mapa = gerar_grade(lado)
+        origem = (0, 0)
+        consultas = {"perto": (1, 1), "longe": (lado - 1, lado - 1)}
+
+        for nome, destino in consultas.items():
+            (rota, distancia), tempo_heap = cronometrar(mapa.dijkstra, origem, destino)
+
+            if lado * lado <= args.limite_referencia:
+                (_, distancia_ref), tempo_ref = cronometrar(
+                    dijkstra_referencia, mapa.vertices, origem, destino
+                )
+                assert distancia == distancia_ref, (distancia, distancia_ref)
+                coluna_ref = f"{tempo_ref:13.4f}"
+                ganho = f"{tempo_ref / tempo_heap:7.1f}x"
+            else:
+                coluna_ref = f"{'-':>13}"
+                ganho = f"{'-':>8}"
+
+            print(f"{lado * lado:8d} {nome:>8} {coluna_ref} {tempo_heap:10.4f} {ganho}")
+
+
+if __name__ == "__main__":
+    main()
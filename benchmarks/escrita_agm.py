@@ -0,0 +1,104 @@
+# Tempo para escrever uma AGM grande: um print por aresta (como o prim fazia)
+# contra escrever_agm em blocos, nos formatos texto, CSV e binário. O arquivo
+# de texto é aberto com buffer de linha, como a saída padrão num terminal.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.escrita_agm --torres 10000 100000 1000000
+import argparse
+import contextlib
+import os
+import random
+import tempfile
+import time
+
+from agm import ResultadoAGM, escrever_agm
+
+LINHA = "\t{origem} → {destino} (Custo: R$ {custo} mihões)\n"
+
+
+def gerar_arvore(quantidade, semente=42):
+    # Árvore aleatória: cada torre se liga a uma torre anterior.
+    aleatorio = random.Random(semente)
+    origem = [-1] + [aleatorio.randrange(v) for v in range(1, quantidade)]
+    custos = [0] + [aleatorio.randint(1, 100) for _ in range(1, quantidade)]
+    return ResultadoAGM(origem, custos)
+
+
+def escrever_com_print(resultado, torres):
+    # Como o prim escrevia antes: um print com f-string por aresta.
+    print("Plano de Expansão da Infraestrutura de Telefonia (Custo Mínimo):")
+    custo_total = 0
+    for i in range(1, len(torres)):
+        if resultado.origem[i] == -1:
+            continue
+        torre_origem = torres[resultado.origem[i]]
+        torre_destino = torres[i]
+        custo = resultado.custos[i]
+        print(f"\t{torre_origem} → {torre_destino} (Custo: R$ {custo} mihões)")
+        custo_total += custo
+    print(f"\nCusto total do projeto: R$ {custo_total} milhões")
+
+
+def cronometrar_escrita(caminho, modo, funcao, *argumentos):
+    inicio = time.perf_counter()
+    with open(caminho, modo, buffering=-1 if "b" in modo else 1) as arquivo:
+        funcao(arquivo, *argumentos)
+    return time.perf_counter() - inicio, os.path.getsize(caminho)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--torres", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'torres':>8} {'print (s)':>10} {'texto (s)':>10} {'csv (s)':>8} "
+        f"{'binário (s)':>12} {'texto (MB)':>11} {'binário (MB)':>13}"
+    )
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "agm")
+        for quantidade in args.torres:
+            torres = [f"Torre {i}" for i in range(quantidade)]
+            resultado = gerar_arvore(quantidade)
+
+            def com_print(arquivo):
+                with contextlib.redirect_stdout(arquivo):
+                    escrever_com_print(resultado, torres)
+
+            def em_formato(arquivo, formato):
+                escrever_agm(
+                    resultado,
+                    torres,
+                    arquivo,
+                    formato,
+                    cabecalho="Plano de Expansão da Infraestrutura de Telefonia "
+                    "(Custo Mínimo):\n",
+                    linha=LINHA,
+                    rodape="\nCusto total do projeto: R$ {total} milhões\n",
+                )
+
+            tempo_print, tamanho_print = cronometrar_escrita(caminho, "w", com_print)
+            with open(caminho, encoding="utf-8") as arquivo:
+                esperado = arquivo.read()
+            tempo_texto, _ = cronometrar_escrita(caminho, "w", em_formato, "texto")
+            with open(caminho, encoding="utf-8") as arquivo:
+                assert arquivo.read() == esperado
+            tempo_csv, _ = cronometrar_escrita(caminho, "w", em_formato, "csv")
+            tempo_binario, tamanho_binario = cronometrar_escrita(
+                caminho, "wb", em_formato, "binario"
+            )
+            with open(caminho, "rb") as arquivo:
+                lido = ResultadoAGM.ler_binario(arquivo)
+            assert lido.origem == resultado.origem and lido.total == resultado.total
+
+            print(
+                f"{quantidade:8d} {tempo_print:10.3f} {tempo_texto:10.3f} "
+                f"{tempo_csv:8.3f} {tempo_binario:12.3f} "
+                f"{tamanho_print / 1e6:11.1f} {tamanho_binario / 1e6:13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Compara o Floyd-Warshall original (três laços em Python) com a versão
+# vetorizada em NumPy de ex8.floyd_warshall, para vários tamanhos de matriz.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.floyd_warshall --tamanhos 50 100 200 500 1000 2000
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.referencias import floyd_warshall_referencia
+from ex8 import INF, floyd_warshall
+
+
+def gerar_matriz(n, densidade=0.1, semente=42):
+    # Matriz de tempos com ligações aleatórias (INF onde não há ligação direta).
+    aleatorio = np.random.default_rng(semente)
+    matriz = aleatorio.integers(1, 100, size=(n, n)).astype(np.float64)
+    matriz[aleatorio.random((n, n)) > densidade] = INF
+    np.fill_diagonal(matriz, 0)
+    return matriz
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--tamanhos", type=int, nargs="+", default=[50, 100, 200, 500, 1000]
+    )
+    parser.add_argument(
+        "--limite-referencia",
+        type=int,
+        default=200,
+        help="não executa a versão em Python puro acima deste tamanho",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'bairros':>8} {'original (s)':>13} {'listas (s)':>11} "
+        f"{'ndarray (s)':>12} {'ganho':>8}"
+    )
+    for n in args.tamanhos:
+        matriz = gerar_matriz(n)
+        listas = matriz.tolist()
+
+        inicio = time.perf_counter()
+        resultado = floyd_warshall(matriz)
+        tempo_ndarray = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        resultado_listas = floyd_warshall(listas)
+        tempo_listas = time.perf_counter() - inicio
+        assert np.array_equal(np.array(resultado_listas), resultado)
+
+        if n <= args.limite_referencia:
+            inicio = time.perf_counter()
+            esperado = floyd_warshall_referencia(listas)
+            tempo_ref = time.perf_counter() - inicio
+            assert np.array_equal(np.array(esperado), resultado)
+            coluna_ref = f"{tempo_ref:13.4f}"
+            ganho = f"{tempo_ref / tempo_ndarray:7.0f}x"
+        else:
+            coluna_ref = f"{'-':>13}"
+            ganho = f"{'-':>8}"
+
+        print(f"{n:8d} {coluna_ref} {tempo_listas:11.4f} {tempo_ndarray:12.4f} {ganho}")
+
+
+if __name__ == "__main__":
+    main()
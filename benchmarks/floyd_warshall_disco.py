@@ -0,0 +1,59 @@
+# Floyd-Warshall em blocos sobre np.memmap (ex8.floyd_warshall_em_disco):
+# tempo, tamanho do arquivo e pico de memória alocada para diferentes
+# tamanhos de bloco, conferindo o resultado com a versão em memória.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.floyd_warshall_disco --tamanhos 500 1000 --blocos 128 256
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.floyd_warshall import gerar_matriz
+from ex8 import abrir_distancias, floyd_warshall, floyd_warshall_em_disco
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[500, 1000])
+    parser.add_argument("--blocos", type=int, nargs="+", default=[128, 256])
+    parser.add_argument("--tipo", choices=["float32", "float64"], default="float32")
+    args = parser.parse_args()
+    dtype = np.dtype(args.tipo)
+
+    print(
+        f"{'bairros':>8} {'bloco':>6} {'em memória (s)':>15} {'em disco (s)':>13} "
+        f"{'arquivo (MB)':>13} {'pico alocado (MB)':>18}"
+    )
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, "distancias.npy")
+        for n in args.tamanhos:
+            matriz = gerar_matriz(n)
+            inicio = time.perf_counter()
+            esperado = floyd_warshall(matriz)
+            tempo_memoria = time.perf_counter() - inicio
+
+            for bloco in args.blocos:
+                tracemalloc.start()
+                inicio = time.perf_counter()
+                floyd_warshall_em_disco(matriz, arquivo, bloco, dtype=dtype)
+                tempo_disco = time.perf_counter() - inicio
+                _, pico = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                dist = abrir_distancias(arquivo)
+                assert np.array_equal(np.asarray(dist, dtype=np.float64), esperado)
+                tamanho = os.path.getsize(arquivo) / 2**20
+                del dist
+
+                print(
+                    f"{n:8d} {bloco:6d} {tempo_memoria:15.3f} {tempo_disco:13.3f} "
+                    f"{tamanho:13.1f} {pico / 2**20:18.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
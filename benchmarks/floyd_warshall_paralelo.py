@@ -0,0 +1,50 @@
+# Escalabilidade do Floyd-Warshall em blocos paralelo (ex8.floyd_warshall com
+# processos > 1) para 1, 2, 4, 8 e 16 processos, comparado à versão
+# vetorizada em um único processo.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.floyd_warshall_paralelo --tamanho 2000 --bloco 256
+import argparse
+import os
+import time
+
+import numpy as np
+
+from benchmarks.floyd_warshall import gerar_matriz
+from ex8 import floyd_warshall, floyd_warshall_blocado
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanho", type=int, default=2000)
+    parser.add_argument("--bloco", type=int, default=256)
+    parser.add_argument("--processos", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    matriz = gerar_matriz(args.tamanho)
+    inicio = time.perf_counter()
+    esperado = floyd_warshall(matriz)
+    tempo_base = time.perf_counter() - inicio
+    print(
+        f"{args.tamanho} bairros, blocos de {args.bloco}, "
+        f"{os.cpu_count()} CPUs disponíveis"
+    )
+    print(f"{'processos':>9} {'tempo (s)':>10} {'aceleração':>11}")
+    print(f"{'serial':>9} {tempo_base:10.3f} {1.0:10.2f}x")
+
+    for processos in args.processos:
+        inicio = time.perf_counter()
+        if processos == 1:
+            # Mesmo algoritmo em blocos, sem paralelismo, como referência
+            resultado = floyd_warshall_blocado(matriz.copy(), args.bloco)
+        else:
+            resultado = floyd_warshall(
+                matriz, processos=processos, tamanho_bloco=args.bloco
+            )
+        tempo = time.perf_counter() - inicio
+        assert np.array_equal(resultado, esperado)
+        print(f"{processos:9d} {tempo:10.3f} {tempo_base / tempo:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# Geradores de grafos sintéticos não direcionados, com semente, para a suíte
+# de benchmarks. Cada gerador devolve (V, arestas), com vértices numerados de
+# 0 a V - 1 e arestas (u, v, peso) com pesos inteiros entre 1 e 100.
+import math
+import random
+
+
+def grade(quantidade, semente=42):
+    # Malha rodoviária lado x lado (lado = raiz inteira de quantidade).
+    aleatorio = random.Random(semente)
+    lado = max(1, math.isqrt(quantidade))
+    arestas = []
+    for linha in range(lado):
+        for coluna in range(lado):
+            u = linha * lado + coluna
+            if coluna + 1 < lado:
+                arestas.append((u, u + 1, aleatorio.randint(1, 100)))
+            if linha + 1 < lado:
+                arestas.append((u, u + lado, aleatorio.randint(1, 100)))
+    return lado * lado, arestas
+
+
+def geometrico(quantidade, grau=6, semente=42):
+    # Grafo geométrico aleatório: pontos no quadrado unitário, ligados quando
+    # estão a menos de um raio que dá o grau médio pedido. Os pontos são
+    # distribuídos numa grade de células do tamanho do raio, para que cada um
+    # só seja comparado com os das células vizinhas. O peso cresce com a
+    # distância.
+    aleatorio = random.Random(semente)
+    raio = math.sqrt(grau / (math.pi * max(1, quantidade)))
+    pontos = [(aleatorio.random(), aleatorio.random()) for _ in range(quantidade)]
+    celulas = {}
+    for v, (x, y) in enumerate(pontos):
+        celulas.setdefault((int(x / raio), int(y / raio)), []).append(v)
+
+    arestas = []
+    for (cx, cy), membros in celulas.items():
+        vizinhos = [
+            w
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            for w in celulas.get((cx + dx, cy + dy), ())
+        ]
+        for u in membros:
+            xu, yu = pontos[u]
+            for w in vizinhos:
+                if w > u:
+                    distancia = math.hypot(xu - pontos[w][0], yu - pontos[w][1])
+                    if distancia < raio:
+                        arestas.append((u, w, 1 + int(99 * distancia / raio)))
+    return quantidade, arestas
+
+
+def livre_de_escala(quantidade, ligacoes=3, semente=42):
+    # Modelo de Barabási–Albert: cada vértice novo se liga a ligacoes vértices
+    # já existentes, escolhidos com probabilidade proporcional ao grau.
+    aleatorio = random.Random(semente)
+    inicial = min(quantidade, ligacoes + 1)
+    arestas = [
+        (u, v, aleatorio.randint(1, 100))
+        for u in range(inicial)
+        for v in range(u + 1, inicial)
+    ]
+    # Cada vértice aparece aqui uma vez por aresta: sortear dessa lista é
+    # sortear proporcionalmente ao grau
+    extremidades = [x for u, v, _ in arestas for x in (u, v)]
+    for novo in range(inicial, quantidade):
+        escolhidos = set()
+        while len(escolhidos) < ligacoes:
+            escolhidos.add(aleatorio.choice(extremidades))
+        for v in escolhidos:
+            arestas.append((v, novo, aleatorio.randint(1, 100)))
+            extremidades.extend((v, novo))
+    return quantidade, arestas
+
+
+def completo(quantidade, semente=42):
+    # Grafo completo: todos os pares de vértices ligados.
+    aleatorio = random.Random(semente)
+    arestas = [
+        (u, v, aleatorio.randint(1, 100))
+        for u in range(quantidade)
+        for v in range(u + 1, quantidade)
+    ]
+    return quantidade, arestas
+
+
+GERADORES = {
+    "grade": grade,
+    "geometrico": geometrico,
+    "livre_de_escala": livre_de_escala,
+    "completo": completo,
+}
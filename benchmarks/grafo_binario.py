@@ -0,0 +1,92 @@
+# Tempo para ter um grafo pronto para consulta: construído a partir de tuplas
+# (adicionar_cidade / adicionar_estrada no GrafoPoderado de ex1.py,
+# carregar_conexoes no GrafoAlgoritmoPrim de ex11.py) ou aberto com carregar
+# de um arquivo gravado por salvar. Também mede a primeira consulta em cada
+# caso e confere que as respostas são as mesmas.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.grafo_binario --vertices 100000 333333
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.geradores import geometrico
+from ex1 import GrafoPoderado
+from ex11 import GrafoAlgoritmoPrim
+
+
+def cronometrar(funcao, *argumentos):
+    inicio = time.perf_counter()
+    resultado = funcao(*argumentos)
+    return resultado, time.perf_counter() - inicio
+
+
+def construir_mapa(nomes, arestas):
+    mapa = GrafoPoderado()
+    for nome in nomes:
+        mapa.adicionar_cidade(nome)
+    for u, v, peso in arestas:
+        mapa.adicionar_estrada(nomes[u], nomes[v], peso)
+    return mapa
+
+
+def construir_rede(nomes, arestas):
+    rede = GrafoAlgoritmoPrim(nomes)
+    rede.carregar_conexoes((nomes[u], nomes[v], custo) for u, v, custo in arestas)
+    return rede
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, nargs="+", default=[100_000, 333_333])
+    args = parser.parse_args()
+
+    print(
+        f"{'classe':>18} {'vértices':>9} {'arestas':>9} {'arquivo (MB)':>13} "
+        f"{'construir (s)':>14} {'salvar (s)':>11} {'carregar (ms)':>14} "
+        f"{'consulta (s)':>13} {'consulta carregado (s)':>23}"
+    )
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "grafo.bin")
+        for quantidade in args.vertices:
+            V, arestas = geometrico(quantidade)
+            nomes = [f"Cidade {v}" for v in range(V)]
+            origem, destino = nomes[0], nomes[-1]
+
+            casos = [
+                (
+                    GrafoPoderado,
+                    construir_mapa,
+                    lambda grafo: grafo.dijkstra(origem, destino),
+                ),
+                (
+                    GrafoAlgoritmoPrim,
+                    construir_rede,
+                    lambda grafo: grafo.prim().total,
+                ),
+            ]
+            for classe, construir, consultar in casos:
+                grafo, tempo_construir = cronometrar(construir, nomes, arestas)
+                _, tempo_salvar = cronometrar(grafo.salvar, caminho)
+                resposta, tempo_consulta = cronometrar(consultar, grafo)
+                del grafo
+
+                carregado, tempo_carregar = cronometrar(classe.carregar, caminho)
+                resposta_carregado, tempo_consulta_carregado = cronometrar(
+                    consultar, carregado
+                )
+                assert resposta_carregado == resposta
+                del carregado
+
+                print(
+                    f"{classe.__name__:>18} {V:9d} {len(arestas):9d} "
+                    f"{os.path.getsize(caminho) / 2**20:13.1f} "
+                    f"{tempo_construir:14.3f} {tempo_salvar:11.3f} "
+                    f"{tempo_carregar * 1000:14.2f} {tempo_consulta:13.3f} "
+                    f"{tempo_consulta_carregado:23.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
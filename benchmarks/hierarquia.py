@@ -0,0 +1,69 @@
+# Pré-processamento e consultas da hierarquia de contração de GrafoPoderado
+# (ex1.py) comparados ao Dijkstra com fila de prioridade, conferindo que as
+# distâncias são idênticas. Também mede a gravação e a leitura do arquivo.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.hierarquia --lados 30 100 200
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.dijkstra import gerar_grade
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lados", type=int, nargs="+", default=[30, 100, 200])
+    parser.add_argument("--consultas", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'cidades':>8} {'pré-proc. (s)':>14} {'dijkstra (ms)':>14} "
+        f"{'hierarquia (ms)':>16} {'gravar (s)':>11} {'carregar (s)':>13}"
+    )
+    for lado in args.lados:
+        mapa = gerar_grade(lado)
+        cidades = list(mapa.vertices)
+        aleatorio = random.Random(lado)
+        pares = [
+            (aleatorio.choice(cidades), aleatorio.choice(cidades))
+            for _ in range(args.consultas)
+        ]
+
+        inicio = time.perf_counter()
+        mapa.preprocessar_hierarquia()
+        tempo_pre = time.perf_counter() - inicio
+
+        tempo_dijkstra = tempo_ch = 0.0
+        for origem, destino in pares:
+            inicio = time.perf_counter()
+            _, esperado = mapa.dijkstra(origem, destino)
+            tempo_dijkstra += time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            _, distancia = mapa.dijkstra_hierarquia(origem, destino)
+            tempo_ch += time.perf_counter() - inicio
+            assert distancia == esperado, (origem, destino, distancia, esperado)
+
+        with tempfile.TemporaryDirectory() as pasta:
+            arquivo = os.path.join(pasta, "hierarquia.bin")
+            inicio = time.perf_counter()
+            mapa.salvar_hierarquia(arquivo)
+            tempo_gravar = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            mapa.carregar_hierarquia(arquivo)
+            tempo_carregar = time.perf_counter() - inicio
+
+        print(
+            f"{lado * lado:8d} {tempo_pre:14.2f} "
+            f"{1000 * tempo_dijkstra / len(pares):14.3f} "
+            f"{1000 * tempo_ch / len(pares):16.3f} "
+            f"{tempo_gravar:11.3f} {tempo_carregar:13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Tempo de importação a frio de cada exercício, cada uma num interpretador
+# novo. "antes" importa networkx e matplotlib.pyplot junto com o módulo, como
+# acontecia quando eles eram importados no topo de cada arquivo; "agora" só
+# importa o módulo, que os adia para o desenho.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.importacao --repeticoes 5
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULOS = ["ex1", "ex2", "ex3", "ex4", "ex7", "ex8", "ex9", "ex10", "ex11"]
+
+
+def tempo_importacao(codigo, repeticoes):
+    # Mediana do tempo total de um interpretador que só executa codigo.
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], check=True)
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modulos", nargs="+", default=MODULOS)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    vazio = tempo_importacao("pass", args.repeticoes)
+    print(f"Interpretador vazio: {vazio:.3f} s (descontado abaixo)")
+    print(f"{'módulo':>7} {'antes (s)':>10} {'agora (s)':>10} {'ganho':>8}")
+    for modulo in args.modulos:
+        antes = (
+            tempo_importacao(
+                f"import networkx, matplotlib.pyplot; import {modulo}",
+                args.repeticoes,
+            )
+            - vazio
+        )
+        agora = tempo_importacao(f"import {modulo}", args.repeticoes) - vazio
+        print(f"{modulo:>7} {antes:10.3f} {agora:10.3f} {antes / agora:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# Atualização incremental da matriz de menores tempos (ex8.atualizar_aresta)
+# comparada a recalcular tudo com floyd_warshall. Primeiro confere, com
+# alterações aleatórias (reduções, aumentos, novas ligações e remoções), que
+# o resultado é idêntico ao recálculo completo; depois mede os tempos.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.incremental --tamanhos 200 500 1000
+import argparse
+import random
+import time
+
+import numpy as np
+
+from benchmarks.floyd_warshall import gerar_matriz
+from ex8 import INF, atualizar_aresta, floyd_warshall
+
+
+def alteracao_aleatoria(aleatorio, grafo, maximo):
+    # Sorteia uma ligação (u, v) e um novo tempo para ela, entre 0 e maximo.
+    n = len(grafo)
+    u, v = aleatorio.sample(range(n), 2)
+    sorteio = aleatorio.random()
+    if sorteio < 0.1:
+        return u, v, INF  # Remoção da ligação
+    if grafo[u][v] == INF or sorteio < 0.5:
+        return u, v, aleatorio.randint(0, maximo)
+    variacao = aleatorio.randint(1, max(1, maximo // 3))
+    return u, v, min(maximo, max(0, grafo[u][v] + aleatorio.choice([-1, 1]) * variacao))
+
+
+def conferir(rodadas=300, semente=0):
+    # Metade das rodadas usa tempos de 0 a 5, para que apareçam ligações de
+    # tempo zero e ciclos de tempo zero.
+    aleatorio = random.Random(semente)
+    for rodada in range(rodadas):
+        n = aleatorio.randint(2, 30)
+        nao_direcionado = aleatorio.random() < 0.5
+        maximo = 5 if rodada % 2 else 100
+        grafo = gerar_matriz(n, densidade=aleatorio.random(), semente=rodada)
+        if maximo < 100:
+            grafo[np.isfinite(grafo)] %= maximo + 1
+        if nao_direcionado:
+            grafo = np.minimum(grafo, grafo.T)
+        grafo = grafo.tolist()
+        dist = floyd_warshall(grafo)
+
+        for _ in range(10):
+            u, v, peso = alteracao_aleatoria(aleatorio, grafo, maximo)
+            dist = atualizar_aresta(dist, grafo, u, v, peso, nao_direcionado)
+            esperado = floyd_warshall(grafo)
+            assert dist == esperado, (rodada, u, v, peso)
+    print(f"Conferência OK: {rodadas * 10} alterações idênticas ao recálculo completo")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[200, 500, 1000])
+    parser.add_argument("--alteracoes", type=int, default=20)
+    args = parser.parse_args()
+
+    conferir()
+
+    print(
+        f"{'bairros':>8} {'recálculo (s)':>14} {'redução (ms)':>13} "
+        f"{'aumento (ms)':>13}"
+    )
+    aleatorio = random.Random(1)
+    for n in args.tamanhos:
+        grafo = gerar_matriz(n, densidade=4 / n)
+        inicio = time.perf_counter()
+        dist = floyd_warshall(grafo)
+        tempo_completo = time.perf_counter() - inicio
+
+        tempos = {"redução": 0.0, "aumento": 0.0}
+        contagens = {"redução": 0, "aumento": 0}
+        ligacoes = np.argwhere(np.isfinite(grafo) & (grafo > 0))
+        for indice in range(args.alteracoes):
+            # Alterna entre piorar e melhorar ligações existentes
+            u, v = (int(x) for x in ligacoes[aleatorio.randrange(len(ligacoes))])
+            if indice % 2:
+                tipo, peso = "aumento", grafo[u][v] + aleatorio.randint(1, 30)
+            else:
+                tipo, peso = "redução", max(0, grafo[u][v] - aleatorio.randint(1, 30))
+            inicio = time.perf_counter()
+            atualizar_aresta(dist, grafo, u, v, peso)
+            tempos[tipo] += time.perf_counter() - inicio
+            contagens[tipo] += 1
+
+        medias = {
+            tipo: 1000 * tempos[tipo] / max(1, contagens[tipo]) for tipo in tempos
+        }
+        print(
+            f"{n:8d} {tempo_completo:14.3f} {medias['redução']:13.2f} "
+            f"{medias['aumento']:13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
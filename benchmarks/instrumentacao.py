@@ -0,0 +1,150 @@
+# Custo da instrumentação de GrafoPoderado.dijkstra (ex1.py),
+# GrafoAlgoritmoPrim.prim (ex11.py) e floyd_warshall (ex8.py). Para cada
+# algoritmo compara três versões, alternadas a cada repetição:
+# - "núcleo": o laço sem contadores chamado direto, como antes da
+#   instrumentação (a referência);
+# - "desligada": a chamada pública sem estatísticas;
+# - "ligada": a chamada pública com um objeto Estatisticas.
+# Com a instrumentação desligada, a diferença para o núcleo deve ficar abaixo
+# da tolerância (ruído de medida); se não ficar, o script termina com erro.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.instrumentacao --vertices 100000 --bairros 600
+import argparse
+import gc
+import sys
+import time
+
+import numpy as np
+
+from agm import (
+    AGMDinamica,
+    ResultadoAGM,
+    congelar_esparsa,
+    contar_arestas,
+    escolher_motor,
+    prim_csr,
+)
+from benchmarks.geradores import grade
+from ex1 import GrafoPoderado
+from ex8 import INF, floyd_warshall, floyd_warshall_sequencial
+from ex11 import GrafoAlgoritmoPrim
+from instrumentacao import Estatisticas
+
+
+def preparar_dijkstra(V, arestas):
+    # Sem cache de árvores: cada chamada é uma busca completa até o canto oposto
+    mapa = GrafoPoderado(capacidade_cache=0)
+    for v in range(V):
+        mapa.adicionar_cidade(v)
+    for u, v, peso in arestas:
+        mapa.adicionar_estrada(u, v, peso)
+    destino = V - 1
+
+    def nucleo():
+        arvore = mapa.arvore_caminhos(0)
+        arvore.expandir_ate(mapa.vertices, destino)
+        return arvore.caminho_ate(destino)
+
+    return (
+        nucleo,
+        lambda: mapa.dijkstra(0, destino),
+        lambda: mapa.dijkstra(0, destino, Estatisticas()),
+    )
+
+
+def preparar_prim(V, arestas):
+    rede = GrafoAlgoritmoPrim(list(range(V)))
+    rede.carregar_conexoes(arestas)
+
+    def nucleo():
+        motor = escolher_motor(
+            V, contar_arestas(rede.grafo, V, rede.armazenamento), rede.armazenamento
+        )
+        assert motor == "heap"
+        origem, custos = prim_csr(*congelar_esparsa(rede.grafo, V), V)
+        rede.agm = AGMDinamica(origem, custos)
+        return ResultadoAGM(origem, custos)
+
+    def publica(estatisticas=None):
+        rede.agm = None  # Descarta a AGM mantida, para recalcular do zero
+        return rede.prim(estatisticas=estatisticas)
+
+    return nucleo, publica, lambda: publica(Estatisticas())
+
+
+def preparar_floyd_warshall(bairros, arestas):
+    matriz = np.full((bairros, bairros), INF)
+    np.fill_diagonal(matriz, 0)
+    for u, v, peso in arestas:
+        if u < bairros and v < bairros:
+            matriz[u, v] = matriz[v, u] = peso
+    return (
+        lambda: floyd_warshall_sequencial(matriz.astype(matriz.dtype, copy=True)),
+        lambda: floyd_warshall(matriz),
+        lambda: floyd_warshall(matriz, estatisticas=Estatisticas()),
+    )
+
+
+def medir(versoes, repeticoes):
+    # Melhor tempo de cada versão, alternando as versões a cada repetição para
+    # que variações da máquina atinjam todas igualmente. Como no timeit, o
+    # coletor de lixo fica desligado durante cada medida.
+    melhores = [float("inf")] * len(versoes)
+    for _ in range(repeticoes):
+        for i, executar in enumerate(versoes):
+            gc.collect()
+            gc.disable()
+            try:
+                inicio = time.perf_counter()
+                executar()
+                decorrido = time.perf_counter() - inicio
+            finally:
+                gc.enable()
+            melhores[i] = min(melhores[i], decorrido)
+    return melhores
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, default=100_000)
+    parser.add_argument("--bairros", type=int, default=600)
+    parser.add_argument("--repeticoes", type=int, default=9)
+    parser.add_argument(
+        "--tolerancia",
+        type=float,
+        default=0.03,
+        help="diferença relativa máxima entre a versão desligada e o núcleo",
+    )
+    args = parser.parse_args()
+
+    V, arestas = grade(args.vertices)
+    casos = [
+        ("dijkstra", preparar_dijkstra(V, arestas)),
+        ("prim", preparar_prim(V, arestas)),
+        ("floyd_warshall", preparar_floyd_warshall(args.bairros, arestas)),
+    ]
+
+    print(
+        f"{'algoritmo':>15} {'núcleo (s)':>11} {'desligada':>10} {'ligada':>10} "
+        f"{'custo desligada':>16} {'custo ligada':>13}"
+    )
+    falhas = 0
+    for nome, versoes in casos:
+        nucleo, desligada, ligada = medir(versoes, args.repeticoes)
+        custo_desligada = desligada / nucleo - 1
+        custo_ligada = ligada / nucleo - 1
+        aprovado = custo_desligada <= args.tolerancia
+        falhas += not aprovado
+        print(
+            f"{nome:>15} {nucleo:11.4f} {desligada:10.4f} {ligada:10.4f} "
+            f"{custo_desligada:+15.1%} {custo_ligada:+13.1%}"
+            f"{'' if aprovado else '  ACIMA DA TOLERÂNCIA'}"
+        )
+
+    if falhas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Compara GrafoPoderado.k_menores_rotas (ex1.py) com o algoritmo de Yen sem
+# otimizações de benchmarks/referencias.py, que faz uma busca de Dijkstra
+# completa para cada desvio. Além do tempo, conta as consultas de vizinhança
+# (vertices[cidade]) das duas versões, uma por cidade expandida, como medida
+# do trabalho total. Também confere que as distâncias das k rotas coincidem.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.k_rotas --lados 20 40 80 --k 5 10 20
+import argparse
+import time
+from collections.abc import Mapping
+
+from benchmarks.dijkstra import gerar_grade
+from benchmarks.referencias import k_menores_rotas_referencia
+
+
+class ContadorConsultas(Mapping):
+    # Envolve GrafoPoderado.vertices contando os acessos à vizinhança.
+    def __init__(self, vertices):
+        self.vertices = vertices
+        self.consultas = 0
+
+    def __getitem__(self, cidade):
+        self.consultas += 1
+        return self.vertices[cidade]
+
+    def __contains__(self, cidade):
+        return cidade in self.vertices
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    def __len__(self):
+        return len(self.vertices)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lados", type=int, nargs="+", default=[20, 40])
+    parser.add_argument("--k", type=int, nargs="+", default=[5, 10, 20])
+    args = parser.parse_args()
+
+    print(
+        f"{'cidades':>8} {'k':>4} {'ingênuo (s)':>12} {'Yen (s)':>9} "
+        f"{'ganho':>7} {'consultas ingênuo':>18} {'consultas Yen':>14}"
+    )
+    for lado in args.lados:
+        for k in args.k:
+            mapa = gerar_grade(lado)
+            origem, destino = (0, 0), (lado - 1, lado - 1)
+
+            contador = ContadorConsultas(mapa.vertices)
+            inicio = time.perf_counter()
+            referencia = k_menores_rotas_referencia(contador, origem, destino, k)
+            tempo_referencia = time.perf_counter() - inicio
+            consultas_referencia = contador.consultas
+
+            mapa.vertices = contador = ContadorConsultas(mapa.vertices)
+            inicio = time.perf_counter()
+            rotas = mapa.k_menores_rotas(origem, destino, k)
+            tempo = time.perf_counter() - inicio
+
+            assert [distancia for _, distancia in rotas] == [
+                distancia for _, distancia in referencia
+            ]
+            print(
+                f"{lado * lado:8d} {k:4d} {tempo_referencia:12.3f} {tempo:9.3f} "
+                f"{tempo_referencia / tempo:6.1f}x {consultas_referencia:18d} "
+                f"{contador.consultas:14d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
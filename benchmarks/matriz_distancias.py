@@ -0,0 +1,64 @@
+# Compara N² chamadas de dijkstra com GrafoPoderado.matriz_distancias (ex4.py),
+# em série e distribuída entre processos.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.matriz_distancias --lado 20 --processos 1 2 4
+import argparse
+import random
+import time
+
+import numpy as np
+
+from ex4 import GrafoPoderado
+
+
+def gerar_grade(lado, semente=42):
+    # Malha de cidades lado x lado com custos aleatórios entre 1 e 10.
+    aleatorio = random.Random(semente)
+    mapa = GrafoPoderado()
+    for linha in range(lado):
+        for coluna in range(lado):
+            mapa.adicionar_cidade((linha, coluna))
+    for linha in range(lado):
+        for coluna in range(lado):
+            if coluna + 1 < lado:
+                mapa.adicionar_trajeto(
+                    (linha, coluna), (linha, coluna + 1), aleatorio.randint(1, 10)
+                )
+            if linha + 1 < lado:
+                mapa.adicionar_trajeto(
+                    (linha, coluna), (linha + 1, coluna), aleatorio.randint(1, 10)
+                )
+    return mapa
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lado", type=int, default=20)
+    parser.add_argument("--processos", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    mapa = gerar_grade(args.lado)
+    cidades = list(mapa.vertices)
+    print(f"{len(cidades)} cidades, matriz {len(cidades)}x{len(cidades)}")
+
+    inicio = time.perf_counter()
+    esperado = np.array(
+        [
+            [mapa.dijkstra(origem, destino)[1] for destino in cidades]
+            for origem in cidades
+        ],
+        dtype=float,
+    )
+    print(f"{'N² chamadas de dijkstra':>28}: {time.perf_counter() - inicio:8.3f} s")
+
+    for processos in args.processos:
+        inicio = time.perf_counter()
+        matriz = mapa.matriz_distancias(processos=processos)
+        tempo = time.perf_counter() - inicio
+        assert np.array_equal(matriz, esperado)
+        print(f"{f'matriz_distancias ({processos} proc.)':>28}: {tempo:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
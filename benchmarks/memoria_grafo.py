@@ -0,0 +1,54 @@
+# Memória por aresta e tempo de consulta do GrafoPoderado (dicionário de
+# dicionários com nomes) e da sua forma compacta GrafoCompacto (CSR).
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.memoria_grafo --lados 50 100 300
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.dijkstra import gerar_grade
+
+
+def medir_alocacao(funcao, *argumentos):
+    # Retorna o resultado da função e os bytes que ele mantém alocados.
+    tracemalloc.start()
+    resultado = funcao(*argumentos)
+    alocado, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, alocado
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lados", type=int, nargs="+", default=[50, 100, 300])
+    args = parser.parse_args()
+
+    print(
+        f"{'cidades':>8} {'arestas':>8} {'dict B/aresta':>14} {'CSR B/aresta':>13} "
+        f"{'dijkstra dict (s)':>18} {'dijkstra CSR (s)':>17}"
+    )
+    for lado in args.lados:
+        mapa, bytes_dict = medir_alocacao(gerar_grade, lado)
+        compacto, bytes_csr = medir_alocacao(mapa.compactar)
+        # Cada estrada aparece duas vezes na adjacência (grafo não direcionado)
+        arestas = compacto.A // 2
+
+        origem, destino = (0, 0), (lado - 1, lado - 1)
+        inicio = time.perf_counter()
+        _, distancia_dict = mapa.dijkstra(origem, destino)
+        tempo_dict = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        _, distancia_csr = compacto.dijkstra(origem, destino)
+        tempo_csr = time.perf_counter() - inicio
+        assert distancia_dict == distancia_csr
+
+        print(
+            f"{lado * lado:8d} {arestas:8d} {bytes_dict / arestas:14.1f} "
+            f"{bytes_csr / arestas:13.1f} {tempo_dict:18.4f} {tempo_csr:17.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Memória por conexão de cada armazenamento do GrafoAlgoritmoPrim (ex11.py)
+# em redes esparsas de torres: a matriz V x V, as listas de adjacência, o
+# dicionário de dicionários "esparsa" e a sua forma congelada em CSR, usada
+# pelo prim. Também mede o prim sobre o armazenamento esparso.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.memoria_prim --torres 1000 10000 100000
+import argparse
+import time
+
+from agm import arvore_geradora_minima, congelar_esparsa
+from benchmarks.memoria_grafo import medir_alocacao
+from benchmarks.prim import gerar_rede
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--torres", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument(
+        "--limite-matriz",
+        type=int,
+        default=5000,
+        help="não usa a matriz V x V acima deste número de torres",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'torres':>8} {'conexões':>9} {'matriz B/c':>11} {'lista B/c':>10} "
+        f"{'esparsa B/c':>12} {'CSR B/c':>8} {'prim esparsa (s)':>17}"
+    )
+    for quantidade in args.torres:
+        # Os bytes incluem a tabela de nomes, igual em todos os armazenamentos
+        (rede, conexoes), bytes_esparsa = medir_alocacao(
+            gerar_rede, quantidade, "esparsa"
+        )
+        _, bytes_csr = medir_alocacao(congelar_esparsa, rede.grafo, rede.V)
+
+        inicio = time.perf_counter()
+        _, custos = arvore_geradora_minima(rede.grafo, rede.V, "esparsa")
+        tempo_prim = time.perf_counter() - inicio
+        del rede
+
+        _, bytes_lista = medir_alocacao(gerar_rede, quantidade, "lista")
+
+        coluna_matriz = f"{'-':>11}"
+        if quantidade <= args.limite_matriz:
+            _, bytes_matriz = medir_alocacao(gerar_rede, quantidade, "matriz")
+            coluna_matriz = f"{bytes_matriz / conexoes:11.0f}"
+
+        print(
+            f"{quantidade:8d} {conexoes:9d} {coluna_matriz} "
+            f"{bytes_lista / conexoes:10.0f} {bytes_esparsa / conexoes:12.0f} "
+            f"{bytes_csr / conexoes:8.0f} {tempo_prim:17.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
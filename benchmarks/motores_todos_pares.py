@@ -0,0 +1,59 @@
+# Ponto de troca entre Floyd-Warshall (denso) e n buscas de Dijkstra
+# (esparso) em ex8.menores_tempos: mede os dois motores para vários
+# tamanhos e graus médios e mostra qual deles a escolha automática usa.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.motores_todos_pares --tamanhos 250 500 1000 --graus 3 10 50
+import argparse
+import time
+
+import numpy as np
+
+from ex8 import INF, escolher_motor, menores_tempos
+
+
+def gerar_esparsa(n, grau, semente=42):
+    # Matriz de tempos com, em média, grau ligações saindo de cada bairro.
+    aleatorio = np.random.default_rng(semente)
+    matriz = np.full((n, n), INF)
+    quantidade = n * grau
+    origens = aleatorio.integers(0, n, quantidade)
+    destinos = aleatorio.integers(0, n, quantidade)
+    matriz[origens, destinos] = aleatorio.integers(1, 100, quantidade)
+    np.fill_diagonal(matriz, 0)
+    return matriz
+
+
+def cronometrar(matriz, motor):
+    inicio = time.perf_counter()
+    resultado = menores_tempos(matriz, motor=motor)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[250, 500, 1000])
+    parser.add_argument("--graus", type=int, nargs="+", default=[3, 10, 50])
+    args = parser.parse_args()
+
+    print(
+        f"{'bairros':>8} {'grau':>5} {'ligações':>9} {'floyd_warshall (s)':>19} "
+        f"{'dijkstra (s)':>13} {'mais rápido':>15} {'escolhido':>15}"
+    )
+    for n in args.tamanhos:
+        for grau in args.graus:
+            matriz = gerar_esparsa(n, grau)
+            ligacoes = int(np.isfinite(matriz).sum()) - n
+            resultado_fw, tempo_fw = cronometrar(matriz, "floyd_warshall")
+            resultado_dj, tempo_dj = cronometrar(matriz, "dijkstra")
+            assert np.array_equal(resultado_fw, resultado_dj)
+
+            mais_rapido = "dijkstra" if tempo_dj < tempo_fw else "floyd_warshall"
+            print(
+                f"{n:8d} {grau:5d} {ligacoes:9d} {tempo_fw:19.3f} {tempo_dj:13.3f} "
+                f"{mais_rapido:>15} {escolher_motor(n, ligacoes):>15}"
+            )
+
+
+if __name__ == "__main__":
+    main()
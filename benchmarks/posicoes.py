@@ -0,0 +1,67 @@
+# Tempo de layout com cache em disco (posicoes.posicoes_em_cache) comparado
+# ao nx.spring_layout do zero: primeira execução, execução repetida (posições
+# lidas do disco) e execução depois de acrescentar e remover 1% dos vértices
+# (simulação aquecida a partir do desenho anterior).
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.posicoes --vertices 200 1000 3000
+import argparse
+import random
+import tempfile
+import time
+
+import networkx as nx
+
+from posicoes import posicoes_em_cache
+
+
+def gerar_rede(quantidade, semente=42):
+    # Grafo geométrico aleatório com grau médio em torno de 6.
+    raio = (6 / (3.14159 * quantidade)) ** 0.5
+    return nx.random_geometric_graph(quantidade, raio, seed=semente)
+
+
+def alterar(G, fracao=0.01, semente=0):
+    # Remove e acrescenta fracao dos vértices; cada novo se liga a 3 antigos.
+    aleatorio = random.Random(semente)
+    H = G.copy()
+    quantidade = max(1, int(fracao * H.number_of_nodes()))
+    H.remove_nodes_from(aleatorio.sample(list(H.nodes), quantidade))
+    existentes = list(H.nodes)
+    proximo = max(G.nodes) + 1
+    for novo in range(proximo, proximo + quantidade):
+        H.add_edges_from((novo, v) for v in aleatorio.sample(existentes, 3))
+    return H
+
+
+def cronometrar(funcao, *argumentos, **parametros):
+    inicio = time.perf_counter()
+    funcao(*argumentos, **parametros)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vertices", type=int, nargs="+", default=[200, 1000, 3000])
+    args = parser.parse_args()
+
+    print(
+        f"{'vértices':>9} {'do zero (s)':>12} {'em cache (s)':>13} "
+        f"{'alterado, do zero (s)':>22} {'alterado, aquecido (s)':>23}"
+    )
+    for quantidade in args.vertices:
+        G = gerar_rede(quantidade)
+        H = alterar(G)
+        with tempfile.TemporaryDirectory() as pasta:
+            frio = cronometrar(posicoes_em_cache, G, "rede", pasta=pasta, seed=42)
+            cache = cronometrar(posicoes_em_cache, G, "rede", pasta=pasta, seed=42)
+            aquecido = cronometrar(posicoes_em_cache, H, "rede", pasta=pasta, seed=42)
+        alterado_frio = cronometrar(nx.spring_layout, H, seed=42)
+        print(
+            f"{quantidade:9d} {frio:12.3f} {cache:13.4f} "
+            f"{alterado_frio:22.3f} {aquecido:23.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
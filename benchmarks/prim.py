@@ -0,0 +1,87 @@
+# Compara os motores da Árvore Geradora Mínima em redes esparsas de torres,
+# como a de ex11.py: o Prim sobre matriz (O(V²)), o Prim com fila de
+# prioridade sobre listas de adjacência (O(E log V)) e o Kruskal com
+# union-find direto sobre a lista de arestas (O(E log E)). Os custos são
+# distintos, então a AGM é única e os três devem devolver a mesma árvore.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.prim --torres 500 2000 100000
+import argparse
+import random
+import time
+
+from agm import arvore_geradora_minima, escolher_motor
+from ex11 import GrafoAlgoritmoPrim
+
+
+def gerar_rede(quantidade, armazenamento, extras=3, semente=42):
+    # Rede esparsa: um caminho que garante a conexão de todas as torres e
+    # algumas ligações aleatórias por torre, com custos distintos.
+    # As conexões são gravadas pelos índices, para não medir a tradução de
+    # nomes de adicionar_conexao.
+    aleatorio = random.Random(semente)
+    torres = [f"Torre {i}" for i in range(quantidade)]
+    rede = GrafoAlgoritmoPrim(torres, armazenamento=armazenamento)
+    pares = set()
+    for u in range(quantidade):
+        vizinhos = [u + 1] if u + 1 < quantidade else []
+        vizinhos += aleatorio.sample(range(quantidade), min(extras, quantidade))
+        pares.update((min(u, v), max(u, v)) for v in vizinhos if v != u)
+    custos = aleatorio.sample(range(1, 100 * len(pares) + 1), len(pares))
+    for (u, v), custo in zip(sorted(pares), custos):
+        if armazenamento == "arestas":
+            rede.grafo[u, v] = custo
+        else:
+            rede.grafo[u][v] = custo
+            rede.grafo[v][u] = custo
+    return rede, len(pares)
+
+
+def medir(rede, motor):
+    inicio = time.perf_counter()
+    origem, custos = arvore_geradora_minima(
+        rede.grafo, rede.V, rede.armazenamento, motor
+    )
+    return origem, sum(custos), time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--torres", type=int, nargs="+", default=[500, 2000, 100000])
+    parser.add_argument(
+        "--limite-matriz",
+        type=int,
+        default=5000,
+        help="não usa a matriz V x V acima deste número de torres",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'torres':>8} {'conexões':>9} {'matriz (s)':>11} {'heap (s)':>9} "
+        f"{'kruskal (s)':>12} {'automático':>11} {'custo total':>12}"
+    )
+    for quantidade in args.torres:
+        rede, conexoes = gerar_rede(quantidade, "lista")
+        origem, total, tempo_heap = medir(rede, "heap")
+
+        rede, _ = gerar_rede(quantidade, "arestas")
+        origem_kruskal, total_kruskal, tempo_kruskal = medir(rede, "kruskal")
+        assert origem_kruskal == origem and total_kruskal == total
+
+        coluna_matriz = f"{'-':>11}"
+        if quantidade <= args.limite_matriz:
+            rede, _ = gerar_rede(quantidade, "matriz")
+            origem_matriz, total_matriz, tempo_matriz = medir(rede, "matriz")
+            assert origem_matriz == origem and total_matriz == total
+            coluna_matriz = f"{tempo_matriz:11.3f}"
+
+        # Motor escolhido para a rede guardada como matriz
+        automatico = escolher_motor(quantidade, conexoes, "matriz")
+        print(
+            f"{quantidade:8d} {conexoes:9d} {coluna_matriz} {tempo_heap:9.3f} "
+            f"{tempo_kruskal:12.3f} {automatico:>11} {total:12d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
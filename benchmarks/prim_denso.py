@@ -0,0 +1,60 @@
+# Compara o Prim denso em Python puro (prim_matriz) com a versão vetorizada
+# com NumPy (prim_numpy) em matrizes completas de custos entre torres, como
+# os custos de todos os pares de ex11.py, conferindo que a árvore é a mesma.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.prim_denso --torres 500 2000 5000 20000
+import argparse
+import time
+
+import numpy as np
+
+from agm import prim_matriz, prim_numpy
+
+
+def gerar_custos(quantidade, semente=42):
+    # Matriz simétrica completa com custos inteiros entre 1 e 1000, gerada
+    # linha a linha em float32 para que 20 mil torres caibam em 1,6 GB.
+    gerador = np.random.default_rng(semente)
+    custos = np.zeros((quantidade, quantidade), dtype=np.float32)
+    for i in range(quantidade - 1):
+        linha = gerador.integers(1, 1001, size=quantidade - i - 1)
+        custos[i, i + 1 :] = linha
+        custos[i + 1 :, i] = linha
+    return custos
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--torres", type=int, nargs="+", default=[500, 2000, 5000, 20000]
+    )
+    parser.add_argument(
+        "--limite-python",
+        type=int,
+        default=3000,
+        help="não executa prim_matriz acima deste número de torres",
+    )
+    args = parser.parse_args()
+
+    print(f"{'torres':>8} {'Python (s)':>11} {'NumPy (s)':>10} {'custo total':>12}")
+    for quantidade in args.torres:
+        custos = gerar_custos(quantidade)
+        inicio = time.perf_counter()
+        origem, custos_arvore = prim_numpy(custos, quantidade)
+        tempo_numpy = time.perf_counter() - inicio
+        total = sum(custos_arvore)
+
+        coluna_python = f"{'-':>11}"
+        if quantidade <= args.limite_python:
+            lista = custos.astype(np.int64).tolist()
+            inicio = time.perf_counter()
+            origem_python, custos_python = prim_matriz(lista, quantidade)
+            coluna_python = f"{time.perf_counter() - inicio:11.3f}"
+            assert origem_python == origem and sum(custos_python) == total
+
+        print(f"{quantidade:8d} {coluna_python} {tempo_numpy:10.3f} {total:12.0f}")
+
+
+if __name__ == "__main__":
+    main()
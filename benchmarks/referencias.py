@@ -0,0 +1,104 @@
+# Implementações originais (antes das otimizações), mantidas apenas como
+# referência de corretude e de desempenho para os benchmarks.
+import heapq
+
+
+def dijkstra_referencia(vertices, origem, destino):
+    # Dijkstra O(V²): escolhe o próximo vértice com min() sobre a lista de não visitados.
+    nao_visitados = list(vertices.keys())
+    distancias = {vertice: float("inf") for vertice in vertices}
+    distancias[origem] = 0
+    predecessores = {}
+
+    while nao_visitados:
+        atual = min(nao_visitados, key=lambda vertice: distancias[vertice])
+
+        if distancias[atual] == float("inf"):
+            break
+
+        for vizinho, distancia in vertices[atual].items():
+            nova_distancia = distancias[atual] + distancia
+            if nova_distancia < distancias[vizinho]:
+                distancias[vizinho] = nova_distancia
+                predecessores[vizinho] = atual
+
+        nao_visitados.remove(atual)
+
+    caminho = []
+    atual = destino
+    while atual in predecessores:
+        caminho.append(atual)
+        atual = predecessores[atual]
+    caminho.append(origem)
+    caminho.reverse()
+
+    return caminho, distancias[destino]
+
+
+def floyd_warshall_referencia(grafo):
+    # Floyd-Warshall em Python puro com três laços sobre listas de listas.
+    num_bairros = len(grafo)
+    dist = [[grafo[i][j] for j in range(num_bairros)] for i in range(num_bairros)]
+
+    for k in range(num_bairros):
+        for i in range(num_bairros):
+            for j in range(num_bairros):
+                if dist[i][k] + dist[k][j] < dist[i][j]:
+                    dist[i][j] = dist[i][k] + dist[k][j]
+
+    return dist
+
+
+def k_menores_rotas_referencia(vertices, origem, destino, k):
+    # Algoritmo de Yen sem otimizações, como se faria chamando o Dijkstra
+    # repetidas vezes num grafo com estradas retiradas à mão: para cada rota
+    # aceita e cada cidade dela, uma busca completa a partir do desvio, sem
+    # estimativa, sem limite e sem reaproveitar desvios já feitos.
+    def dijkstra_sem(origem_busca, proibidas, bloqueadas):
+        distancias = {origem_busca: 0}
+        predecessores = {}
+        visitadas = set()
+        fila = [(0, origem_busca)]
+        while fila:
+            distancia_atual, u = heapq.heappop(fila)
+            if u in visitadas:
+                continue
+            if u == destino:
+                caminho = [destino]
+                while caminho[-1] in predecessores:
+                    caminho.append(predecessores[caminho[-1]])
+                return caminho[::-1], distancia_atual
+            visitadas.add(u)
+            for v, peso in vertices[u].items():
+                if v in proibidas or (u == origem_busca and v in bloqueadas):
+                    continue
+                nova_distancia = distancia_atual + peso
+                if nova_distancia < distancias.get(v, float("inf")):
+                    distancias[v] = nova_distancia
+                    predecessores[v] = u
+                    heapq.heappush(fila, (nova_distancia, v))
+        return None
+
+    primeira = dijkstra_sem(origem, set(), set())
+    if primeira is None or k <= 0:
+        return []
+    aceitas = [primeira]
+    candidatas = []
+    while len(aceitas) < k:
+        rota, _ = aceitas[-1]
+        for i in range(len(rota) - 1):
+            raiz = rota[: i + 1]
+            custo_raiz = sum(vertices[a][b] for a, b in zip(raiz, raiz[1:]))
+            bloqueadas = {c[i + 1] for c, _ in aceitas if c[: i + 1] == raiz}
+            encontrado = dijkstra_sem(rota[i], set(raiz[:-1]), bloqueadas)
+            if encontrado is None:
+                continue
+            trecho, distancia = encontrado
+            candidata = (raiz[:-1] + trecho, custo_raiz + distancia)
+            if candidata not in candidatas and candidata not in aceitas:
+                candidatas.append(candidata)
+        if not candidatas:
+            break
+        candidatas.sort(key=lambda candidata: candidata[1])
+        aceitas.append(candidatas.pop(0))
+    return aceitas
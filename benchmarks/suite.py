@@ -0,0 +1,296 @@
+# Suíte de benchmarks com grafos sintéticos para GrafoPoderado.dijkstra
+# (ex1.py), GrafoAlgoritmoPrim.prim (ex11.py) e floyd_warshall (ex8.py).
+# Cada caso (algoritmo, gerador, tamanho) roda num processo novo, que mede o
+# tempo de construção do grafo, o melhor tempo de execução entre algumas
+# repetições e o pico de memória do processo. Os resultados vão para um
+# arquivo JSON; o modo comparar aponta regressões entre duas execuções.
+#
+# Uso (a partir da raiz do repositório):
+#     python -m benchmarks.suite executar --saida base.json
+#     python -m benchmarks.suite executar --tamanhos 100 1000 1000000 --saida novo.json
+#     python -m benchmarks.suite comparar base.json novo.json
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from benchmarks.geradores import GERADORES
+from ex1 import GrafoPoderado
+from ex8 import INF, floyd_warshall
+from ex11 import GrafoAlgoritmoPrim
+
+ALGORITMOS = ["dijkstra", "prim", "floyd_warshall"]
+
+# Maior número de vértices de cada algoritmo e de cada gerador na suíte
+# padrão: o Floyd-Warshall é O(V³) e o grafo completo tem V² / 2 arestas.
+LIMITES_ALGORITMO = {"floyd_warshall": 2000}
+LIMITES_GERADOR = {"completo": 2000}
+
+
+def preparar_dijkstra(V, arestas):
+    # Sem cache de árvores, para que cada repetição seja uma busca a frio
+    mapa = GrafoPoderado(capacidade_cache=0)
+    for v in range(V):
+        mapa.adicionar_cidade(v)
+    for u, v, peso in arestas:
+        mapa.adicionar_estrada(u, v, peso)
+    return lambda: mapa.dijkstra(0, V - 1)
+
+
+def preparar_prim(V, arestas):
+    rede = GrafoAlgoritmoPrim(list(range(V)))
+    rede.carregar_conexoes(arestas)
+
+    def executar():
+        rede.agm = None  # Descarta a AGM mantida, para recalcular do zero
+        return rede.prim()
+
+    return executar
+
+
+def preparar_floyd_warshall(V, arestas):
+    matriz = np.full((V, V), INF)
+    np.fill_diagonal(matriz, 0)
+    for u, v, peso in arestas:
+        matriz[u, v] = matriz[v, u] = peso
+    return lambda: floyd_warshall(matriz)
+
+
+PREPARADORES = {
+    "dijkstra": preparar_dijkstra,
+    "prim": preparar_prim,
+    "floyd_warshall": preparar_floyd_warshall,
+}
+
+
+def pico_memoria_mb():
+    # Pico de memória residente do processo atual.
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2**20 if sys.platform == "darwin" else pico / 2**10
+
+
+def executar_caso(algoritmo, gerador, tamanho, semente, repeticoes):
+    # Roda um caso no processo atual e devolve as medidas.
+    inicio = time.perf_counter()
+    V, arestas = GERADORES[gerador](tamanho, semente=semente)
+    geracao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    executar = PREPARADORES[algoritmo](V, arestas)
+    construcao = time.perf_counter() - inicio
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        executar()
+        tempos.append(time.perf_counter() - inicio)
+
+    return {
+        "algoritmo": algoritmo,
+        "gerador": gerador,
+        "tamanho": tamanho,
+        "vertices": V,
+        "arestas": len(arestas),
+        "geracao_s": geracao,
+        "construcao_s": construcao,
+        "tempo_s": min(tempos),
+        "pico_memoria_mb": pico_memoria_mb(),
+    }
+
+
+def rodar_em_processo(algoritmo, gerador, tamanho, semente, repeticoes, limite_tempo):
+    # Roda um caso num interpretador novo, para isolar o pico de memória.
+    comando = [
+        sys.executable,
+        "-m",
+        "benchmarks.suite",
+        "caso",
+        algoritmo,
+        gerador,
+        str(tamanho),
+        "--semente",
+        str(semente),
+        "--repeticoes",
+        str(repeticoes),
+    ]
+    caso = {"algoritmo": algoritmo, "gerador": gerador, "tamanho": tamanho}
+    try:
+        processo = subprocess.run(
+            comando, capture_output=True, text=True, timeout=limite_tempo
+        )
+    except subprocess.TimeoutExpired:
+        return dict(caso, erro=f"tempo esgotado ({limite_tempo} s)")
+    if processo.returncode != 0:
+        ultima_linha = (processo.stderr.strip().splitlines() or ["?"])[-1]
+        return dict(caso, erro=f"código {processo.returncode}: {ultima_linha}")
+    return json.loads(processo.stdout.strip().splitlines()[-1])
+
+
+def comando_executar(args):
+    casos = []
+    print(
+        f"{'algoritmo':>15} {'gerador':>16} {'vértices':>9} {'arestas':>9} "
+        f"{'construção (s)':>15} {'tempo (s)':>10} {'memória (MB)':>13}"
+    )
+    for algoritmo in args.algoritmos:
+        for gerador in args.geradores:
+            for tamanho in args.tamanhos:
+                limite = min(
+                    LIMITES_ALGORITMO.get(algoritmo, tamanho),
+                    LIMITES_GERADOR.get(gerador, tamanho),
+                )
+                if tamanho > limite and not args.sem_limites:
+                    continue
+                caso = rodar_em_processo(
+                    algoritmo,
+                    gerador,
+                    tamanho,
+                    args.semente,
+                    args.repeticoes,
+                    args.limite_tempo,
+                )
+                casos.append(caso)
+                if "erro" in caso:
+                    print(
+                        f"{algoritmo:>15} {gerador:>16} {tamanho:9d} "
+                        f"{'erro: ' + caso['erro']}"
+                    )
+                    continue
+                print(
+                    f"{algoritmo:>15} {gerador:>16} {caso['vertices']:9d} "
+                    f"{caso['arestas']:9d} {caso['construcao_s']:15.3f} "
+                    f"{caso['tempo_s']:10.4f} {caso['pico_memoria_mb']:13.1f}"
+                )
+
+    resultados = {
+        "metadados": {
+            "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "semente": args.semente,
+            "repeticoes": args.repeticoes,
+        },
+        "casos": casos,
+    }
+    with open(args.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados gravados em {args.saida}")
+
+
+def comando_comparar(args):
+    # Compara cada caso presente nos dois arquivos. Uma regressão é um tempo
+    # (ou pico de memória) maior que o da base além da tolerância relativa e
+    # de um mínimo absoluto, que evita acusar ruído em casos muito rápidos.
+    with open(args.base, encoding="utf-8") as arquivo:
+        base = json.load(arquivo)["casos"]
+    with open(args.novo, encoding="utf-8") as arquivo:
+        novo = json.load(arquivo)["casos"]
+
+    def chave(caso):
+        return caso["algoritmo"], caso["gerador"], caso["tamanho"]
+
+    anteriores = {chave(caso): caso for caso in base if "erro" not in caso}
+    regressoes = 0
+    print(
+        f"{'algoritmo':>15} {'gerador':>16} {'tamanho':>8} {'tempo':>8} "
+        f"{'memória':>8}  situação"
+    )
+    for caso in novo:
+        anterior = anteriores.get(chave(caso))
+        if anterior is None or "erro" in caso:
+            continue
+        razao_tempo = caso["tempo_s"] / max(anterior["tempo_s"], 1e-9)
+        razao_memoria = caso["pico_memoria_mb"] / max(anterior["pico_memoria_mb"], 1e-9)
+        problemas = []
+        if (
+            razao_tempo > 1 + args.tolerancia_tempo
+            and caso["tempo_s"] - anterior["tempo_s"] > args.minimo_tempo
+        ):
+            problemas.append("tempo")
+        if (
+            razao_memoria > 1 + args.tolerancia_memoria
+            and caso["pico_memoria_mb"] - anterior["pico_memoria_mb"]
+            > args.minimo_memoria
+        ):
+            problemas.append("memória")
+        regressoes += bool(problemas)
+        situacao = "REGRESSÃO (" + ", ".join(problemas) + ")" if problemas else "ok"
+        print(
+            f"{caso['algoritmo']:>15} {caso['gerador']:>16} {caso['tamanho']:8d} "
+            f"{razao_tempo:7.2f}x {razao_memoria:7.2f}x  {situacao}"
+        )
+
+    print(f"\n{regressoes} regressão(ões) encontrada(s)")
+    return 1 if regressoes else 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    executar = subparsers.add_parser("executar", help="roda a suíte")
+    executar.add_argument("--algoritmos", nargs="+", default=ALGORITMOS)
+    executar.add_argument("--geradores", nargs="+", default=list(GERADORES))
+    executar.add_argument(
+        "--tamanhos", type=int, nargs="+", default=[100, 1000, 10_000, 100_000]
+    )
+    executar.add_argument("--semente", type=int, default=42)
+    executar.add_argument("--repeticoes", type=int, default=3)
+    executar.add_argument(
+        "--limite-tempo",
+        type=float,
+        default=600,
+        help="tempo máximo de cada caso, em segundos",
+    )
+    executar.add_argument(
+        "--sem-limites",
+        action="store_true",
+        help="roda também os casos acima de LIMITES_ALGORITMO / LIMITES_GERADOR",
+    )
+    executar.add_argument("--saida", default="resultados_benchmark.json")
+
+    comparar = subparsers.add_parser("comparar", help="compara duas execuções")
+    comparar.add_argument("base")
+    comparar.add_argument("novo")
+    comparar.add_argument("--tolerancia-tempo", type=float, default=0.10)
+    comparar.add_argument("--tolerancia-memoria", type=float, default=0.10)
+    comparar.add_argument(
+        "--minimo-tempo",
+        type=float,
+        default=0.005,
+        help="diferença mínima de tempo (s) para acusar regressão",
+    )
+    comparar.add_argument(
+        "--minimo-memoria",
+        type=float,
+        default=5.0,
+        help="diferença mínima de memória (MB) para acusar regressão",
+    )
+
+    caso = subparsers.add_parser("caso", help="roda um único caso (uso interno)")
+    caso.add_argument("algoritmo", choices=ALGORITMOS)
+    caso.add_argument("gerador", choices=list(GERADORES))
+    caso.add_argument("tamanho", type=int)
+    caso.add_argument("--semente", type=int, default=42)
+    caso.add_argument("--repeticoes", type=int, default=3)
+
+    args = parser.parse_args()
+    if args.comando == "executar":
+        comando_executar(args)
+    elif args.comando == "comparar":
+        sys.exit(comando_comparar(args))
+    else:
+        resultado = executar_caso(
+            args.algoritmo, args.gerador, args.tamanho, args.semente, args.repeticoes
+        )
+        print(json.dumps(resultado))
+
+
+if __name__ == "__main__":
+    main()
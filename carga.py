@@ -0,0 +1,65 @@
+import csv
+import os
+import time
+
+
+def converter_custo(texto):
+    # Converte o custo lido do arquivo, mantendo inteiros como inteiros.
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def ler_arestas(fonte, separador=","):
+    # Percorre as arestas (nome1, nome2, custo) de fonte sem carregá-las todas
+    # na memória. fonte pode ser um iterável de tuplas ou o caminho de um
+    # arquivo CSV / lista de arestas (uma aresta por linha, campos separados
+    # por separador; com separador=None, por qualquer sequência de espaços).
+    # Linhas vazias, comentários (#) e um cabeçalho na primeira linha de
+    # dados são ignorados.
+    if not isinstance(fonte, (str, os.PathLike)):
+        yield from fonte
+        return
+
+    with open(fonte, newline="", encoding="utf-8") as arquivo:
+        if separador is None:
+            linhas = (linha.split() for linha in arquivo)
+        else:
+            linhas = csv.reader(arquivo, delimiter=separador)
+        primeira = True  # Ainda não apareceu nenhuma linha de dados
+        for numero, campos in enumerate(linhas, 1):
+            if not campos or campos[0].lstrip().startswith("#"):
+                continue
+            if len(campos) < 3:
+                raise ValueError(
+                    f"{fonte}, linha {numero}: esperados 3 campos "
+                    f"(nome1, nome2, custo), encontrados {len(campos)}"
+                )
+            nome1, nome2, custo = (campo.strip() for campo in campos[:3])
+            if not nome1 or not nome2:
+                raise ValueError(f"{fonte}, linha {numero}: nome vazio")
+            cabecalho, primeira = primeira, False
+            try:
+                custo = converter_custo(custo)
+            except ValueError:
+                if cabecalho:
+                    continue
+                raise ValueError(f"{fonte}, linha {numero}: custo inválido {custo!r}")
+            yield nome1, nome2, custo
+
+
+def carregar_arestas(fonte, adicionar, separador=","):
+    # Chama adicionar(nome1, nome2, custo) para cada aresta de fonte e retorna
+    # a vazão obtida: quantidade de arestas, segundos e arestas por segundo.
+    inicio = time.perf_counter()
+    quantidade = 0
+    for nome1, nome2, custo in ler_arestas(fonte, separador):
+        adicionar(nome1, nome2, custo)
+        quantidade += 1
+    segundos = time.perf_counter() - inicio
+    return {
+        "arestas": quantidade,
+        "segundos": segundos,
+        "arestas_por_segundo": quantidade / segundos if segundos > 0 else float("inf"),
+    }
@@ -0,0 +1,97 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+# Acima destes tamanhos, os rótulos deixam de ser desenhados: os dos vértices
+# somem e, nas arestas, só as destacadas (rota ou AGM) mantêm o seu, até este
+# mesmo limite. Com milhares de rótulos a figura fica ilegível e lenta.
+LIMITE_ROTULOS_VERTICES = 300
+LIMITE_ROTULOS_ARESTAS = 300
+
+
+def desenhar_grafo(
+    G,
+    pos,
+    destaque=(),
+    tamanho_vertice=300,
+    cor_vertice="#1f78b4",
+    tamanho_fonte=12,
+    negrito=False,
+    tamanho_fonte_arestas=10,
+    cor_destaque="crimson",
+    ax=None,
+):
+    # Desenha G nas posições pos com poucos artistas do matplotlib, em vez de
+    # um por vértice, aresta e rótulo como nx.draw: todas as arestas numa só
+    # LineCollection, todos os vértices num só scatter e as arestas de
+    # destaque (pares (u, v), como os trechos de uma rota ou as arestas de uma
+    # AGM) numa coleção extra, mais grossa, por cima das demais.
+    if ax is None:
+        # Como nx.draw: numa figura vazia, o desenho ocupa a figura inteira
+        figura = plt.gcf()
+        ax = figura.gca() if figura.axes else figura.add_axes((0, 0, 1, 1))
+
+    vertices = list(G.nodes)
+    coordenadas = np.array([pos[v] for v in vertices], dtype=float).reshape(-1, 2)
+    arestas = list(G.edges(data="weight"))
+    segmentos = np.array(
+        [(pos[u], pos[v]) for u, v, _ in arestas], dtype=float
+    ).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(segmentos, colors="black", zorder=1))
+
+    destacadas = {frozenset(par) for par in destaque}
+    if destacadas:
+        ax.add_collection(
+            LineCollection(
+                [(pos[u], pos[v]) for u, v in map(tuple, destacadas)],
+                colors=cor_destaque,
+                linewidths=4,
+                zorder=2,
+            )
+        )
+
+    ax.scatter(
+        coordenadas[:, 0],
+        coordenadas[:, 1],
+        s=tamanho_vertice,
+        c=cor_vertice,
+        zorder=3,
+        clip_on=False,  # Vértices grandes na borda não são cortados
+    )
+
+    peso_fonte = "bold" if negrito else "normal"
+    if len(vertices) <= LIMITE_ROTULOS_VERTICES:
+        for v, (x, y) in zip(vertices, coordenadas):
+            ax.text(
+                x,
+                y,
+                str(v),
+                fontsize=tamanho_fonte,
+                fontweight=peso_fonte,
+                ha="center",
+                va="center",
+                zorder=4,
+            )
+
+    if len(arestas) > LIMITE_ROTULOS_ARESTAS:
+        arestas = [a for a in arestas if frozenset(a[:2]) in destacadas]
+    caixa = {"boxstyle": "round", "ec": "white", "fc": "white"}
+    for u, v, peso in arestas[:LIMITE_ROTULOS_ARESTAS]:
+        if peso is None:
+            continue
+        x, y = (np.asarray(pos[u]) + np.asarray(pos[v])) / 2
+        ax.text(
+            x,
+            y,
+            str(peso),
+            fontsize=tamanho_fonte_arestas,
+            ha="center",
+            va="center",
+            bbox=caixa,
+            zorder=2,
+        )
+
+    ax.autoscale_view()
+    ax.margins(0.1)
+    ax.set_axis_off()
+    return ax
@@ -1,60 +1,402 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+import heapq
+from collections import OrderedDict
+from itertools import count
+
+from carga import carregar_arestas
+from grafo_binario import VerticesMapeados, carregar_grafo, salvar_grafo
+from grafo_compacto import GrafoCompacto
+from hierarquia_contracao import HierarquiaContracao
+
+
+class ArvoreCaminhos:
+    # Estado de uma busca de Dijkstra a partir de uma origem. A busca pode ser
+    # retomada depois: cidades já visitadas são respondidas sem nenhum trabalho
+    # e as demais continuam a expansão de onde ela parou.
+    def __init__(self, origem):
+        self.origem = origem
+        self.distancias = {origem: 0}  # Distâncias conhecidas (ausente = infinito)
+        self.predecessores = {}  # Para armazenar o caminho percorrido
+        self.visitados = set()  # Cidades com distância definitiva
+        # Desempate entre entradas de mesma distância, sem comparar as cidades
+        self.ordem = count()
+        # Fila de prioridade (distância, ordem, cidade)
+        self.fila = [(0, next(self.ordem), origem)]
+
+    def expandir_ate(self, vertices, destino):
+        # Continua o Dijkstra até que o destino tenha distância definitiva.
+        visitados = self.visitados
+        distancias = self.distancias
+        fila = self.fila
+        ordem = self.ordem
+
+        while destino not in visitados and fila:
+            # Retira a cidade com a menor distância conhecida
+            distancia_atual, _, cidade_atual = heapq.heappop(fila)
+            if cidade_atual in visitados:
+                continue  # Entrada obsoleta: a cidade já foi visitada
+            visitados.add(cidade_atual)  # Marca a cidade como visitada
+
+            for vizinho, distancia in vertices[cidade_atual].items():
+                nova_distancia = distancia_atual + distancia
+                if nova_distancia < distancias.get(
+                    vizinho, float("inf")
+                ):  # Se encontrarmos um caminho melhor
+                    distancias[vizinho] = nova_distancia
+                    self.predecessores[vizinho] = cidade_atual  # De onde viemos
+                    heapq.heappush(fila, (nova_distancia, next(ordem), vizinho))
+
+    def expandir_ate_instrumentado(self, vertices, destino, estatisticas):
+        # O mesmo laço de expandir_ate, contando o trabalho em estatisticas
+        # (ver instrumentacao.Estatisticas). Fica separado para que a busca
+        # sem estatísticas não pague nenhum contador.
+        visitados = self.visitados
+        distancias = self.distancias
+        fila = self.fila
+        ordem = self.ordem
+        assentados = relaxadas = melhorias = operacoes_heap = 0
+
+        while destino not in visitados and fila:
+            distancia_atual, _, cidade_atual = heapq.heappop(fila)
+            operacoes_heap += 1
+            if cidade_atual in visitados:
+                continue
+            visitados.add(cidade_atual)
+            assentados += 1
+
+            for vizinho, distancia in vertices[cidade_atual].items():
+                relaxadas += 1
+                nova_distancia = distancia_atual + distancia
+                if nova_distancia < distancias.get(vizinho, float("inf")):
+                    distancias[vizinho] = nova_distancia
+                    self.predecessores[vizinho] = cidade_atual
+                    heapq.heappush(fila, (nova_distancia, next(ordem), vizinho))
+                    melhorias += 1
+                    operacoes_heap += 1
+
+        estatisticas.somar(assentados, relaxadas, melhorias, operacoes_heap)
+
+    def completar(self, vertices):
+        # Continua o Dijkstra até esgotar as cidades alcançáveis: depois disso,
+        # distancias tem a distância definitiva de todas elas.
+        self.expandir_ate(vertices, object())  # Destino que nunca é alcançado
+
+    def caminho_ate(self, destino):
+        # Reconstrução do caminho
+        caminho = []
+        cidade_atual = destino
+        while cidade_atual in self.predecessores:
+            caminho.append(cidade_atual)
+            cidade_atual = self.predecessores[cidade_atual]
+        caminho.append(self.origem)
+        caminho.reverse()
+
+        return caminho, self.distancias.get(destino, float("inf"))
+
+
+def buscar_desvio(
+    vertices, desvio, partida, destino, ate_destino, proibidas, bloqueadas, limite
+):
+    # Busca de desvio do algoritmo de Yen: menor caminho de desvio até destino
+    # sem passar pelas cidades proibidas (a raiz da rota) e sem sair de desvio
+    # para as cidades bloqueadas (próximos trechos de rotas já aceitas).
+    # As distâncias partem de partida, a distância da raiz até o desvio.
+    # É um A* guiado por ate_destino, as distâncias exatas até o destino no
+    # grafo completo: retirar cidades e estradas só pode aumentá-las, então a
+    # estimativa nunca passa do custo real. A busca para ao alcançar o
+    # destino ou quando nenhum caminho restante pode custar menos que limite.
+    # Retorna (caminho, distancia) ou None.
+    infinito = float("inf")
+    distancias = {desvio: partida}
+    predecessores = {}
+    visitadas = set()
+    ordem = count()  # Desempate sem comparar as cidades
+    # (estimativa, distância, ordem, cidade)
+    fila = [(partida + ate_destino[desvio], partida, next(ordem), desvio)]
+
+    while fila:
+        estimativa, distancia_atual, _, cidade_atual = heapq.heappop(fila)
+        if estimativa >= limite:
+            return None  # Nenhum caminho restante fica abaixo do limite
+        if cidade_atual in visitadas:
+            continue  # Entrada obsoleta
+        if cidade_atual == destino:
+            caminho = [destino]
+            while caminho[-1] in predecessores:
+                caminho.append(predecessores[caminho[-1]])
+            caminho.reverse()
+            return caminho, distancia_atual
+        visitadas.add(cidade_atual)
+
+        for vizinho, distancia in vertices[cidade_atual].items():
+            if vizinho in proibidas or vizinho in visitadas:
+                continue
+            if cidade_atual == desvio and vizinho in bloqueadas:
+                continue
+            falta = ate_destino.get(vizinho)
+            if falta is None:
+                continue  # O destino não é alcançável a partir do vizinho
+            nova_distancia = distancia_atual + distancia
+            if nova_distancia < distancias.get(vizinho, infinito):
+                distancias[vizinho] = nova_distancia
+                predecessores[vizinho] = cidade_atual
+                heapq.heappush(
+                    fila, (nova_distancia + falta, nova_distancia, next(ordem), vizinho)
+                )
+
+    return None
 
 
 class GrafoPoderado:
-    def __init__(self):
+    def __init__(self, capacidade_cache=8):
         self.vertices = {}
+        self.hierarquia = None  # Hierarquia de contração (opcional)
+        # Cache LRU de árvores de caminhos mínimos, uma por origem
+        self.capacidade_cache = capacidade_cache
+        self.arvores = OrderedDict()
+        self.cache_acertos = 0  # Consultas atendidas por uma árvore já existente
+        self.cache_falhas = 0  # Consultas que precisaram iniciar uma nova árvore
+        self.cache_descartes = 0  # Árvores removidas por falta de espaço
+        self.cache_invalidacoes = 0  # Limpezas causadas por mudanças no grafo
 
     def adicionar_cidade(self, cidade):
         # Adiciona uma cidade ao grafo.
         if cidade not in self.vertices:
+            self.descongelar()
             self.vertices[cidade] = {}
+            self.invalidar_cache()
+            self.hierarquia = None  # O grafo mudou: a hierarquia não vale mais
 
     def adicionar_estrada(self, cidade1, cidade2, distancia):
         # Cria uma estrada (aresta) entre duas cidades (vértices) com um peso (distância).
+        self.descongelar()
         self.vertices[cidade1][cidade2] = distancia
         self.vertices[cidade2][cidade1] = distancia  # Grafo não direcionado
+        self.invalidar_cache()
+        self.hierarquia = None
 
-    def dijkstra(self, origem, destino):
-        # Encontra a menor rota entre duas cidades usando Dijkstra.
-        nao_visitados = list(self.vertices.keys())  # Lista de cidades não visitadas
-        distancias = {
-            cidade: float("inf") for cidade in self.vertices
-        }  # Inicializa todas as distâncias como infinito
-        distancias[origem] = 0  # A distância da origem para ela mesma é 0
-        predecessores = {}  # Para armazenar o caminho percorrido
-
-        while nao_visitados:
-            # Encontrar o nó com a menor distância conhecida
-            cidade_atual = min(nao_visitados, key=lambda cidade: distancias[cidade])
-
-            if distancias[cidade_atual] == float("inf"):
-                break  # Se a menor distância ainda for infinita, não há caminho viável
-
-            for vizinho, distancia in self.vertices[cidade_atual].items():
-                nova_distancia = distancias[cidade_atual] + distancia
-                if (
-                    nova_distancia < distancias[vizinho]
-                ):  # Se encontrarmos um caminho melhor
-                    distancias[vizinho] = nova_distancia
-                    predecessores[vizinho] = cidade_atual  # Armazena de onde viemos
+    def carregar_estradas(self, fonte, separador=","):
+        # Adiciona estradas em massa a partir de um iterável de (cidade1, cidade2,
+        # peso) ou de um arquivo CSV / lista de arestas, lido em fluxo, criando as
+        # cidades que ainda não existem. Retorna a vazão obtida (arestas por segundo).
+        def adicionar(cidade1, cidade2, peso):
+            self.adicionar_cidade(cidade1)
+            self.adicionar_cidade(cidade2)
+            self.adicionar_estrada(cidade1, cidade2, peso)
 
-            nao_visitados.remove(cidade_atual)  # Marca a cidade como visitada
+        return carregar_arestas(fonte, adicionar, separador)
 
-        # Reconstrução do caminho
-        caminho = []
-        cidade_atual = destino
-        while cidade_atual in predecessores:
-            caminho.append(cidade_atual)
-            cidade_atual = predecessores[cidade_atual]
-        caminho.append(origem)
-        caminho.reverse()
+    def salvar(self, caminho):
+        # Grava o grafo num arquivo binário compacto (tabela de nomes e vetores
+        # CSR contíguos, ver grafo_binario), que carregar abre sem reconstruí-lo.
+        compacto = self.compactar()
+        salvar_grafo(
+            caminho,
+            compacto.nomes,
+            compacto.deslocamentos,
+            compacto.destinos,
+            compacto.pesos,
+        )
+
+    @classmethod
+    def carregar(cls, caminho, capacidade_cache=8):
+        # Abre um grafo gravado por salvar mapeando o arquivo em memória: as
+        # consultas leem só as cidades que visitam, sem montar os dicionários.
+        # A primeira alteração (nova cidade ou estrada) copia o grafo para
+        # dicionários comuns.
+        mapa = cls(capacidade_cache)
+        mapa.vertices = VerticesMapeados(*carregar_grafo(caminho))
+        return mapa
+
+    def descongelar(self):
+        # Troca a vista de um grafo aberto por carregar por dicionários, que
+        # aceitam alterações. Não faz nada nos demais grafos.
+        if isinstance(self.vertices, VerticesMapeados):
+            self.vertices = self.vertices.para_dicionarios()
+
+    def invalidar_cache(self):
+        # Descarta as árvores em cache, pois o grafo foi alterado.
+        if self.arvores:
+            self.arvores.clear()
+            self.cache_invalidacoes += 1
+
+    def estatisticas_cache(self):
+        # Contadores para dimensionar a capacidade do cache.
+        return {
+            "capacidade": self.capacidade_cache,
+            "tamanho": len(self.arvores),
+            "acertos": self.cache_acertos,
+            "falhas": self.cache_falhas,
+            "descartes": self.cache_descartes,
+            "invalidacoes": self.cache_invalidacoes,
+        }
+
+    def arvore_caminhos(self, origem):
+        # Obtém a árvore de caminhos mínimos da origem, do cache se possível.
+        arvore = self.arvores.get(origem)
+        if arvore is not None:
+            self.cache_acertos += 1
+            self.arvores.move_to_end(origem)  # Marca como usada mais recentemente
+            return arvore
+
+        self.cache_falhas += 1
+        arvore = ArvoreCaminhos(origem)
+        if self.capacidade_cache > 0:
+            self.arvores[origem] = arvore
+            if len(self.arvores) > self.capacidade_cache:
+                self.arvores.popitem(last=False)  # Remove a menos usada
+                self.cache_descartes += 1
+        return arvore
+
+    def compactar(self):
+        # Congela o grafo numa forma compacta (CSR), com os nomes das cidades
+        # trocados por índices inteiros. Alterações posteriores no grafo não
+        # são refletidas: basta compactar de novo.
+        if isinstance(self.vertices, VerticesMapeados):
+            # Grafo aberto por carregar: os vetores já estão em CSR
+            return GrafoCompacto(list(self.vertices.nomes), *self.vertices.vetores())
+        return GrafoCompacto.a_partir_de_vertices(self.vertices)
+
+    def preprocessar_hierarquia(self):
+        # Constrói a hierarquia de contração usada por dijkstra_hierarquia.
+        # Ela vale enquanto o grafo não mudar: novas cidades ou arestas a descartam.
+        self.hierarquia = HierarquiaContracao.construir(self.compactar())
+        return self.hierarquia
+
+    def salvar_hierarquia(self, caminho):
+        # Grava a hierarquia de contração (construindo-a, se preciso).
+        if self.hierarquia is None:
+            self.preprocessar_hierarquia()
+        self.hierarquia.salvar(caminho)
 
-        return caminho, distancias[destino]
+    def carregar_hierarquia(self, caminho):
+        # Recarrega uma hierarquia gravada por salvar_hierarquia para este mesmo grafo.
+        compacto = self.compactar()
+        hierarquia = HierarquiaContracao.carregar(caminho, compacto.nomes)
+        if hierarquia.assinatura != HierarquiaContracao.assinar(compacto):
+            raise ValueError(f"A hierarquia em {caminho} foi gerada para outro grafo")
+        self.hierarquia = hierarquia
+
+    def dijkstra_hierarquia(self, origem, destino):
+        # Mesma resposta (caminho, distancia) de dijkstra, usando a hierarquia
+        # de contração. Se ainda não houver hierarquia, ela é construída aqui.
+        if self.hierarquia is None:
+            self.preprocessar_hierarquia()
+        return self.hierarquia.consultar(origem, destino)
+
+    def k_menores_rotas(self, origem, destino, k):
+        # Até k rotas sem ciclos de origem a destino, da menor para a maior, com
+        # o algoritmo de Yen: cada nova rota desvia de uma rota já aceita num
+        # ponto (desvio), mantendo o trecho anterior (raiz). Retorna uma lista
+        # de (caminho, distancia), como dijkstra.
+        # - A árvore de caminhos mínimos a partir do destino (do cache, se
+        #   houver) dá a primeira rota e as distâncias que guiam as buscas de
+        #   desvio (ver buscar_desvio). Cada busca de desvio parte da
+        #   distância acumulada da raiz, sem percorrê-la de novo.
+        # - Uma rota só desvia a partir do ponto em que ela mesma desviou da
+        #   rota que a gerou: os desvios anteriores já foram gerados antes.
+        # - As candidatas ficam numa fila de prioridade, sem repetições. Quando
+        #   já há candidatas suficientes para completar as k rotas, as buscas
+        #   de desvio desistem de caminhos mais caros que a pior delas.
+        if k <= 0 or origem not in self.vertices or destino not in self.vertices:
+            return []
+        arvore = self.arvore_caminhos(destino)
+        arvore.completar(self.vertices)
+        ate_destino = arvore.distancias
+        if origem not in ate_destino:
+            return []
+
+        caminho, _ = arvore.caminho_ate(origem)
+        caminho.reverse()  # A árvore vai do destino até a origem
+        # Distância somada no sentido da rota, como em dijkstra
+        distancia = sum(self.vertices[a][b] for a, b in zip(caminho, caminho[1:]))
+        aceitas = [(distancia, tuple(caminho), 0)]  # (distância, rota, desvio)
+        candidatas = []  # Fila de (distância, ordem, rota, desvio)
+        vistas = {tuple(caminho)}
+        ordem = count()  # Desempate estável entre candidatas de mesma distância
+
+        while len(aceitas) < k:
+            _, rota, inicio = aceitas[-1]
+            acumulado = [0]
+            for cidade1, cidade2 in zip(rota, rota[1:]):
+                acumulado.append(acumulado[-1] + self.vertices[cidade1][cidade2])
+
+            faltam = k - len(aceitas)
+            limite = float("inf")
+            if len(candidatas) >= faltam:
+                limite = heapq.nsmallest(faltam, candidatas)[-1][0]
+
+            for i in range(inicio, len(rota) - 1):
+                desvio = rota[i]
+                if acumulado[i] + ate_destino[desvio] >= limite:
+                    continue  # Nem o melhor desvio daqui fica abaixo do limite
+                raiz = rota[: i + 1]
+                bloqueadas = {
+                    aceita[i + 1]
+                    for _, aceita, _ in aceitas
+                    if len(aceita) > i + 1 and aceita[: i + 1] == raiz
+                }
+                encontrado = buscar_desvio(
+                    self.vertices,
+                    desvio,
+                    acumulado[i],
+                    destino,
+                    ate_destino,
+                    set(raiz[:-1]),
+                    bloqueadas,
+                    limite,
+                )
+                if encontrado is None:
+                    continue
+                trecho, distancia = encontrado
+                caminho = raiz[:-1] + tuple(trecho)
+                if caminho in vistas:
+                    continue
+                vistas.add(caminho)
+                heapq.heappush(candidatas, (distancia, next(ordem), caminho, i))
+                if len(candidatas) >= faltam:
+                    limite = heapq.nsmallest(faltam, candidatas)[-1][0]
+
+            if not candidatas:
+                break  # Não há mais rotas sem ciclos
+            distancia, _, caminho, desvio = heapq.heappop(candidatas)
+            aceitas.append((distancia, caminho, desvio))
+
+        return [(list(caminho), distancia) for distancia, caminho, _ in aceitas]
+
+    def dijkstra(self, origem, destino, estatisticas=None):
+        # Encontra a menor rota entre duas cidades usando Dijkstra com fila de prioridade.
+        # A busca para assim que o destino é visitado e fica guardada no cache,
+        # de modo que novas consultas da mesma origem reaproveitam a árvore.
+        # Com estatisticas (instrumentacao.Estatisticas), conta o trabalho da
+        # busca e mede as fases "cache", "busca" e "reconstrucao".
+        if origem not in self.vertices:
+            # Origem desconhecida: nenhuma cidade é alcançável a partir dela
+            return [origem], 0 if destino == origem else float("inf")
+        if estatisticas is None:
+            arvore = self.arvore_caminhos(origem)
+            arvore.expandir_ate(self.vertices, destino)
+            return arvore.caminho_ate(destino)
+
+        with estatisticas.fase("cache"):
+            arvore = self.arvore_caminhos(origem)
+        with estatisticas.fase("busca"):
+            arvore.expandir_ate_instrumentado(self.vertices, destino, estatisticas)
+        with estatisticas.fase("reconstrucao"):
+            resultado = arvore.caminho_ate(destino)
+        estatisticas.concluir("dijkstra")
+        return resultado
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
+
     mapa_cidades = GrafoPoderado()
     cidades = ["A", "B", "C", "D", "E", "F", "G"]
 
@@ -83,13 +425,25 @@ if __name__ == "__main__":
     print(f"Melhor rota de {origem} para {destino}: {' => '.join(rota)}")
     print(f"Distância total: {distancia} km")
 
-    G = nx.Graph()
-    G.add_nodes_from(cidades)
-    G.add_weighted_edges_from(estradas)
-    pos = nx.spring_layout(G)
-    nx.draw(G, pos, with_labels=True, node_size=800, font_size=10)
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels)
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
+
+        G = nx.Graph()
+        G.add_nodes_from(cidades)
+        G.add_weighted_edges_from(estradas)
+        pos = posicoes_em_cache(G, "ex1")  # Layout guardado em disco
+        desenhar_grafo(
+            G,
+            pos,
+            destaque=zip(rota, rota[1:]),
+            tamanho_vertice=800,
+            tamanho_fonte=10,
+        )
 
-    plt.title("Representação Gráfica do Grafo")
-    plt.savefig("ex1.png", bbox_inches="tight")
+        plt.title("Representação Gráfica do Grafo")
+        plt.savefig("ex1.png", bbox_inches="tight")
@@ -1,63 +1,150 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+from collections import defaultdict
+
+import numpy as np
+
+from agm import (
+    AGMDinamica,
+    ResultadoAGM,
+    arvore_geradora_minima,
+    congelar_armazenamento,
+    custos_informados,
+    descongelar_csr,
+    escrever_agm,
+)
+from carga import carregar_arestas
+from grafo_binario import carregar_grafo, salvar_grafo
+from instrumentacao import fase
 
 
 class GrafoAlgoritmoPrim:
-    def __init__(self, torres):
+    def __init__(self, torres, armazenamento="esparsa"):
         self.torres = torres  # Lista de torres de comunicação
         self.V = len(torres)  # Número de torres
-        self.grafo = [[0] * self.V for _ in range(self.V)]  # Matriz de custos
+        self.indices = {nome: i for i, nome in enumerate(torres)}  # Nome -> índice
+        # "matriz": matriz V x V; "lista": listas de adjacência ({vizinho: custo});
+        # "arestas": custo de cada aresta por par (u, v), com u < v, listado
+        # para o Kruskal na hora do prim;
+        # "densa": matriz NumPy V x V, para o Prim vetorizado em grafos densos;
+        # "esparsa": dicionário de dicionários que só guarda as conexões
+        # existentes, congelado em linhas comprimidas (CSR) na hora do prim;
+        # "csr": os vetores CSR de um grafo aberto por carregar (só leitura)
+        self.armazenamento = armazenamento
+        if armazenamento == "matriz":
+            self.grafo = [[0] * self.V for _ in range(self.V)]  # Matriz de custos
+        elif armazenamento == "lista":
+            self.grafo = [{} for _ in range(self.V)]  # Listas de adjacência
+        elif armazenamento == "arestas":
+            self.grafo = {}  # Arestas: {(u, v): custo}, com u < v
+        elif armazenamento == "densa":
+            self.grafo = np.zeros((self.V, self.V))  # Matriz de custos NumPy
+        elif armazenamento == "esparsa":
+            self.grafo = defaultdict(dict)  # Só as conexões: {u: {v: custo}}
+        else:
+            raise ValueError(f"Armazenamento desconhecido: {armazenamento}")
+        self.agm = None  # AGM mantida entre chamadas de prim (AGMDinamica)
 
     def adicionar_conexao(self, torre1, torre2, custo):
         # Adiciona uma conexão entre duas torres com seu custo
-        u = self.torres.index(torre1)
-        v = self.torres.index(torre2)
-        self.grafo[u][v] = custo
-        self.grafo[v][u] = custo  # Grafo não direcionado
-
-    def prim(self):
-        # Executa o algoritmo de Prim para encontrar a Árvore Geradora Mínima.
-        infinito = float("inf")
-        selecionado = [False] * self.V
-        custo_minimo = [infinito] * self.V
-        origem = [-1] * self.V  # Armazena a estrutura da AGM
-
-        # Começa pela primeira torre
-        custo_minimo[0] = 0
-
-        for _ in range(self.V):
-            # Escolhe a torre de menor custo que ainda não foi incluída na AGM
-            min_custo = infinito
-            torre_atual = -1
-            for v in range(self.V):
-                if not selecionado[v] and custo_minimo[v] < min_custo:
-                    min_custo = custo_minimo[v]
-                    torre_atual = v
-
-            selecionado[torre_atual] = True
-
-            # Atualiza os custos mínimos para as torres vizinhas
-            for v in range(self.V):
-                if (
-                    0 < self.grafo[torre_atual][v] < custo_minimo[v]
-                    and not selecionado[v]
-                ):
-                    custo_minimo[v] = self.grafo[torre_atual][v]
-                    origem[v] = torre_atual
-
-        # Exibindo a Árvore Geradora Mínima
-        print("Plano de Expansão da Infraestrutura de Telefonia (Custo Mínimo):")
-        custo_total = 0
-        for i in range(1, self.V):
-            torre_origem = self.torres[origem[i]]
-            torre_destino = self.torres[i]
-            custo = self.grafo[i][origem[i]]
-            print(f"\t{torre_origem} → {torre_destino} (Custo: R$ {custo} mihões)")
-            custo_total += custo
-        print(f"\nCusto total do projeto: R$ {custo_total} milhões")
+        u = self.indices[torre1]
+        v = self.indices[torre2]
+        if custo <= 0:
+            # Na matriz, custo <= 0 marca a ausência de conexão
+            raise ValueError(f"Custo de conexão inválido: {custo!r}")
+        if self.armazenamento == "csr":
+            self.descongelar()
+        if self.armazenamento == "arestas":
+            self.grafo[min(u, v), max(u, v)] = custo  # Substitui o custo anterior
+        else:
+            self.grafo[u][v] = custo
+            self.grafo[v][u] = custo  # Grafo não direcionado
+        # Atualiza a AGM já calculada em O(V), em vez de recalculá-la no prim
+        if self.agm is not None and not self.agm.atualizar(u, v, custo):
+            self.agm = None  # Uma aresta da árvore ficou mais cara: recalcula
+
+    def carregar_conexoes(self, fonte, separador=","):
+        # Adiciona conexões em massa a partir de um iterável de
+        # (torre1, torre2, custo) ou de um arquivo CSV / lista de arestas,
+        # lido em fluxo. Retorna a vazão obtida (arestas por segundo).
+        return carregar_arestas(fonte, self.adicionar_conexao, separador)
+
+    def salvar(self, caminho):
+        # Grava o grafo num arquivo binário compacto (tabela de nomes e vetores
+        # CSR contíguos, ver grafo_binario), qualquer que seja o armazenamento.
+        salvar_grafo(
+            caminho,
+            self.torres,
+            *congelar_armazenamento(self.grafo, self.V, self.armazenamento),
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        # Abre um grafo gravado por salvar mapeando o arquivo em memória, no
+        # armazenamento "csr": o prim usa os vetores direto do arquivo e os
+        # nomes só são decodificados quando exibidos.
+        nomes, deslocamentos, destinos, pesos = carregar_grafo(caminho)
+        grafo = cls.__new__(cls)
+        grafo.torres = nomes
+        grafo.V = len(nomes)
+        grafo.indices = nomes.indices  # Montado só na primeira consulta
+        grafo.armazenamento = "csr"
+        grafo.grafo = (deslocamentos, destinos, pesos)
+        grafo.agm = None
+        return grafo
+
+    def descongelar(self):
+        # Passa um grafo aberto por carregar para o armazenamento "esparsa",
+        # que aceita novas conexões.
+        self.grafo = descongelar_csr(*self.grafo)
+        self.armazenamento = "esparsa"
+
+    def prim(self, motor=None, estatisticas=None):
+        # Executa o algoritmo de Prim para encontrar a Árvore Geradora Mínima e
+        # a devolve como ResultadoAGM (origem, custos e total).
+        # motor: "matriz" (Prim em O(V²)), "numpy" (o mesmo, vetorizado),
+        # "heap" (Prim em O(E log V)), "kruskal" (O(E log E)) ou None para
+        # escolher pelo tamanho do grafo. Sem motor, reaproveita a AGM mantida
+        # por adicionar_conexao desde o último cálculo.
+        # Com estatisticas (instrumentacao.Estatisticas), conta o trabalho do
+        # motor e mede as fases do cálculo (ver arvore_geradora_minima).
+        if motor is not None or self.agm is None:
+            origem, custos = arvore_geradora_minima(
+                self.grafo, self.V, self.armazenamento, motor, estatisticas
+            )
+            self.agm = AGMDinamica(origem, custos)
+        else:
+            with fase(estatisticas, "exportar"):
+                origem, custos = self.agm.exportar()
+        with fase(estatisticas, "resultado"):
+            custos = custos_informados(self.grafo, self.armazenamento, origem, custos)
+            resultado = ResultadoAGM(origem, custos)
+        if estatisticas is not None:
+            estatisticas.concluir("prim")
+        return resultado
+
+    def exibir_agm(self, resultado, arquivo=None, formato="texto"):
+        # Escreve a AGM devolvida por prim em blocos, na saída padrão ou em
+        # arquivo: "texto" (relatório do plano), "csv" ou "binario".
+        escrever_agm(
+            resultado,
+            self.torres,
+            arquivo,
+            formato,
+            cabecalho="Plano de Expansão da Infraestrutura de Telefonia (Custo Mínimo):\n",
+            linha="\t{origem} → {destino} (Custo: R$ {custo} mihões)\n",
+            rodape="\nCusto total do projeto: R$ {total} milhões\n",
+        )
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
+
     torres = [
         "Torre A",
         "Torre B",
@@ -86,27 +173,37 @@ if __name__ == "__main__":
     for torre1, torre2, custo in conexoes:
         infraestrutura.adicionar_conexao(torre1, torre2, custo)
 
-    infraestrutura.prim()
-
-    G = nx.Graph()
-    G.add_nodes_from(torres)
-    G.add_weighted_edges_from(conexoes)
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=5000,
-        node_color="Lavender",
-        font_weight="bold",
-        font_size=12,
-    )
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=14)
-
-    plt.title(
-        "Plano de Expansão das Torres de Telefonia",
-        fontsize=16,
-    )
-    plt.savefig("ex11.png", bbox_inches="tight")
+    resultado = infraestrutura.prim()
+    infraestrutura.exibir_agm(resultado)
+
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
+
+        G = nx.Graph()
+        G.add_nodes_from(torres)
+        G.add_weighted_edges_from(conexoes)
+        pos = posicoes_em_cache(G, "ex11", seed=42)  # Layout guardado em disco
+        plt.figure(figsize=(10, 8))
+        # Arestas da AGM, destacadas no desenho
+        arestas_agm = [(torres[u], torres[v]) for u, v, _ in resultado.arestas()]
+        desenhar_grafo(
+            G,
+            pos,
+            destaque=arestas_agm,
+            tamanho_vertice=5000,
+            cor_vertice="Lavender",
+            tamanho_fonte=12,
+            negrito=True,
+            tamanho_fonte_arestas=14,
+        )
+
+        plt.title(
+            "Plano de Expansão das Torres de Telefonia",
+            fontsize=16,
+        )
+        plt.savefig("ex11.png", bbox_inches="tight")
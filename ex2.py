@@ -1,46 +1,101 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+import heapq
+from itertools import count
+
+from carga import carregar_arestas
+from grafo_compacto import GrafoCompacto
+from hierarquia_contracao import HierarquiaContracao
 
 
 class GrafoPoderado:
     def __init__(self):
         self.vertices = {}
+        self.hierarquia = None  # Hierarquia de contração (opcional)
 
     def adicionar_bairro(self, bairro):
         # Adiciona um bairro ao grafo.
         if bairro not in self.vertices:
             self.vertices[bairro] = {}
+            self.hierarquia = None  # O grafo mudou: a hierarquia não vale mais
 
     def adicionar_rua(self, bairro1, bairro2, distancia):
         # Cria uma rua (aresta) entre dois bairros (vértices) com um peso (distância).
         self.vertices[bairro1][bairro2] = distancia
         self.vertices[bairro2][bairro1] = distancia  # Grafo não direcionado
+        self.hierarquia = None
+
+    def carregar_ruas(self, fonte, separador=","):
+        # Adiciona ruas em massa a partir de um iterável de (bairro1, bairro2, peso)
+        # ou de um arquivo CSV / lista de arestas, lido em fluxo, criando os bairros
+        # que ainda não existem. Retorna a vazão obtida (arestas por segundo).
+        def adicionar(bairro1, bairro2, peso):
+            self.adicionar_bairro(bairro1)
+            self.adicionar_bairro(bairro2)
+            self.adicionar_rua(bairro1, bairro2, peso)
+
+        return carregar_arestas(fonte, adicionar, separador)
+
+    def compactar(self):
+        # Congela o grafo numa forma compacta (CSR), com os nomes dos bairros
+        # trocados por índices inteiros. Alterações posteriores no grafo não
+        # são refletidas: basta compactar de novo.
+        return GrafoCompacto.a_partir_de_vertices(self.vertices)
+
+    def preprocessar_hierarquia(self):
+        # Constrói a hierarquia de contração usada por dijkstra_hierarquia.
+        # Ela vale enquanto o grafo não mudar: novas bairros ou arestas a descartam.
+        self.hierarquia = HierarquiaContracao.construir(self.compactar())
+        return self.hierarquia
+
+    def salvar_hierarquia(self, caminho):
+        # Grava a hierarquia de contração (construindo-a, se preciso).
+        if self.hierarquia is None:
+            self.preprocessar_hierarquia()
+        self.hierarquia.salvar(caminho)
+
+    def carregar_hierarquia(self, caminho):
+        # Recarrega uma hierarquia gravada por salvar_hierarquia para este mesmo grafo.
+        compacto = self.compactar()
+        hierarquia = HierarquiaContracao.carregar(caminho, compacto.nomes)
+        if hierarquia.assinatura != HierarquiaContracao.assinar(compacto):
+            raise ValueError(f"A hierarquia em {caminho} foi gerada para outro grafo")
+        self.hierarquia = hierarquia
+
+    def dijkstra_hierarquia(self, origem, destino):
+        # Mesma resposta (caminho, distancia) de dijkstra, usando a hierarquia
+        # de contração. Se ainda não houver hierarquia, ela é construída aqui.
+        if self.hierarquia is None:
+            self.preprocessar_hierarquia()
+        return self.hierarquia.consultar(origem, destino)
 
     def dijkstra(self, origem, destino):
-        # Encontra a menor rota entre dois bairros usando Dijkstra.
-        nao_visitados = list(self.vertices.keys())  # Lista de bairros não visitadas
-        distancias = {
-            bairro: float("inf") for bairro in self.vertices
-        }  # Inicializa todas as distâncias como infinito
-        distancias[origem] = 0  # A distância da origem para ela mesma é 0
+        # Encontra a menor rota entre dois bairros usando Dijkstra com fila de prioridade.
+        distancias = {origem: 0}  # Distâncias conhecidas (ausente = infinito)
         predecessores = {}  # Para armazenar o caminho percorrido
-
-        while nao_visitados:
-            # Encontrar o nó com a menor distância conhecida
-            bairro_atual = min(nao_visitados, key=lambda bairro: distancias[bairro])
-
-            if distancias[bairro_atual] == float("inf"):
-                break  # Se a menor distância ainda for infinita, não há caminho viável
+        visitados = set()  # Bairros com distância definitiva
+        ordem = count()  # Desempate entre entradas de mesma distância
+        # Fila de prioridade (distância, ordem, bairro), vazia se a origem não
+        # está no grafo
+        fila = [(0, next(ordem), origem)] if origem in self.vertices else []
+
+        while fila:
+            # Retira o bairro com a menor distância conhecida
+            distancia_atual, _, bairro_atual = heapq.heappop(fila)
+            if bairro_atual in visitados:
+                continue  # Entrada obsoleta: o bairro já foi visitado
+            visitados.add(bairro_atual)  # Marca o bairro como visitado
+
+            if bairro_atual == destino:
+                break  # A distância até o destino já é definitiva
 
             for vizinho, distancia in self.vertices[bairro_atual].items():
-                nova_distancia = distancias[bairro_atual] + distancia
-                if (
-                    nova_distancia < distancias[vizinho]
+                nova_distancia = distancia_atual + distancia
+                if nova_distancia < distancias.get(
+                    vizinho, float("inf")
                 ):  # Se encontrarmos um caminho melhor
                     distancias[vizinho] = nova_distancia
                     predecessores[vizinho] = bairro_atual  # Armazena de onde viemos
-
-            nao_visitados.remove(bairro_atual)  # Marca o bairro como visitado
+                    heapq.heappush(fila, (nova_distancia, next(ordem), vizinho))
 
         # Reconstrução do caminho
         caminho = []
@@ -51,10 +106,18 @@ class GrafoPoderado:
         caminho.append(origem)
         caminho.reverse()
 
-        return caminho, distancias[destino]
+        return caminho, distancias.get(destino, float("inf"))
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
+
     mapa_bairros = GrafoPoderado()
     bairros = [
         "BAIRRO A",
@@ -91,21 +154,28 @@ if __name__ == "__main__":
     print(f"Melhor rota de {origem} para {destino}: {' => '.join(rota)}")
     print(f"Distância total: {distancia} km")
 
-    G = nx.Graph()
-    G.add_nodes_from(bairros)
-    G.add_weighted_edges_from(ruas)
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=3000,
-        node_color="lightgreen",
-        font_size=11,
-    )
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=14)
-
-    plt.title("Representação Gráfica do Grafo dos Bairros e Ruas", fontsize=16)
-    plt.savefig("ex2.png", bbox_inches="tight")
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
+
+        G = nx.Graph()
+        G.add_nodes_from(bairros)
+        G.add_weighted_edges_from(ruas)
+        pos = posicoes_em_cache(G, "ex2", seed=42)  # Layout guardado em disco
+        plt.figure(figsize=(10, 8))
+        desenhar_grafo(
+            G,
+            pos,
+            destaque=zip(rota, rota[1:]),
+            tamanho_vertice=3000,
+            cor_vertice="lightgreen",
+            tamanho_fonte=11,
+            tamanho_fonte_arestas=14,
+        )
+
+        plt.title("Representação Gráfica do Grafo dos Bairros e Ruas", fontsize=16)
+        plt.savefig("ex2.png", bbox_inches="tight")
@@ -1,46 +1,94 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+import heapq
+import math
+from itertools import count
+
+from carga import carregar_arestas
+from grafo_compacto import GrafoCompacto
+
+RAIO_TERRA_KM = 6371.0
+
+
+def distancia_ortodromica(lat1, lon1, lat2, lon2):
+    # Distância do grande círculo (fórmula de haversine) entre dois pontos, em km.
+    fi1, fi2 = math.radians(lat1), math.radians(lat2)
+    delta_fi = fi2 - fi1
+    delta_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(delta_fi / 2) ** 2
+        + math.cos(fi1) * math.cos(fi2) * math.sin(delta_lambda / 2) ** 2
+    )
+    return 2 * RAIO_TERRA_KM * math.asin(math.sqrt(min(1.0, a)))
 
 
 class GrafoPoderado:
     def __init__(self):
         self.vertices = {}
+        self.coordenadas = {}  # Aeroporto -> (latitude, longitude)
+        self.escala_heuristica = None  # Calculada sob demanda pelo A*
+        self.aeroportos_assentados = 0  # Aeroportos finalizados na última busca
 
-    def adicionar_aeroporto(self, aeroporto):
-        # Adiciona um aeroporto ao grafo.
+    def adicionar_aeroporto(self, aeroporto, latitude=None, longitude=None):
+        # Adiciona um aeroporto ao grafo, opcionalmente com suas coordenadas geográficas.
         if aeroporto not in self.vertices:
             self.vertices[aeroporto] = {}
+        if latitude is not None and longitude is not None:
+            self.coordenadas[aeroporto] = (latitude, longitude)
+        self.escala_heuristica = None  # O grafo mudou: recalcular a escala
 
     def adicionar_linha(self, aero1, aero2, distancia):
         # Cria uma linha/viagem (aresta) entre dois aeroportos (vértices) com um peso (distância).
         self.vertices[aero1][aero2] = distancia
         self.vertices[aero2][aero1] = distancia  # Grafo não direcionado
+        self.escala_heuristica = None  # O grafo mudou: recalcular a escala
+
+    def carregar_linhas(self, fonte, separador=","):
+        # Adiciona linhas em massa a partir de um iterável de (aero1, aero2, peso) ou
+        # de um arquivo CSV / lista de arestas, lido em fluxo, criando os aeroportos
+        # que ainda não existem. Retorna a vazão obtida (arestas por segundo).
+        def adicionar(aero1, aero2, peso):
+            self.adicionar_aeroporto(aero1)
+            self.adicionar_aeroporto(aero2)
+            self.adicionar_linha(aero1, aero2, peso)
+
+        return carregar_arestas(fonte, adicionar, separador)
+
+    def compactar(self):
+        # Congela o grafo numa forma compacta (CSR), com os nomes dos aeroportos
+        # trocados por índices inteiros. Alterações posteriores no grafo não
+        # são refletidas: basta compactar de novo.
+        return GrafoCompacto.a_partir_de_vertices(self.vertices)
 
     def dijkstra(self, origem, destino):
-        # Encontra a menor rota entre dois aeroportos usando Dijkstra.
-        nao_visitados = list(self.vertices.keys())  # Lista de aeroportos não visitadas
-        distancias = {
-            aeroporto: float("inf") for aeroporto in self.vertices
-        }  # Inicializa todas as distâncias como infinito
-        distancias[origem] = 0  # A distância da origem para ela mesma é 0
+        # Encontra a menor rota entre dois aeroportos usando Dijkstra com fila de prioridade.
+        distancias = {origem: 0}  # Distâncias conhecidas (ausente = infinito)
         predecessores = {}  # Para armazenar o caminho percorrido
+        visitados = set()  # Aeroportos com distância definitiva
+        ordem = count()  # Desempate entre entradas de mesma distância
+        # Fila de prioridade (distância, ordem, aeroporto), vazia se a origem
+        # não está no grafo
+        fila = [(0, next(ordem), origem)] if origem in self.vertices else []
 
-        while nao_visitados:
-            # Encontrar o nó com a menor distância conhecida
-            aero_atual = min(nao_visitados, key=lambda aero: distancias[aero])
+        while fila:
+            # Retira o aeroporto com a menor distância conhecida
+            distancia_atual, _, aero_atual = heapq.heappop(fila)
+            if aero_atual in visitados:
+                continue  # Entrada obsoleta: o aeroporto já foi visitado
+            visitados.add(aero_atual)  # Marca o aeroporto como visitado
 
-            if distancias[aero_atual] == float("inf"):
-                break  # Se a menor distância ainda for infinita, não há caminho viável
+            if aero_atual == destino:
+                break  # A distância até o destino já é definitiva
 
             for vizinho, distancia in self.vertices[aero_atual].items():
-                nova_distancia = distancias[aero_atual] + distancia
-                if (
-                    nova_distancia < distancias[vizinho]
+                nova_distancia = distancia_atual + distancia
+                if nova_distancia < distancias.get(
+                    vizinho, float("inf")
                 ):  # Se encontrarmos um caminho melhor
                     distancias[vizinho] = nova_distancia
                     predecessores[vizinho] = aero_atual  # Armazena de onde viemos
+                    heapq.heappush(fila, (nova_distancia, next(ordem), vizinho))
 
-            nao_visitados.remove(aero_atual)  # Marca o aeroporto como visitado
+        self.aeroportos_assentados = len(visitados)
 
         # Reconstrução do caminho
         caminho = []
@@ -51,15 +99,122 @@ class GrafoPoderado:
         caminho.append(origem)
         caminho.reverse()
 
-        return caminho, distancias[destino]
+        return caminho, distancias.get(destino, float("inf"))
+
+    def calcular_escala_heuristica(self):
+        # Converte km do grande círculo em unidades de peso das linhas.
+        # A escala é o menor peso/km entre todas as linhas, de modo que
+        # escala * distância ortodrômica nunca supera o custo real de um trecho.
+        # Assim a heurística é consistente mesmo que os pesos não estejam em km.
+        # Se algum aeroporto não tiver coordenadas, a escala é 0 (A* = Dijkstra).
+        if len(self.coordenadas) < len(self.vertices):
+            return 0.0
+
+        escala = float("inf")
+        for aero1, vizinhos in self.vertices.items():
+            lat1, lon1 = self.coordenadas[aero1]
+            for aero2, distancia in vizinhos.items():
+                km = distancia_ortodromica(lat1, lon1, *self.coordenadas[aero2])
+                if km > 0:
+                    escala = min(escala, distancia / km)
+
+        if escala == float("inf"):
+            return 0.0
+        return escala * (1 - 1e-9)  # Margem contra erros de arredondamento
+
+    def a_estrela(self, origem, destino):
+        # Encontra a menor rota entre dois aeroportos usando A*, com a distância
+        # do grande círculo até o destino como estimativa (limite inferior).
+        if self.escala_heuristica is None:
+            self.escala_heuristica = self.calcular_escala_heuristica()
+        escala = self.escala_heuristica
+        lat_destino, lon_destino = self.coordenadas.get(destino, (0.0, 0.0))
+
+        estimativas = {}  # Heurística já calculada para cada aeroporto
+
+        def estimativa(aero):
+            if escala == 0:
+                return 0
+            if aero not in estimativas:
+                lat, lon = self.coordenadas[aero]
+                estimativas[aero] = escala * distancia_ortodromica(
+                    lat, lon, lat_destino, lon_destino
+                )
+            return estimativas[aero]
+
+        distancias = {origem: 0}  # Distâncias conhecidas (ausente = infinito)
+        predecessores = {}  # Para armazenar o caminho percorrido
+        visitados = set()  # Aeroportos com distância definitiva
+        ordem = count()  # Desempate entre entradas de mesma prioridade
+        # Fila de prioridade (distância + estimativa, ordem, aeroporto), vazia
+        # se a origem não está no grafo
+        fila = []
+        if origem in self.vertices:
+            fila.append((estimativa(origem), next(ordem), origem))
+
+        while fila:
+            # Retira o aeroporto com a menor distância + estimativa até o destino
+            _, _, aero_atual = heapq.heappop(fila)
+            if aero_atual in visitados:
+                continue  # Entrada obsoleta: o aeroporto já foi visitado
+            visitados.add(aero_atual)  # Marca o aeroporto como visitado
+
+            if aero_atual == destino:
+                break  # A distância até o destino já é definitiva
+
+            distancia_atual = distancias[aero_atual]
+            for vizinho, distancia in self.vertices[aero_atual].items():
+                nova_distancia = distancia_atual + distancia
+                if nova_distancia < distancias.get(vizinho, float("inf")):
+                    distancias[vizinho] = nova_distancia
+                    predecessores[vizinho] = aero_atual  # Armazena de onde viemos
+                    heapq.heappush(
+                        fila,
+                        (nova_distancia + estimativa(vizinho), next(ordem), vizinho),
+                    )
+
+        self.aeroportos_assentados = len(visitados)
+
+        # Reconstrução do caminho
+        caminho = []
+        aero_atual = destino
+        while aero_atual in predecessores:
+            caminho.append(aero_atual)
+            aero_atual = predecessores[aero_atual]
+        caminho.append(origem)
+        caminho.reverse()
+
+        return caminho, distancias.get(destino, float("inf"))
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
+
     mapa_aeroportos = GrafoPoderado()
     aeroportos = ["GRU", "FLN", "CGH", "BSB", "GIG", "SSA", "CWB", "POA", "REC", "CAC"]
 
+    # Coordenadas aproximadas (latitude, longitude) de cada aeroporto
+    coordenadas = {
+        "GRU": (-23.4356, -46.4731),
+        "FLN": (-27.6703, -48.5525),
+        "CGH": (-23.6261, -46.6564),
+        "BSB": (-15.8711, -47.9186),
+        "GIG": (-22.8100, -43.2506),
+        "SSA": (-12.9086, -38.3225),
+        "CWB": (-25.5317, -49.1758),
+        "POA": (-29.9939, -51.1711),
+        "REC": (-8.1264, -34.9236),
+        "CAC": (-25.0003, -53.5008),
+    }
+
     for aero in aeroportos:
-        mapa_aeroportos.adicionar_aeroporto(aero)
+        mapa_aeroportos.adicionar_aeroporto(aero, *coordenadas[aero])
 
     linhas = [
         ("GRU", "FLN", 5),
@@ -87,23 +242,38 @@ if __name__ == "__main__":
 
     print(f"Melhor rota de {origem} para {destino}: {' => '.join(rota)}")
     print(f"Distância total: {distancia*100} km")
+    assentados_dijkstra = mapa_aeroportos.aeroportos_assentados
 
-    G = nx.Graph()
-    G.add_nodes_from(aeroportos)
-    G.add_weighted_edges_from(linhas)
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=1000,
-        node_color="skyblue",
-        font_weight="bold",
-        font_size=12,
+    rota_a, distancia_a = mapa_aeroportos.a_estrela(origem, destino)
+    print(f"Melhor rota (A*) de {origem} para {destino}: {' => '.join(rota_a)}")
+    print(
+        f"Aeroportos assentados: Dijkstra = {assentados_dijkstra}, "
+        f"A* = {mapa_aeroportos.aeroportos_assentados}"
     )
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=14)
 
-    plt.title("Representação Gráfica dos Aeroportos e Linhas", fontsize=16)
-    plt.savefig("ex3.png", bbox_inches="tight")
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
+
+        G = nx.Graph()
+        G.add_nodes_from(aeroportos)
+        G.add_weighted_edges_from(linhas)
+        pos = posicoes_em_cache(G, "ex3", seed=42)  # Layout guardado em disco
+        plt.figure(figsize=(10, 8))
+        desenhar_grafo(
+            G,
+            pos,
+            destaque=zip(rota, rota[1:]),
+            tamanho_vertice=1000,
+            cor_vertice="skyblue",
+            tamanho_fonte=12,
+            negrito=True,
+            tamanho_fonte_arestas=14,
+        )
+
+        plt.title("Representação Gráfica dos Aeroportos e Linhas", fontsize=16)
+        plt.savefig("ex3.png", bbox_inches="tight")
@@ -1,5 +1,89 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, repeat
+
+import numpy as np
+
+from carga import carregar_arestas
+from grafo_compacto import GrafoCompacto
+
+# Sem processos explícito, matriz_distancias só distribui as origens entre
+# processos a partir deste número de pares origem x cidade do grafo. Abaixo
+# dele, iniciar o pool e enviar o grafo a cada trabalhador custa mais do que
+# as buscas (100 x 100 cidades levam ~0,04 s em série).
+LIMITE_PARALELO = 250_000
+
+
+def buscar_custos(vertices, origem, destinos=None):
+    # Dijkstra com fila de prioridade a partir de uma origem. Para assim que
+    # todos os destinos pedidos tiverem custo definitivo (ou percorre o grafo
+    # inteiro, se destinos for None).
+    custos = {origem: 0}  # Custos conhecidos (ausente = infinito)
+    predecessores = {}  # Para armazenar o trajeto percorrido
+    visitados = set()  # Cidades com custo definitivo
+    ordem = count()  # Desempate entre entradas de mesmo custo
+    # Fila de prioridade (custo, ordem, cidade), vazia se a origem não está no
+    # grafo
+    fila = [(0, next(ordem), origem)] if origem in vertices else []
+    pendentes = None if destinos is None else set(destinos)
+
+    while fila:
+        # Retira a cidade com o menor custo conhecido
+        custo_atual, _, cidade_atual = heapq.heappop(fila)
+        if cidade_atual in visitados:
+            continue  # Entrada obsoleta: a cidade já foi visitada
+        visitados.add(cidade_atual)  # Marca a cidade como visitada
+
+        if pendentes is not None:
+            pendentes.discard(cidade_atual)
+            if not pendentes:
+                break  # O custo até todos os destinos já é definitivo
+
+        for vizinho, custo in vertices[cidade_atual].items():
+            novo_trajeto = custo_atual + custo
+            if novo_trajeto < custos.get(vizinho, float("inf")):
+                custos[vizinho] = novo_trajeto  # Encontramos um caminho melhor
+                predecessores[vizinho] = cidade_atual  # Armazena de onde viemos
+                heapq.heappush(fila, (novo_trajeto, next(ordem), vizinho))
+
+    return custos, predecessores
+
+
+def reconstruir_trajeto(predecessores, origem, destino):
+    # Reconstrução do trajeto
+    trajeto = []
+    cidade_atual = destino
+    while cidade_atual in predecessores:
+        trajeto.append(cidade_atual)
+        cidade_atual = predecessores[cidade_atual]
+    trajeto.append(origem)
+    trajeto.reverse()
+    return trajeto
+
+
+# Grafo usado pelos processos trabalhadores de matriz_distancias. É enviado
+# uma única vez para cada processo, no inicializador do pool.
+vertices_trabalhador = None
+
+
+def iniciar_trabalhador(vertices):
+    global vertices_trabalhador
+    vertices_trabalhador = vertices
+
+
+def linha_matriz(origem, destinos, com_trajetos):
+    # Calcula uma linha da matriz: os custos (e trajetos) de uma origem.
+    custos, predecessores = buscar_custos(vertices_trabalhador, origem, destinos)
+    linha = [custos.get(destino, float("inf")) for destino in destinos]
+    if not com_trajetos:
+        return linha, None
+    trajetos = [
+        reconstruir_trajeto(predecessores, origem, destino) if destino in custos else []
+        for destino in destinos
+    ]
+    return linha, trajetos
 
 
 class GrafoPoderado:
@@ -16,43 +100,86 @@ class GrafoPoderado:
         self.vertices[trajeto1][trajeto2] = custo
         self.vertices[trajeto2][trajeto1] = custo  # Grafo não direcionado
 
-    def dijkstra(self, origem, destino):
-        # Encontra a menor rota entre duas cidades usando Dijkstra.
-        nao_visitados = list(self.vertices.keys())  # Lista de cidades não visitadas
-        custos = {
-            cidade: float("inf") for cidade in self.vertices
-        }  # Inicializa todas os custos como infinito
-        custos[origem] = 0  # O custo da origem para ela mesma é 0
-        predecessores = {}  # Para armazenar o trajeto percorrido
-
-        while nao_visitados:
-            # Encontrar o nó com o menor custo
-            cidade_atual = min(nao_visitados, key=lambda custo: custos[custo])
-
-            if custos[cidade_atual] == float("inf"):
-                break  # Se o menor custo ainda for infinito, não há trajeto viável
-
-            for vizinho, custo in self.vertices[cidade_atual].items():
-                novo_trajeto = custos[cidade_atual] + custo
-                if novo_trajeto < custos[vizinho]:  # Se encontrarmos um caminho melhor
-                    custos[vizinho] = novo_trajeto
-                    predecessores[vizinho] = cidade_atual  # Armazena de onde viemos
+    def carregar_trajetos(self, fonte, separador=","):
+        # Adiciona trajetos em massa a partir de um iterável de (cidade1, cidade2,
+        # peso) ou de um arquivo CSV / lista de arestas, lido em fluxo, criando as
+        # cidades que ainda não existem. Retorna a vazão obtida (arestas por segundo).
+        def adicionar(cidade1, cidade2, peso):
+            self.adicionar_cidade(cidade1)
+            self.adicionar_cidade(cidade2)
+            self.adicionar_trajeto(cidade1, cidade2, peso)
 
-            nao_visitados.remove(cidade_atual)  # Marca a cidade como visitada
+        return carregar_arestas(fonte, adicionar, separador)
 
-        # Reconstrução do trajeto
-        trajeto = []
-        cidade_atual = destino
-        while cidade_atual in predecessores:
-            trajeto.append(cidade_atual)
-            cidade_atual = predecessores[cidade_atual]
-        trajeto.append(origem)
-        trajeto.reverse()
+    def compactar(self):
+        # Congela o grafo numa forma compacta (CSR), com os nomes das cidades
+        # trocados por índices inteiros. Alterações posteriores no grafo não
+        # são refletidas: basta compactar de novo.
+        return GrafoCompacto.a_partir_de_vertices(self.vertices)
 
-        return trajeto, custos[destino]
+    def dijkstra(self, origem, destino):
+        # Encontra a menor rota entre duas cidades usando Dijkstra com fila de prioridade.
+        custos, predecessores = buscar_custos(self.vertices, origem, [destino])
+        trajeto = reconstruir_trajeto(predecessores, origem, destino)
+        return trajeto, custos.get(destino, float("inf"))
+
+    def matriz_distancias(
+        self, origens=None, destinos=None, com_trajetos=False, processos=None
+    ):
+        # Calcula a matriz de custos origens x destinos com uma única busca por
+        # origem, distribuindo as origens entre processos. Trajetos inexistentes
+        # têm custo infinito (e trajeto vazio, quando com_trajetos=True).
+        # Sem processos, roda em série nos grafos pequenos e usa todos os
+        # núcleos a partir de LIMITE_PARALELO pares origem x cidade.
+        origens = list(self.vertices) if origens is None else list(origens)
+        destinos = list(self.vertices) if destinos is None else list(destinos)
+        if processos is None:
+            processos = 1
+            if len(origens) * len(self.vertices) >= LIMITE_PARALELO:
+                processos = os.cpu_count() or 1
+        processos = min(processos, len(origens))
+
+        if processos <= 1:
+            iniciar_trabalhador(self.vertices)
+            try:
+                resultados = [
+                    linha_matriz(origem, destinos, com_trajetos) for origem in origens
+                ]
+            finally:
+                iniciar_trabalhador(None)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=processos,
+                initializer=iniciar_trabalhador,
+                initargs=(self.vertices,),
+            ) as executor:
+                resultados = list(
+                    executor.map(
+                        linha_matriz,
+                        origens,
+                        repeat(destinos),
+                        repeat(com_trajetos),
+                        chunksize=max(1, len(origens) // (processos * 4)),
+                    )
+                )
+
+        matriz = np.array([linha for linha, _ in resultados], dtype=float).reshape(
+            len(origens), len(destinos)
+        )
+        if com_trajetos:
+            return matriz, [trajetos for _, trajetos in resultados]
+        return matriz
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
+
     mapa_cidades = GrafoPoderado()
     cidades = [
         "Florianópolis",
@@ -83,22 +210,34 @@ if __name__ == "__main__":
     print(f"Melhor rota de {origem} para {destino}: {' => '.join(rota)}")
     print(f"Custo da viagem: {custos}")
 
-    G = nx.Graph()
-    G.add_nodes_from(cidades)
-    G.add_weighted_edges_from(trajetos)
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=1000,
-        node_color="skyblue",
-        font_weight="bold",
-        font_size=12,
-    )
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=14)
-
-    plt.title("Representação Gráfica das Cidades", fontsize=16)
-    plt.savefig("ex4.png", bbox_inches="tight")
+    matriz = mapa_cidades.matriz_distancias(processos=1)
+    print("\nMatriz de custos entre todas as cidades:")
+    for cidade, linha in zip(cidades, matriz):
+        print(f"{linha} => {cidade}")
+
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
+
+        G = nx.Graph()
+        G.add_nodes_from(cidades)
+        G.add_weighted_edges_from(trajetos)
+        pos = posicoes_em_cache(G, "ex4", seed=42)  # Layout guardado em disco
+        plt.figure(figsize=(10, 8))
+        desenhar_grafo(
+            G,
+            pos,
+            destaque=zip(rota, rota[1:]),
+            tamanho_vertice=1000,
+            cor_vertice="skyblue",
+            tamanho_fonte=12,
+            negrito=True,
+            tamanho_fonte_arestas=14,
+        )
+
+        plt.title("Representação Gráfica das Cidades", fontsize=16)
+        plt.savefig("ex4.png", bbox_inches="tight")
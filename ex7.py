@@ -1,60 +1,149 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+from collections import defaultdict
+
+import numpy as np
+
+from agm import (
+    AGMDinamica,
+    ResultadoAGM,
+    arvore_geradora_minima,
+    congelar_armazenamento,
+    custos_informados,
+    descongelar_csr,
+    escrever_agm,
+)
+from carga import carregar_arestas
+from grafo_binario import carregar_grafo, salvar_grafo
+from instrumentacao import fase
 
 
 class GrafoAlgoritmoPrim:
-    def __init__(self, bairros):
+    def __init__(self, bairros, armazenamento="esparsa"):
         self.V = len(bairros)  # Número de bairros
+        self.indices = {nome: i for i, nome in enumerate(bairros)}  # Nome -> índice
         self.bairros = bairros  # Lista de bairros
-        self.grafo = [[0] * self.V for _ in range(self.V)]  # Matriz de adjacência
+        # "matriz": matriz V x V; "lista": listas de adjacência ({vizinho: custo});
+        # "arestas": custo de cada aresta por par (u, v), com u < v, listado
+        # para o Kruskal na hora do prim;
+        # "densa": matriz NumPy V x V, para o Prim vetorizado em grafos densos;
+        # "esparsa": dicionário de dicionários que só guarda as conexões
+        # existentes, congelado em linhas comprimidas (CSR) na hora do prim;
+        # "csr": os vetores CSR de um grafo aberto por carregar (só leitura)
+        self.armazenamento = armazenamento
+        if armazenamento == "matriz":
+            self.grafo = [[0] * self.V for _ in range(self.V)]  # Matriz de adjacência
+        elif armazenamento == "lista":
+            self.grafo = [{} for _ in range(self.V)]  # Listas de adjacência
+        elif armazenamento == "arestas":
+            self.grafo = {}  # Arestas: {(u, v): custo}, com u < v
+        elif armazenamento == "densa":
+            self.grafo = np.zeros((self.V, self.V))  # Matriz de custos NumPy
+        elif armazenamento == "esparsa":
+            self.grafo = defaultdict(dict)  # Só as conexões: {u: {v: custo}}
+        else:
+            raise ValueError(f"Armazenamento desconhecido: {armazenamento}")
+        self.agm = None  # AGM mantida entre chamadas de prim (AGMDinamica)
 
     def adicionar_conexao(self, bairro1, bairro2, custo):
         # Adiciona uma conexão entre dois bairros com um custo.
-        u = self.bairros.index(bairro1)
-        v = self.bairros.index(bairro2)
-        self.grafo[u][v] = custo
-        self.grafo[v][u] = custo  # Grafo não direcionado
-
-    def prim(self):
-        # Executa o algoritmo de Prim para encontrar a Árvore Geradora Mínima.
-        infinito = float("inf")
-        selecionado = [False] * self.V  # Marcar os bairros incluídos na AGM
-        chave = [infinito] * self.V  # Custo mínimo para incluir um bairro
-        pai = [-1] * self.V  # Armazena a estrutura da AGM
-
-        # Começamos pelo primeiro bairro
-        chave[0] = 0
-
-        for _ in range(self.V):
-            # Escolhe o bairro de menor custo que ainda não foi incluído na AGM
-            minimo = infinito
-            u = -1
-            for v in range(self.V):
-                if not selecionado[v] and chave[v] < minimo:
-                    minimo = chave[v]
-                    u = v
-
-            selecionado[u] = True  # Marca o bairro como incluído na AGM
-
-            # Atualiza os valores das chaves e define os pais dos bairros adjacentes
-            for v in range(self.V):
-                if 0 < self.grafo[u][v] < chave[v] and not selecionado[v]:
-                    chave[v] = self.grafo[u][v]
-                    pai[v] = u
-
-        # Exibindo a Árvore Geradora Mínima
-        print("\nConexões da Árvore Geradora Mínima:")
-        custo_total = 0
-        for i in range(1, self.V):
-            bairro1 = self.bairros[pai[i]]
-            bairro2 = self.bairros[i]
-            custo = self.grafo[i][pai[i]]
-            print(f"{bairro1} - {bairro2} (Custo: {custo})")
-            custo_total += custo
-        print(f"Custo total da AGM: {custo_total}")
+        u = self.indices[bairro1]
+        v = self.indices[bairro2]
+        if custo <= 0:
+            # Na matriz, custo <= 0 marca a ausência de conexão
+            raise ValueError(f"Custo de conexão inválido: {custo!r}")
+        if self.armazenamento == "csr":
+            self.descongelar()
+        if self.armazenamento == "arestas":
+            self.grafo[min(u, v), max(u, v)] = custo  # Substitui o custo anterior
+        else:
+            self.grafo[u][v] = custo
+            self.grafo[v][u] = custo  # Grafo não direcionado
+        # Atualiza a AGM já calculada em O(V), em vez de recalculá-la no prim
+        if self.agm is not None and not self.agm.atualizar(u, v, custo):
+            self.agm = None  # Uma aresta da árvore ficou mais cara: recalcula
+
+    def carregar_conexoes(self, fonte, separador=","):
+        # Adiciona conexões em massa a partir de um iterável de
+        # (bairro1, bairro2, custo) ou de um arquivo CSV / lista de arestas,
+        # lido em fluxo. Retorna a vazão obtida (arestas por segundo).
+        return carregar_arestas(fonte, self.adicionar_conexao, separador)
+
+    def salvar(self, caminho):
+        # Grava o grafo num arquivo binário compacto (tabela de nomes e vetores
+        # CSR contíguos, ver grafo_binario), qualquer que seja o armazenamento.
+        salvar_grafo(
+            caminho,
+            self.bairros,
+            *congelar_armazenamento(self.grafo, self.V, self.armazenamento),
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        # Abre um grafo gravado por salvar mapeando o arquivo em memória, no
+        # armazenamento "csr": o prim usa os vetores direto do arquivo e os
+        # nomes só são decodificados quando exibidos.
+        nomes, deslocamentos, destinos, pesos = carregar_grafo(caminho)
+        grafo = cls.__new__(cls)
+        grafo.bairros = nomes
+        grafo.V = len(nomes)
+        grafo.indices = nomes.indices  # Montado só na primeira consulta
+        grafo.armazenamento = "csr"
+        grafo.grafo = (deslocamentos, destinos, pesos)
+        grafo.agm = None
+        return grafo
+
+    def descongelar(self):
+        # Passa um grafo aberto por carregar para o armazenamento "esparsa",
+        # que aceita novas conexões.
+        self.grafo = descongelar_csr(*self.grafo)
+        self.armazenamento = "esparsa"
+
+    def prim(self, motor=None, estatisticas=None):
+        # Executa o algoritmo de Prim para encontrar a Árvore Geradora Mínima e
+        # a devolve como ResultadoAGM (origem, custos e total).
+        # motor: "matriz" (Prim em O(V²)), "numpy" (o mesmo, vetorizado),
+        # "heap" (Prim em O(E log V)), "kruskal" (O(E log E)) ou None para
+        # escolher pelo tamanho do grafo. Sem motor, reaproveita a AGM mantida
+        # por adicionar_conexao desde o último cálculo.
+        # Com estatisticas (instrumentacao.Estatisticas), conta o trabalho do
+        # motor e mede as fases do cálculo (ver arvore_geradora_minima).
+        if motor is not None or self.agm is None:
+            pai, custos = arvore_geradora_minima(
+                self.grafo, self.V, self.armazenamento, motor, estatisticas
+            )
+            self.agm = AGMDinamica(pai, custos)
+        else:
+            with fase(estatisticas, "exportar"):
+                pai, custos = self.agm.exportar()
+        with fase(estatisticas, "resultado"):
+            custos = custos_informados(self.grafo, self.armazenamento, pai, custos)
+            resultado = ResultadoAGM(pai, custos)
+        if estatisticas is not None:
+            estatisticas.concluir("prim")
+        return resultado
+
+    def exibir_agm(self, resultado, arquivo=None, formato="texto"):
+        # Escreve a AGM devolvida por prim em blocos, na saída padrão ou em
+        # arquivo: "texto" (relatório do plano), "csv" ou "binario".
+        escrever_agm(
+            resultado,
+            self.bairros,
+            arquivo,
+            formato,
+            cabecalho="\nConexões da Árvore Geradora Mínima:\n",
+            linha="{origem} - {destino} (Custo: {custo})\n",
+            rodape="Custo total da AGM: {total}\n",
+        )
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
 
     bairros = [
         "Centro",
@@ -82,24 +171,34 @@ if __name__ == "__main__":
     for bairro1, bairro2, custo in conexoes:
         g.adicionar_conexao(bairro1, bairro2, custo)
 
-    g.prim()
-
-    G = nx.Graph()
-    G.add_nodes_from(bairros)
-    G.add_weighted_edges_from(conexoes)
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=1000,
-        node_color="skyblue",
-        font_weight="bold",
-        font_size=12,
-    )
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=14)
-
-    plt.title("Representação Gráfica dos Bairros e Conexões", fontsize=16)
-    plt.savefig("ex7.png", bbox_inches="tight")
+    resultado = g.prim()
+    g.exibir_agm(resultado)
+
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
+
+        G = nx.Graph()
+        G.add_nodes_from(bairros)
+        G.add_weighted_edges_from(conexoes)
+        pos = posicoes_em_cache(G, "ex7", seed=42)  # Layout guardado em disco
+        plt.figure(figsize=(10, 8))
+        # Arestas da AGM, destacadas no desenho
+        arestas_agm = [(bairros[u], bairros[v]) for u, v, _ in resultado.arestas()]
+        desenhar_grafo(
+            G,
+            pos,
+            destaque=arestas_agm,
+            tamanho_vertice=1000,
+            cor_vertice="skyblue",
+            tamanho_fonte=12,
+            negrito=True,
+            tamanho_fonte_arestas=14,
+        )
+
+        plt.title("Representação Gráfica dos Bairros e Conexões", fontsize=16)
+        plt.savefig("ex7.png", bbox_inches="tight")
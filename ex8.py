@@ -1,29 +1,409 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+import heapq
+import math
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from instrumentacao import fase
 
 # Representa um valor infinito para indicar que não há conexão direta entre os bairros
 INF = float("inf")
 
+# Custo de uma operação do Dijkstra em Python (com fila de prioridade) em
+# relação a uma operação vetorizada do Floyd-Warshall, medido com
+# benchmarks/motores_todos_pares.py. Define onde fica o ponto de troca.
+CUSTO_RELATIVO_DIJKSTRA = 8.0
+
 
-def floyd_warshall(grafo):
-    # Número de bairros no grafo
-    num_bairros = len(grafo)
+def floyd_warshall(grafo, processos=1, tamanho_bloco=256, estatisticas=None):
+    # Aceita a matriz como lista de listas (retorna lista de listas) ou como
+    # np.ndarray (retorna np.ndarray). Com processos > 1, a matriz é dividida
+    # em blocos processados em paralelo (ver floyd_warshall_paralelo).
+    # Com estatisticas (instrumentacao.Estatisticas), conta intermediários,
+    # pares examinados e melhorias e mede as fases "copia", "laco" e
+    # "conversao". As melhorias só são contadas no cálculo sequencial.
+    entrada_ndarray = isinstance(grafo, np.ndarray)
 
     # Criando uma cópia da matriz do grafo para armazenar os menores tempos de deslocamento
-    dist = [[grafo[i][j] for j in range(num_bairros)] for i in range(num_bairros)]
+    with fase(estatisticas, "copia"):
+        if entrada_ndarray and np.issubdtype(grafo.dtype, np.floating):
+            dist = grafo.astype(grafo.dtype, copy=True)
+        else:
+            dist = np.array(grafo, dtype=np.float64)
 
     # Aplicação do algoritmo de Floyd-Warshall
+    with fase(estatisticas, "laco"):
+        if processos > 1:
+            floyd_warshall_paralelo(dist, processos, tamanho_bloco)
+            if estatisticas is not None:
+                n = len(dist)
+                estatisticas.somar(assentados=n, relaxadas=n**3)
+        elif estatisticas is None:
+            floyd_warshall_sequencial(dist)
+        else:
+            floyd_warshall_instrumentado(dist, estatisticas)
+
+    with fase(estatisticas, "conversao"):
+        if not entrada_ndarray:
+            dist = para_listas(dist, inteiros=todos_inteiros(grafo))
+    if estatisticas is not None:
+        estatisticas.concluir("floyd_warshall")
+    return dist
+
+
+def floyd_warshall_sequencial(dist):
+    # Floyd-Warshall vetorizado por intermediário, atualizando dist no lugar.
+    num_bairros = len(dist)  # Número de bairros no grafo
     for k in range(num_bairros):  # Considera cada bairro como intermediário
-        for i in range(num_bairros):  # Itera sobre todos os bairros de origem
-            for j in range(num_bairros):  # Itera sobre todos os bairros de destino
-                # Atualiza o tempo mínimo de deslocamento de i para j passando por k
-                if dist[i][k] + dist[k][j] < dist[i][j]:
-                    dist[i][j] = dist[i][k] + dist[k][j]
+        # Atualiza de uma só vez o tempo mínimo de todos os pares (i, j)
+        # passando por k: a coluna k somada à linha k por broadcast.
+        np.minimum(dist, dist[:, k, np.newaxis] + dist[np.newaxis, k, :], out=dist)
+    return dist
+
+
+def floyd_warshall_instrumentado(dist, estatisticas):
+    # floyd_warshall_sequencial contando, a cada intermediário, os pares cujo
+    # tempo diminuiu (uma comparação vetorizada a mais por k).
+    num_bairros = len(dist)
+    melhorias = 0
+    for k in range(num_bairros):
+        candidato = dist[:, k, np.newaxis] + dist[np.newaxis, k, :]
+        melhorias += int(np.count_nonzero(candidato < dist))
+        np.minimum(dist, candidato, out=dist)
+    estatisticas.somar(
+        assentados=num_bairros, relaxadas=num_bairros**3, melhorias=melhorias
+    )
+    return dist
+
+
+def fw_bloco(destino, coluna, linha):
+    # Núcleo do Floyd-Warshall em blocos: atualiza o bloco destino com os
+    # caminhos que passam pelos intermediários do bloco k, dados pelo bloco
+    # coluna (destino x k) e pelo bloco linha (k x destino).
+    for k in range(coluna.shape[1]):
+        np.minimum(
+            destino, coluna[:, k, np.newaxis] + linha[np.newaxis, k, :], out=destino
+        )
+
+
+def floyd_warshall_blocado(dist, tamanho_bloco):
+    # Floyd-Warshall em blocos (três fases por bloco k), atualizando dist no
+    # lugar. dist pode ser um np.memmap: só alguns blocos de
+    # tamanho_bloco x tamanho_bloco ficam na memória de cada vez.
+    n = len(dist)
+    faixas = [slice(i, min(i + tamanho_bloco, n)) for i in range(0, n, tamanho_bloco)]
+
+    for K in faixas:
+        # Fase 1: bloco diagonal, usando apenas intermediários do próprio bloco
+        diagonal = np.array(dist[K, K])
+        fw_bloco(diagonal, diagonal, diagonal)
+        dist[K, K] = diagonal
+
+        # Fase 2: blocos da linha K e da coluna K, que dependem só da diagonal
+        for J in faixas:
+            if J != K:
+                bloco = np.array(dist[K, J])
+                fw_bloco(bloco, diagonal, bloco)
+                dist[K, J] = bloco
+
+                bloco = np.array(dist[J, K])
+                fw_bloco(bloco, bloco, diagonal)
+                dist[J, K] = bloco
+
+        # Fase 3: demais blocos, a partir da coluna K e da linha K já finais
+        for I in faixas:
+            if I == K:
+                continue
+            coluna = np.array(dist[I, K])
+            for J in faixas:
+                if J == K:
+                    continue
+                bloco = np.array(dist[I, J])
+                fw_bloco(bloco, coluna, np.asarray(dist[K, J]))
+                dist[I, J] = bloco
+
+    return dist
+
+
+# Matriz compartilhada vista pelos processos trabalhadores de
+# floyd_warshall_paralelo. Cada processo se anexa uma única vez ao bloco de
+# memória compartilhada; as tarefas só enviam as faixas de índices.
+memoria_trabalhador = None
+matriz_trabalhador = None
+
+
+def anexar_memoria(nome, forma, tipo):
+    global memoria_trabalhador, matriz_trabalhador
+    memoria_trabalhador = shared_memory.SharedMemory(name=nome)
+    matriz_trabalhador = np.ndarray(forma, dtype=tipo, buffer=memoria_trabalhador.buf)
+
+
+def tarefa_linha_coluna(K, J):
+    # Fase 2: blocos (K, J) e (J, K), que dependem só do bloco diagonal K.
+    dist = matriz_trabalhador
+    fw_bloco(dist[K, J], dist[K, K], dist[K, J])
+    fw_bloco(dist[J, K], dist[J, K], dist[K, K])
+
+
+def tarefa_restante(K, I, faixas):
+    # Fase 3: todos os blocos (I, J) da faixa de linhas I, fora da linha e da
+    # coluna K, a partir dos blocos (I, K) e (K, J) já finais.
+    dist = matriz_trabalhador
+    for J in faixas:
+        if J != K:
+            fw_bloco(dist[I, J], dist[I, K], dist[K, J])
+
+
+def floyd_warshall_paralelo(dist, processos, tamanho_bloco):
+    # Floyd-Warshall em blocos com as fases 2 e 3 de cada bloco k divididas
+    # entre processos. A matriz fica em memória compartilhada, atualizada no
+    # lugar pelos trabalhadores, sem serializar a matriz a cada rodada.
+    n = len(dist)
+    faixas = [slice(i, min(i + tamanho_bloco, n)) for i in range(0, n, tamanho_bloco)]
+    memoria = shared_memory.SharedMemory(create=True, size=max(1, dist.nbytes))
+    try:
+        compartilhada = np.ndarray(dist.shape, dtype=dist.dtype, buffer=memoria.buf)
+        compartilhada[:] = dist
+        with ProcessPoolExecutor(
+            max_workers=processos,
+            initializer=anexar_memoria,
+            initargs=(memoria.name, dist.shape, dist.dtype.str),
+        ) as executor:
+            for K in faixas:
+                # Fase 1: bloco diagonal, no próprio processo principal
+                diagonal = compartilhada[K, K]
+                fw_bloco(diagonal, diagonal, diagonal)
+
+                outras = [J for J in faixas if J != K]
+                list(executor.map(tarefa_linha_coluna, [K] * len(outras), outras))
+                list(
+                    executor.map(
+                        tarefa_restante,
+                        [K] * len(outras),
+                        outras,
+                        [faixas] * len(outras),
+                    )
+                )
+        dist[:] = compartilhada
+    finally:
+        compartilhada = diagonal = None  # Libera as vistas antes de fechar
+        memoria.close()
+        memoria.unlink()
+    return dist
+
+
+def floyd_warshall_em_disco(grafo, arquivo, tamanho_bloco=512, dtype=np.float32):
+    # Floyd-Warshall para matrizes maiores que a memória. A matriz de
+    # distâncias fica num arquivo .npy mapeado em memória (np.memmap) e é
+    # processada bloco a bloco. float32 ocupa metade do espaço de float64.
+    # O arquivo resultante pode ser reaberto com abrir_distancias().
+    n = len(grafo)
+    dist = np.lib.format.open_memmap(arquivo, mode="w+", dtype=dtype, shape=(n, n))
+
+    # Copia a matriz de entrada em faixas de linhas (ela também pode ser um memmap)
+    for inicio in range(0, n, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, n)
+        dist[inicio:fim] = np.asarray(grafo[inicio:fim], dtype=dtype)
+
+    floyd_warshall_blocado(dist, tamanho_bloco)
+    dist.flush()
+    return dist
+
 
-    return dist  # Retorna a matriz com os menores tempos de deslocamento entre os pares de bairros
+def abrir_distancias(arquivo):
+    # Abre uma matriz gravada por floyd_warshall_em_disco sem carregá-la:
+    # cada consulta dist[i, j] lê do disco apenas o trecho necessário.
+    return np.load(arquivo, mmap_mode="r")
+
+
+def recalcular_afetados(dist, adjacencia, afetados):
+    # Recalcula apenas os pares (i, j) marcados em afetados. Os demais tempos
+    # da linha i continuam válidos e servem de ponto de partida: cada destino
+    # afetado começa com o melhor tempo vindo de um bairro não afetado e o
+    # restante é resolvido por um Dijkstra restrito aos destinos afetados.
+    for origem in np.flatnonzero(afetados.any(axis=1)):
+        alvos = np.flatnonzero(afetados[origem])
+        partida = dist[origem].copy()
+        partida[alvos] = INF
+        # O caminho vazio sempre vale, mesmo quando o par (origem, origem) foi
+        # marcado (ciclo de tempo zero pela ligação alterada)
+        partida[origem] = 0
+        provisorio = (partida[:, np.newaxis] + adjacencia[:, alvos]).min(axis=0)
+
+        resolvido = np.zeros(len(alvos), dtype=bool)
+        for _ in range(len(alvos)):
+            j = int(np.argmin(np.where(resolvido, INF, provisorio)))
+            if resolvido[j] or provisorio[j] == INF:
+                break  # Os destinos restantes ficaram inalcançáveis
+            resolvido[j] = True
+            np.minimum(
+                provisorio, provisorio[j] + adjacencia[alvos[j], alvos], out=provisorio
+            )
+        dist[origem, alvos] = provisorio
+
+
+def atualizar_aresta(dist, grafo, u, v, peso, nao_direcionado=False):
+    # Atualiza a matriz de menores tempos dist (resultado de floyd_warshall)
+    # quando o tempo direto de u para v muda para peso, sem recalcular tudo.
+    # grafo é a matriz de adjacência que gerou dist e também é atualizada.
+    # - Redução (ou nova ligação): todo caminho melhor passa pela ligação,
+    #   então basta dist[i][j] = min(dist[i][j], dist[i][u] + peso + dist[v][j]),
+    #   em O(n²).
+    # - Aumento (ou remoção, com peso INF): só os pares cujo menor caminho
+    #   usava a ligação podem mudar; apenas eles são recalculados
+    #   (exige tempos não negativos).
+    entrada_ndarray = isinstance(dist, np.ndarray)
+    matriz = dist if entrada_ndarray else np.array(dist, dtype=np.float64)
+    ligacoes = [(u, v), (v, u)] if nao_direcionado else [(u, v)]
+    aumentos = [(a, b, grafo[a][b]) for a, b in ligacoes if peso > grafo[a][b]]
+    reducoes = [(a, b) for a, b in ligacoes if peso < grafo[a][b]]
+
+    if aumentos:
+        # Pares (i, j) cujo menor caminho pode ter usado alguma das ligações
+        afetados = np.zeros(matriz.shape, dtype=bool)
+        for a, b, antigo in aumentos:
+            grafo[a][b] = peso
+            if antigo == INF or a == b:
+                continue
+            via_ligacao = matriz[:, a, np.newaxis] + antigo + matriz[np.newaxis, b, :]
+            afetados |= np.isfinite(matriz) & np.isclose(
+                via_ligacao, matriz, rtol=1e-9, atol=0
+            )
+
+        recalcular_afetados(matriz, np.asarray(grafo, dtype=np.float64), afetados)
+
+    for a, b in reducoes:
+        grafo[a][b] = peso
+        np.minimum(
+            matriz,
+            matriz[:, a, np.newaxis] + peso + matriz[np.newaxis, b, :],
+            out=matriz,
+        )
+
+    if entrada_ndarray:
+        return matriz
+    inteiros = todos_inteiros(dist) and (isinstance(peso, int) or peso == INF)
+    return para_listas(matriz, inteiros=inteiros)
+
+
+def escolher_motor(num_bairros, num_ligacoes):
+    # Floyd-Warshall custa ~n³ operações vetorizadas; n buscas de Dijkstra
+    # custam ~n·(n + E)·log n operações em Python. Escolhe o mais barato.
+    if num_bairros < 2:
+        return "floyd_warshall"
+    custo_dijkstra = (
+        CUSTO_RELATIVO_DIJKSTRA * (num_bairros + num_ligacoes) * math.log2(num_bairros)
+    )
+    if custo_dijkstra < num_bairros * num_bairros:
+        return "dijkstra"
+    return "floyd_warshall"
+
+
+def dijkstra_listas(adjacencias, origem):
+    # Dijkstra com fila de prioridade sobre listas de adjacência [(v, tempo)].
+    dist = [INF] * len(adjacencias)
+    dist[origem] = 0
+    fila = [(0, origem)]
+    while fila:
+        tempo, u = heapq.heappop(fila)
+        if tempo > dist[u]:
+            continue  # Entrada obsoleta
+        for v, peso in adjacencias[u]:
+            novo_tempo = tempo + peso
+            if novo_tempo < dist[v]:
+                dist[v] = novo_tempo
+                heapq.heappush(fila, (novo_tempo, v))
+    return dist
+
+
+def potenciais_bellman_ford(num_bairros, origens, destinos, pesos):
+    # Potenciais de Johnson: menores tempos a partir de um vértice virtual
+    # ligado a todos com custo 0. Retorna None se houver ciclo negativo.
+    potencial = np.zeros(num_bairros)
+    for _ in range(num_bairros):
+        novo = potencial.copy()
+        np.minimum.at(novo, destinos, potencial[origens] + pesos)
+        if np.array_equal(novo, potencial):
+            return potencial
+        potencial = novo
+    return None
+
+
+def menores_tempos(grafo, motor=None):
+    # Menores tempos entre todos os pares, escolhendo o algoritmo pela
+    # densidade de ligações: grafos esparsos usam uma busca de Dijkstra por
+    # origem (ou Johnson, se houver tempos negativos) e grafos densos usam
+    # floyd_warshall. O resultado é a mesma matriz de floyd_warshall.
+    # motor pode forçar "floyd_warshall" ou "dijkstra".
+    entrada_ndarray = isinstance(grafo, np.ndarray)
+    matriz = np.asarray(grafo, dtype=np.float64)
+    num_bairros = len(matriz)
+    fora_diagonal = ~np.eye(num_bairros, dtype=bool)
+    origens, destinos = np.nonzero(np.isfinite(matriz) & fora_diagonal)
+
+    if motor is None:
+        motor = escolher_motor(num_bairros, len(origens))
+    # As buscas só reproduzem floyd_warshall com diagonal nula
+    if motor == "floyd_warshall" or np.any(np.diag(matriz) != 0):
+        return floyd_warshall(grafo)
+
+    pesos = matriz[origens, destinos]
+    potencial = None
+    if np.any(pesos < 0):
+        # Johnson: reponderação que torna todos os tempos não negativos
+        potencial = potenciais_bellman_ford(num_bairros, origens, destinos, pesos)
+        if potencial is None:
+            return floyd_warshall(grafo)  # Ciclo negativo: mesmo resultado do original
+        pesos = pesos + potencial[origens] - potencial[destinos]
+
+    adjacencias = [[] for _ in range(num_bairros)]
+    for u, v, peso in zip(origens.tolist(), destinos.tolist(), pesos.tolist()):
+        adjacencias[u].append((v, peso))
+
+    dist = np.array(
+        [dijkstra_listas(adjacencias, origem) for origem in range(num_bairros)],
+        dtype=np.float64,
+    ).reshape(num_bairros, num_bairros)
+    if potencial is not None:
+        dist += potencial[np.newaxis, :] - potencial[:, np.newaxis]
+
+    if entrada_ndarray:
+        if np.issubdtype(grafo.dtype, np.floating):
+            return dist.astype(grafo.dtype, copy=False)
+        return dist
+    return para_listas(dist, inteiros=todos_inteiros(grafo))
+
+
+def todos_inteiros(grafo):
+    # Verifica se os tempos finitos da matriz em listas são todos inteiros.
+    return all(
+        isinstance(valor, int) or valor == INF for linha in grafo for valor in linha
+    )
+
+
+def para_listas(dist, inteiros):
+    # Converte a matriz de volta para listas de listas, mantendo inteiros os
+    # tempos que eram inteiros na entrada (como no algoritmo original).
+    linhas = dist.tolist()
+    if inteiros:
+        linhas = [
+            [valor if valor == INF else int(valor) for valor in linha]
+            for linha in linhas
+        ]
+    return linhas  # Retorna a matriz com os menores tempos de deslocamento entre os pares de bairros
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
+
     # Definição do grafo representando os bairros e os tempos de deslocamento entre eles
     # A matriz indica os tempos de deslocamento entre os bairros (0 para si mesmo, INF se não houver ligação direta)
     bairros = [
@@ -43,7 +423,7 @@ if __name__ == "__main__":
     ]
 
     # Executando o algoritmo de Floyd-Warshall
-    menores_tempos = floyd_warshall(grafo_bairros)
+    tempos = floyd_warshall(grafo_bairros)
 
     # Exibindo a matriz resultante
     print("Matriz dos menores tempos de deslocamento entre todos os bairros:")
@@ -51,35 +431,43 @@ if __name__ == "__main__":
     # Determinar a altura máxima dos bairros
     max_height = max(len(bairro) for bairro in bairros)
 
-    for linha, bairro in zip(menores_tempos, bairros):
+    for linha, bairro in zip(tempos, bairros):
         print(f"{linha} => {bairro}")
 
-    G = nx.Graph()
-    G.add_nodes_from(bairros)
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
 
-    conexoes = [
-        ("Centro", "Vila Nova", 10),
-        ("Centro", "Bairro Alto", 30),
-        ("Vila Nova", "Jardim Botânico", 50),
-        ("Jardim Botânico", "Bairro Alto", 20),
-        ("Jardim Botânico", "São Pedro", 10),
-        ("Bairro Alto", "São Pedro", 60),
-    ]
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
 
-    G.add_weighted_edges_from(conexoes)
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=1000,
-        node_color="skyblue",
-        font_weight="bold",
-        font_size=12,
-    )
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=14)
+        G = nx.Graph()
+        G.add_nodes_from(bairros)
+
+        conexoes = [
+            ("Centro", "Vila Nova", 10),
+            ("Centro", "Bairro Alto", 30),
+            ("Vila Nova", "Jardim Botânico", 50),
+            ("Jardim Botânico", "Bairro Alto", 20),
+            ("Jardim Botânico", "São Pedro", 10),
+            ("Bairro Alto", "São Pedro", 60),
+        ]
+
+        G.add_weighted_edges_from(conexoes)
+        pos = posicoes_em_cache(G, "ex8", seed=42)  # Layout guardado em disco
+        plt.figure(figsize=(10, 8))
+        desenhar_grafo(
+            G,
+            pos,
+            tamanho_vertice=1000,
+            cor_vertice="skyblue",
+            tamanho_fonte=12,
+            negrito=True,
+            tamanho_fonte_arestas=14,
+        )
 
-    plt.title("Representação Gráfica dos Bairros e Tempos de Deslocamento", fontsize=16)
-    plt.savefig("ex8.png", bbox_inches="tight")
+        plt.title(
+            "Representação Gráfica dos Bairros e Tempos de Deslocamento", fontsize=16
+        )
+        plt.savefig("ex8.png", bbox_inches="tight")
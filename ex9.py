@@ -1,63 +1,150 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+from collections import defaultdict
+
+import numpy as np
+
+from agm import (
+    AGMDinamica,
+    ResultadoAGM,
+    arvore_geradora_minima,
+    congelar_armazenamento,
+    custos_informados,
+    descongelar_csr,
+    escrever_agm,
+)
+from carga import carregar_arestas
+from grafo_binario import carregar_grafo, salvar_grafo
+from instrumentacao import fase
 
 
 class GrafoAlgoritmoPrim:
-    def __init__(self, cidades):
+    def __init__(self, cidades, armazenamento="esparsa"):
         self.cidades = cidades  # Lista de nomes das cidades
         self.V = len(cidades)  # Número de cidades
-        self.grafo = [[0] * self.V for _ in range(self.V)]  # Matriz de custos
+        self.indices = {nome: i for i, nome in enumerate(cidades)}  # Nome -> índice
+        # "matriz": matriz V x V; "lista": listas de adjacência ({vizinho: custo});
+        # "arestas": custo de cada aresta por par (u, v), com u < v, listado
+        # para o Kruskal na hora do prim;
+        # "densa": matriz NumPy V x V, para o Prim vetorizado em grafos densos;
+        # "esparsa": dicionário de dicionários que só guarda as conexões
+        # existentes, congelado em linhas comprimidas (CSR) na hora do prim;
+        # "csr": os vetores CSR de um grafo aberto por carregar (só leitura)
+        self.armazenamento = armazenamento
+        if armazenamento == "matriz":
+            self.grafo = [[0] * self.V for _ in range(self.V)]  # Matriz de custos
+        elif armazenamento == "lista":
+            self.grafo = [{} for _ in range(self.V)]  # Listas de adjacência
+        elif armazenamento == "arestas":
+            self.grafo = {}  # Arestas: {(u, v): custo}, com u < v
+        elif armazenamento == "densa":
+            self.grafo = np.zeros((self.V, self.V))  # Matriz de custos NumPy
+        elif armazenamento == "esparsa":
+            self.grafo = defaultdict(dict)  # Só as conexões: {u: {v: custo}}
+        else:
+            raise ValueError(f"Armazenamento desconhecido: {armazenamento}")
+        self.agm = None  # AGM mantida entre chamadas de prim (AGMDinamica)
 
     def adicionar_conexao(self, cidade1, cidade2, custo):
         # Adiciona uma conexão entre duas cidades com seu custo
-        u = self.cidades.index(cidade1)
-        v = self.cidades.index(cidade2)
-        self.grafo[u][v] = custo
-        self.grafo[v][u] = custo  # Grafo não direcionado
-
-    def prim(self):
-        # Executa o algoritmo de Prim para encontrar a Árvore Geradora Mínima.
-        infinito = float("inf")
-        selecionado = [False] * self.V
-        custo_minimo = [infinito] * self.V
-        origem = [-1] * self.V  # Armazena a estrutura da AGM
-
-        # Começa pela primeira cidade
-        custo_minimo[0] = 0
-
-        for _ in range(self.V):
-            # Escolhe a cidade menor custo que ainda não foi incluído na AGM
-            min_custo = infinito
-            cidade_atual = -1
-            for v in range(self.V):
-                if not selecionado[v] and custo_minimo[v] < min_custo:
-                    min_custo = custo_minimo[v]
-                    cidade_atual = v
-
-            selecionado[cidade_atual] = True
-
-            # Atualiza os custos mínimos para as cidades vizinhas
-            for v in range(self.V):
-                if (
-                    0 < self.grafo[cidade_atual][v] < custo_minimo[v]
-                    and not selecionado[v]
-                ):
-                    custo_minimo[v] = self.grafo[cidade_atual][v]
-                    origem[v] = cidade_atual
-
-        # Exibindo a Árvore Geradora Mínima
-        print("Plano de Expansão da Rede Elétrica (Custo Mínimo):")
-        custo_total = 0
-        for i in range(1, self.V):
-            cidade_origem = self.cidades[origem[i]]
-            cidade_destino = self.cidades[i]
-            custo = self.grafo[i][origem[i]]
-            print(f"\t{cidade_origem} → {cidade_destino} (Custo: R${custo} mi)")
-            custo_total += custo
-        print(f"\nCusto total do projeto: R$ {custo_total} milhões")
+        u = self.indices[cidade1]
+        v = self.indices[cidade2]
+        if custo <= 0:
+            # Na matriz, custo <= 0 marca a ausência de conexão
+            raise ValueError(f"Custo de conexão inválido: {custo!r}")
+        if self.armazenamento == "csr":
+            self.descongelar()
+        if self.armazenamento == "arestas":
+            self.grafo[min(u, v), max(u, v)] = custo  # Substitui o custo anterior
+        else:
+            self.grafo[u][v] = custo
+            self.grafo[v][u] = custo  # Grafo não direcionado
+        # Atualiza a AGM já calculada em O(V), em vez de recalculá-la no prim
+        if self.agm is not None and not self.agm.atualizar(u, v, custo):
+            self.agm = None  # Uma aresta da árvore ficou mais cara: recalcula
+
+    def carregar_conexoes(self, fonte, separador=","):
+        # Adiciona conexões em massa a partir de um iterável de
+        # (cidade1, cidade2, custo) ou de um arquivo CSV / lista de arestas,
+        # lido em fluxo. Retorna a vazão obtida (arestas por segundo).
+        return carregar_arestas(fonte, self.adicionar_conexao, separador)
+
+    def salvar(self, caminho):
+        # Grava o grafo num arquivo binário compacto (tabela de nomes e vetores
+        # CSR contíguos, ver grafo_binario), qualquer que seja o armazenamento.
+        salvar_grafo(
+            caminho,
+            self.cidades,
+            *congelar_armazenamento(self.grafo, self.V, self.armazenamento),
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        # Abre um grafo gravado por salvar mapeando o arquivo em memória, no
+        # armazenamento "csr": o prim usa os vetores direto do arquivo e os
+        # nomes só são decodificados quando exibidos.
+        nomes, deslocamentos, destinos, pesos = carregar_grafo(caminho)
+        grafo = cls.__new__(cls)
+        grafo.cidades = nomes
+        grafo.V = len(nomes)
+        grafo.indices = nomes.indices  # Montado só na primeira consulta
+        grafo.armazenamento = "csr"
+        grafo.grafo = (deslocamentos, destinos, pesos)
+        grafo.agm = None
+        return grafo
+
+    def descongelar(self):
+        # Passa um grafo aberto por carregar para o armazenamento "esparsa",
+        # que aceita novas conexões.
+        self.grafo = descongelar_csr(*self.grafo)
+        self.armazenamento = "esparsa"
+
+    def prim(self, motor=None, estatisticas=None):
+        # Executa o algoritmo de Prim para encontrar a Árvore Geradora Mínima e
+        # a devolve como ResultadoAGM (origem, custos e total).
+        # motor: "matriz" (Prim em O(V²)), "numpy" (o mesmo, vetorizado),
+        # "heap" (Prim em O(E log V)), "kruskal" (O(E log E)) ou None para
+        # escolher pelo tamanho do grafo. Sem motor, reaproveita a AGM mantida
+        # por adicionar_conexao desde o último cálculo.
+        # Com estatisticas (instrumentacao.Estatisticas), conta o trabalho do
+        # motor e mede as fases do cálculo (ver arvore_geradora_minima).
+        if motor is not None or self.agm is None:
+            origem, custos = arvore_geradora_minima(
+                self.grafo, self.V, self.armazenamento, motor, estatisticas
+            )
+            self.agm = AGMDinamica(origem, custos)
+        else:
+            with fase(estatisticas, "exportar"):
+                origem, custos = self.agm.exportar()
+        with fase(estatisticas, "resultado"):
+            custos = custos_informados(self.grafo, self.armazenamento, origem, custos)
+            resultado = ResultadoAGM(origem, custos)
+        if estatisticas is not None:
+            estatisticas.concluir("prim")
+        return resultado
+
+    def exibir_agm(self, resultado, arquivo=None, formato="texto"):
+        # Escreve a AGM devolvida por prim em blocos, na saída padrão ou em
+        # arquivo: "texto" (relatório do plano), "csv" ou "binario".
+        escrever_agm(
+            resultado,
+            self.cidades,
+            arquivo,
+            formato,
+            cabecalho="Plano de Expansão da Rede Elétrica (Custo Mínimo):\n",
+            linha="\t{origem} → {destino} (Custo: R${custo} mi)\n",
+            rodape="\nCusto total do projeto: R$ {total} milhões\n",
+        )
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--no-render",
+        action="store_true",
+        help="só calcula, sem desenhar o grafo (nem importar networkx/matplotlib)",
+    )
+    args = parser.parse_args()
+
     cidades = ["Cidade A", "Cidade B", "Cidade C", "Cidade D", "Cidade E", "Cidade F"]
 
     rede_eletrica = GrafoAlgoritmoPrim(cidades)
@@ -76,27 +163,37 @@ if __name__ == "__main__":
     for cidade1, cidade2, custo in conexoes:
         rede_eletrica.adicionar_conexao(cidade1, cidade2, custo)
 
-    rede_eletrica.prim()
-
-    G = nx.Graph()
-    G.add_nodes_from(cidades)
-    G.add_weighted_edges_from(conexoes)
-    pos = nx.spring_layout(G, seed=42)
-    plt.figure(figsize=(10, 8))
-    nx.draw(
-        G,
-        pos,
-        with_labels=True,
-        node_size=10000,
-        node_color="SpringGreen",
-        font_weight="bold",
-        font_size=12,
-    )
-    labels = nx.get_edge_attributes(G, "weight")
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=14)
-
-    plt.title(
-        "Representação Gráfica das Cidades e Custos de Instalação da Rede Elétrica",
-        fontsize=16,
-    )
-    plt.savefig("ex9.png", bbox_inches="tight")
+    resultado = rede_eletrica.prim()
+    rede_eletrica.exibir_agm(resultado)
+
+    if not args.no_render:
+        # Importações pesadas só quando o grafo vai ser desenhado
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
+        from desenho import desenhar_grafo
+        from posicoes import posicoes_em_cache
+
+        G = nx.Graph()
+        G.add_nodes_from(cidades)
+        G.add_weighted_edges_from(conexoes)
+        pos = posicoes_em_cache(G, "ex9", seed=42)  # Layout guardado em disco
+        plt.figure(figsize=(10, 8))
+        # Arestas da AGM, destacadas no desenho
+        arestas_agm = [(cidades[u], cidades[v]) for u, v, _ in resultado.arestas()]
+        desenhar_grafo(
+            G,
+            pos,
+            destaque=arestas_agm,
+            tamanho_vertice=10000,
+            cor_vertice="SpringGreen",
+            tamanho_fonte=12,
+            negrito=True,
+            tamanho_fonte_arestas=14,
+        )
+
+        plt.title(
+            "Representação Gráfica das Cidades e Custos de Instalação da Rede Elétrica",
+            fontsize=16,
+        )
+        plt.savefig("ex9.png", bbox_inches="tight")
@@ -0,0 +1,192 @@
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+
+# Formato binário de grafo (CSR) gravado por salvar_grafo:
+#   cabeçalho: assinatura, tipo da tabela de nomes, tipo dos pesos ("q"
+#              inteiros, "d" reais), V, A (entradas de destinos) e o tamanho
+#              da tabela de nomes em bytes;
+#   deslocamentos (V + 1 inteiros de 8 bytes), destinos (A inteiros) e pesos
+#   (A valores de 8 bytes), contíguos e alinhados, seguidos da tabela de nomes:
+#   "i": V inteiros (todos os nomes são int);
+#   "s": V + 1 deslocamentos e os nomes em UTF-8 (todos os nomes são str);
+#   "p": lista de nomes serializada com pickle (qualquer outro caso).
+# Os vetores ficam na ordem de bytes little-endian da máquina que os gravou.
+CABECALHO_GRAFO = struct.Struct("<4scc2xqqq")
+ASSINATURA_GRAFO = b"GRF1"
+
+
+def verificar_ordem_bytes():
+    if sys.byteorder != "little":
+        raise ValueError("O formato binário de grafo exige uma máquina little-endian")
+
+
+def salvar_grafo(caminho, nomes, deslocamentos, destinos, pesos):
+    # Grava o grafo em CSR (vetores array.array ou memoryview de inteiros de
+    # 8 bytes; pesos "q" ou "d") e a tabela de nomes no formato acima.
+    verificar_ordem_bytes()
+    nomes = list(nomes)
+    if all(type(nome) is int for nome in nomes):
+        tipo_nomes = b"i"
+        tabela = [array("q", nomes)]
+    elif all(isinstance(nome, str) for nome in nomes):
+        tipo_nomes = b"s"
+        codificados = [nome.encode() for nome in nomes]
+        posicoes = array("q", [0])
+        for codificado in codificados:
+            posicoes.append(posicoes[-1] + len(codificado))
+        tabela = [posicoes, b"".join(codificados)]
+    else:
+        tipo_nomes = b"p"
+        tabela = [pickle.dumps(nomes, protocol=pickle.HIGHEST_PROTOCOL)]
+
+    tipo_pesos = getattr(pesos, "typecode", None) or pesos.format
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(
+            CABECALHO_GRAFO.pack(
+                ASSINATURA_GRAFO,
+                tipo_nomes,
+                tipo_pesos.encode(),
+                len(nomes),
+                len(destinos),
+                sum(memoryview(parte).nbytes for parte in tabela),
+            )
+        )
+        for parte in (deslocamentos, destinos, pesos, *tabela):
+            arquivo.write(parte)
+
+
+def carregar_grafo(caminho):
+    # Mapeia em memória um arquivo gravado por salvar_grafo e devolve
+    # (nomes, deslocamentos, destinos, pesos) sem copiar os vetores: eles são
+    # memoryviews sobre o arquivo, lidos do disco à medida que são usados.
+    # nomes é uma TabelaNomes, que só decodifica os nomes consultados.
+    verificar_ordem_bytes()
+    with open(caminho, "rb") as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    memoria = memoryview(mapa)
+    if len(memoria) < CABECALHO_GRAFO.size or memoria[:4] != ASSINATURA_GRAFO:
+        raise ValueError(f"{caminho} não contém um grafo em formato binário")
+    _, tipo_nomes, tipo_pesos, V, A, _ = CABECALHO_GRAFO.unpack_from(memoria)
+
+    posicao = CABECALHO_GRAFO.size
+
+    def vetor(tipo, quantidade):
+        nonlocal posicao
+        inicio, posicao = posicao, posicao + 8 * quantidade
+        return memoria[inicio:posicao].cast(tipo)
+
+    deslocamentos = vetor("q", V + 1)
+    destinos = vetor("q", A)
+    pesos = vetor(tipo_pesos.decode(), A)
+    if tipo_nomes == b"i":
+        nomes = TabelaNomes(V, vetor("q", V))
+    elif tipo_nomes == b"s":
+        posicoes = vetor("q", V + 1)
+        nomes = TabelaNomes(V, memoria[posicao:], posicoes)
+    else:
+        nomes = TabelaNomes(V, pickle.loads(memoria[posicao:]))
+    return nomes, deslocamentos, destinos, pesos
+
+
+class TabelaNomes(Sequence):
+    # Índice -> nome de um grafo aberto por carregar_grafo. Com posicoes, os
+    # nomes são trechos UTF-8 de dados, decodificados a cada acesso até que
+    # a lista completa seja pedida (o que acontece na primeira busca por
+    # nome); sem elas, dados já é a sequência de nomes.
+    def __init__(self, V, dados, posicoes=None):
+        self.V = V
+        self.dados = dados
+        self.posicoes = posicoes
+        self.lista = None if posicoes is not None else dados
+        self.indices = IndicesNomes(self)  # Nome -> índice
+
+    def decodificar(self):
+        # Todos os nomes, decodificados uma única vez.
+        if self.lista is None:
+            dados, posicoes = self.dados, self.posicoes
+            self.lista = [
+                str(dados[posicoes[i] : posicoes[i + 1]], "utf-8")
+                for i in range(self.V)
+            ]
+        return self.lista
+
+    def __len__(self):
+        return self.V
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.V:
+            raise IndexError(i)
+        if self.lista is not None:
+            return self.lista[i]
+        return str(self.dados[self.posicoes[i] : self.posicoes[i + 1]], "utf-8")
+
+
+class IndicesNomes(Mapping):
+    # Nome -> índice de uma TabelaNomes. O dicionário só é montado na primeira
+    # consulta, para que abrir um grafo não custe O(V).
+    def __init__(self, nomes):
+        self.nomes = nomes
+        self.indices = None
+
+    def dicionario(self):
+        if self.indices is None:
+            self.indices = {nome: i for i, nome in enumerate(self.nomes.decodificar())}
+        return self.indices
+
+    def __getitem__(self, nome):
+        return self.dicionario()[nome]
+
+    def __contains__(self, nome):
+        return nome in self.dicionario()
+
+    def __iter__(self):
+        return iter(self.dicionario())
+
+    def __len__(self):
+        return len(self.nomes)
+
+
+class VerticesMapeados(Mapping):
+    # Vista de um grafo aberto por carregar_grafo no formato de
+    # GrafoPoderado.vertices ({nome: {vizinho: peso}}), só para leitura: o
+    # dicionário de vizinhos de cada vértice é montado quando consultado.
+    def __init__(self, nomes, deslocamentos, destinos, pesos):
+        self.nomes = nomes
+        self.deslocamentos = deslocamentos
+        self.destinos = destinos
+        self.pesos = pesos
+
+    def __getitem__(self, nome):
+        u = self.nomes.indices[nome]
+        nomes = self.nomes.decodificar()
+        destinos, pesos = self.destinos, self.pesos
+        return {
+            nomes[destinos[posicao]]: pesos[posicao]
+            for posicao in range(self.deslocamentos[u], self.deslocamentos[u + 1])
+        }
+
+    def __contains__(self, nome):
+        return nome in self.nomes.indices
+
+    def __iter__(self):
+        return iter(self.nomes)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def para_dicionarios(self):
+        # Cópia em dicionário de dicionários, que aceita alterações.
+        return {nome: self[nome] for nome in self.nomes}
+
+    def vetores(self):
+        # Cópias em array.array dos vetores CSR, no formato de GrafoCompacto.
+        copias = []
+        for vetor in (self.deslocamentos, self.destinos, self.pesos):
+            copia = array(vetor.format)
+            copia.frombytes(vetor.cast("B"))
+            copias.append(copia)
+        return copias
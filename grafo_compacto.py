@@ -0,0 +1,101 @@
+import heapq
+import sys
+from array import array
+
+
+class GrafoCompacto:
+    # Forma congelada e compacta de um GrafoPoderado (formato CSR).
+    # Os nomes dos vértices são trocados por índices inteiros e as adjacências
+    # ficam em três vetores contíguos: os vizinhos do vértice i estão em
+    # destinos[deslocamentos[i]:deslocamentos[i + 1]], com os pesos
+    # correspondentes nas mesmas posições de pesos.
+    def __init__(self, nomes, deslocamentos, destinos, pesos):
+        self.nomes = nomes  # Índice -> nome
+        self.indices = {nome: i for i, nome in enumerate(nomes)}  # Nome -> índice
+        self.deslocamentos = deslocamentos
+        self.destinos = destinos
+        self.pesos = pesos
+        self.V = len(nomes)  # Número de vértices
+        self.A = len(destinos)  # Número de arestas (cada sentido conta uma vez)
+
+    @classmethod
+    def a_partir_de_vertices(cls, vertices):
+        # Constrói a forma compacta a partir do dicionário de dicionários
+        # usado por GrafoPoderado.vertices.
+        nomes = list(vertices)
+        indices = {nome: i for i, nome in enumerate(nomes)}
+        inteiros = all(
+            isinstance(peso, int)
+            for vizinhos in vertices.values()
+            for peso in vizinhos.values()
+        )
+
+        deslocamentos = array("q", [0])
+        destinos = array("q")
+        pesos = array("q" if inteiros else "d")
+        for nome in nomes:
+            for vizinho, peso in vertices[nome].items():
+                destinos.append(indices[vizinho])
+                pesos.append(peso)
+            deslocamentos.append(len(destinos))
+
+        return cls(nomes, deslocamentos, destinos, pesos)
+
+    def memoria_bytes(self):
+        # Memória ocupada pelos vetores de adjacência e pela tabela de nomes.
+        vetores = sum(
+            vetor.itemsize * len(vetor)
+            for vetor in (self.deslocamentos, self.destinos, self.pesos)
+        )
+        nomes = sys.getsizeof(self.nomes) + sum(
+            sys.getsizeof(nome) for nome in self.nomes
+        )
+        return vetores + nomes + sys.getsizeof(self.indices)
+
+    def dijkstra(self, origem, destino):
+        # Dijkstra com fila de prioridade e parada antecipada sobre os índices
+        # inteiros. Os nomes só são usados para traduzir a origem, o destino e
+        # o caminho final, com o mesmo retorno (caminho, distancia) do GrafoPoderado.
+        infinito = float("inf")
+        s = self.indices.get(origem, -1)
+        t = self.indices.get(destino, -1)
+        if s == -1:
+            # Origem fora do grafo: nenhum vértice é alcançável a partir dela
+            return [origem], 0 if destino == origem else infinito
+        if t == -1:
+            return [origem], infinito  # Destino fora do grafo
+        deslocamentos, destinos, pesos = self.deslocamentos, self.destinos, self.pesos
+
+        distancias = [infinito] * self.V
+        predecessores = [-1] * self.V
+        visitados = bytearray(self.V)
+        distancias[s] = 0
+        fila = [(0, s)]
+
+        while fila:
+            distancia_atual, u = heapq.heappop(fila)
+            if visitados[u]:
+                continue  # Entrada obsoleta: o vértice já foi visitado
+            visitados[u] = 1
+
+            if u == t:
+                break  # A distância até o destino já é definitiva
+
+            for posicao in range(deslocamentos[u], deslocamentos[u + 1]):
+                v = destinos[posicao]
+                nova_distancia = distancia_atual + pesos[posicao]
+                if nova_distancia < distancias[v]:
+                    distancias[v] = nova_distancia
+                    predecessores[v] = u
+                    heapq.heappush(fila, (nova_distancia, v))
+
+        # Reconstrução do caminho, já traduzindo os índices para nomes
+        caminho = []
+        atual = t
+        while predecessores[atual] != -1:
+            caminho.append(self.nomes[atual])
+            atual = predecessores[atual]
+        caminho.append(origem)
+        caminho.reverse()
+
+        return caminho, distancias[t]
@@ -0,0 +1,309 @@
+import hashlib
+import heapq
+import struct
+from array import array
+
+from grafo_binario import verificar_ordem_bytes
+
+# Limite de vértices assentados em cada busca de testemunha. Uma busca
+# interrompida cedo só pode gerar atalhos a mais, nunca respostas erradas.
+LIMITE_TESTEMUNHA = 200
+
+# Formato binário gravado por HierarquiaContracao.salvar:
+#   cabeçalho: assinatura do formato, tipo dos pesos ("q" inteiros, "d"
+#              reais), V, A (entradas de destinos), M (atalhos em meios) e o
+#              SHA-256 do grafo de origem (ver assinar);
+#   deslocamentos (V + 1 inteiros de 8 bytes), destinos (A inteiros), pesos
+#   (A valores de 8 bytes) e os atalhos de meios em três vetores de M
+#   inteiros (a, b e o vértice contraído).
+# Só há números no arquivo: os nomes vêm do grafo em que ele é carregado.
+CABECALHO_HIERARQUIA = struct.Struct("<4sc3xqqq32s")
+ASSINATURA_HIERARQUIA = b"HCH1"
+
+
+def busca_testemunha(adjacencias, origem, ignorado, alvos, maximo):
+    # Dijkstra local a partir de origem, sem passar pelo vértice ignorado e sem
+    # ultrapassar a distância máxima. Retorna as distâncias encontradas.
+    distancias = {origem: 0}
+    fila = [(0, origem)]
+    restantes = len(alvos)
+    assentados = 0
+
+    while fila:
+        distancia_atual, u = heapq.heappop(fila)
+        if distancia_atual > distancias[u]:
+            continue  # Entrada obsoleta
+        if distancia_atual > maximo:
+            break
+        if u in alvos:
+            restantes -= 1
+            if restantes == 0:
+                break
+        assentados += 1
+        if assentados > LIMITE_TESTEMUNHA:
+            break
+
+        for v, peso in adjacencias[u].items():
+            if v == ignorado:
+                continue
+            nova_distancia = distancia_atual + peso
+            if nova_distancia < distancias.get(v, float("inf")):
+                distancias[v] = nova_distancia
+                heapq.heappush(fila, (nova_distancia, v))
+
+    return distancias
+
+
+def atalhos_necessarios(adjacencias, v):
+    # Atalhos (u, x, custo) que a contração de v exige: um para cada par de
+    # vizinhos cujo menor caminho conhecido passa obrigatoriamente por v.
+    vizinhos = [(u, peso) for u, peso in adjacencias[v].items() if u != v]
+    atalhos = []
+    for i, (u, peso_uv) in enumerate(vizinhos):
+        alvos = {x: peso_uv + peso_vx for x, peso_vx in vizinhos[i + 1 :]}
+        if not alvos:
+            continue
+        distancias = busca_testemunha(adjacencias, u, v, alvos, max(alvos.values()))
+        for x, custo in alvos.items():
+            if distancias.get(x, float("inf")) > custo:
+                atalhos.append((u, x, custo))
+    return atalhos
+
+
+class HierarquiaContracao:
+    # Hierarquia de contração (Contraction Hierarchies) de um grafo não
+    # direcionado. Depois do pré-processamento, cada consulta é um par de
+    # buscas de Dijkstra que só sobem na hierarquia (da origem e do destino),
+    # explorando uma fração mínima do grafo.
+    def __init__(self, nomes, deslocamentos, destinos, pesos, meios, assinatura):
+        self.nomes = nomes  # Índice -> nome
+        self.indices = {nome: i for i, nome in enumerate(nomes)}  # Nome -> índice
+        # Grafo "para cima" em CSR: só arestas para vértices de nível maior
+        self.deslocamentos = deslocamentos
+        self.destinos = destinos
+        self.pesos = pesos
+        # Atalho (a, b) com a < b -> vértice contraído que ele substitui
+        self.meios = meios
+        self.V = len(nomes)
+        # Hash do grafo de origem, para conferir se a hierarquia ainda vale
+        self.assinatura = assinatura
+
+    @staticmethod
+    def assinar(compacto):
+        # SHA-256 dos vetores CSR e dos nomes do grafo original: qualquer
+        # vértice, aresta ou peso diferente muda a assinatura.
+        resumo = hashlib.sha256(repr(list(compacto.nomes)).encode())
+        for vetor in (compacto.deslocamentos, compacto.destinos, compacto.pesos):
+            resumo.update(memoryview(vetor))
+        return resumo.digest()
+
+    @classmethod
+    def construir(cls, compacto):
+        # Pré-processa um GrafoCompacto: contrai os vértices um a um, na ordem
+        # dada pela diferença de arestas (atalhos criados - arestas removidas)
+        # somada ao número de vizinhos já contraídos.
+        V = compacto.V
+        adjacencias = [{} for _ in range(V)]
+        for u in range(V):
+            for posicao in range(
+                compacto.deslocamentos[u], compacto.deslocamentos[u + 1]
+            ):
+                v, peso = compacto.destinos[posicao], compacto.pesos[posicao]
+                if v != u and peso < adjacencias[u].get(v, float("inf")):
+                    adjacencias[u][v] = peso
+
+        meios = {}
+        acima = [None] * V  # Arestas para cima de cada vértice contraído
+        vizinhos_contraidos = [0] * V
+
+        def prioridade(v):
+            atalhos = atalhos_necessarios(adjacencias, v)
+            return (
+                len(atalhos) - len(adjacencias[v]) + vizinhos_contraidos[v],
+                atalhos,
+            )
+
+        fila = [(prioridade(v)[0], v) for v in range(V)]
+        heapq.heapify(fila)
+
+        while fila:
+            _, v = heapq.heappop(fila)
+            # Atualização preguiçosa: a prioridade pode ter mudado desde a inserção
+            atual, atalhos = prioridade(v)
+            if fila and atual > fila[0][0]:
+                heapq.heappush(fila, (atual, v))
+                continue
+
+            for u, x, custo in atalhos:
+                if custo < adjacencias[u].get(x, float("inf")):
+                    adjacencias[u][x] = custo
+                    adjacencias[x][u] = custo
+                    meios[(min(u, x), max(u, x))] = v
+
+            # Todos os vizinhos restantes ficam acima de v na hierarquia
+            acima[v] = list(adjacencias[v].items())
+            for u in adjacencias[v]:
+                del adjacencias[u][v]
+                vizinhos_contraidos[u] += 1
+            adjacencias[v] = {}
+
+        deslocamentos = array("q", [0])
+        destinos = array("q")
+        pesos = array(compacto.pesos.typecode)
+        for v in range(V):
+            for u, peso in acima[v]:
+                destinos.append(u)
+                pesos.append(peso)
+            deslocamentos.append(len(destinos))
+
+        return cls(
+            list(compacto.nomes),
+            deslocamentos,
+            destinos,
+            pesos,
+            meios,
+            cls.assinar(compacto),
+        )
+
+    def salvar(self, caminho):
+        # Grava o pré-processamento em disco no formato binário acima, para
+        # ser recarregado depois.
+        verificar_ordem_bytes()
+        pares = sorted(self.meios.items())
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(
+                CABECALHO_HIERARQUIA.pack(
+                    ASSINATURA_HIERARQUIA,
+                    self.pesos.typecode.encode(),
+                    self.V,
+                    len(self.destinos),
+                    len(pares),
+                    self.assinatura,
+                )
+            )
+            for vetor in (
+                self.deslocamentos,
+                self.destinos,
+                self.pesos,
+                array("q", (a for (a, _), _ in pares)),
+                array("q", (b for (_, b), _ in pares)),
+                array("q", (v for _, v in pares)),
+            ):
+                vetor.tofile(arquivo)
+
+    @classmethod
+    def carregar(cls, caminho, nomes):
+        # Lê um pré-processamento gravado por salvar() para o grafo cujos
+        # vértices são nomes (índice -> nome). Quem carrega deve conferir a
+        # assinatura com a do grafo (ver assinar).
+        verificar_ordem_bytes()
+        with open(caminho, "rb") as arquivo:
+            cabecalho = arquivo.read(CABECALHO_HIERARQUIA.size)
+            if (
+                len(cabecalho) < CABECALHO_HIERARQUIA.size
+                or cabecalho[:4] != ASSINATURA_HIERARQUIA
+            ):
+                raise ValueError(
+                    f"{caminho} não contém uma hierarquia de contração"
+                )
+            _, tipo_pesos, V, A, M, assinatura = CABECALHO_HIERARQUIA.unpack(
+                cabecalho
+            )
+            if V != len(nomes):
+                raise ValueError(
+                    f"A hierarquia em {caminho} foi gerada para outro grafo"
+                )
+            if tipo_pesos not in (b"q", b"d"):
+                raise ValueError(f"{caminho}: tipo de pesos inválido {tipo_pesos!r}")
+
+            def vetor(tipo, quantidade):
+                lido = array(tipo)
+                try:
+                    lido.fromfile(arquivo, quantidade)
+                except EOFError:
+                    raise ValueError(f"{caminho}: arquivo incompleto") from None
+                return lido
+
+            deslocamentos = vetor("q", V + 1)
+            destinos = vetor("q", A)
+            pesos = vetor(tipo_pesos.decode(), A)
+            meios_a, meios_b, meios_v = (vetor("q", M) for _ in range(3))
+
+        meios = {(a, b): v for a, b, v in zip(meios_a, meios_b, meios_v)}
+        return cls(list(nomes), deslocamentos, destinos, pesos, meios, assinatura)
+
+    def desempacotar(self, a, b, caminho):
+        # Expande a aresta (a, b), que pode ser um atalho, nos vértices
+        # originais que ela representa, acrescentando-os ao caminho (exceto a).
+        pilha = [(a, b)]
+        while pilha:
+            x, y = pilha.pop()
+            meio = self.meios.get((min(x, y), max(x, y)))
+            if meio is None:
+                caminho.append(y)
+            else:
+                pilha.append((meio, y))
+                pilha.append((x, meio))
+
+    def consultar(self, origem, destino):
+        # Busca bidirecional para cima: da origem e do destino, cada lado só
+        # relaxa arestas para vértices de nível maior. O menor caminho passa
+        # pelo vértice de maior nível, onde as duas buscas se encontram.
+        infinito = float("inf")
+        s = self.indices.get(origem, -1)
+        t = self.indices.get(destino, -1)
+        if s == -1:
+            # Origem fora do grafo: a mesma resposta de dijkstra
+            return [origem], 0 if destino == origem else infinito
+        if t == -1:
+            return [origem], infinito
+
+        distancias = ({s: 0}, {t: 0})
+        predecessores = ({}, {})
+        filas = ([(0, s)], [(0, t)])
+        melhor = infinito
+        encontro = -1
+        lado = 1
+
+        while True:
+            # Cada lado para quando o topo da sua fila não pode melhorar o resultado
+            ativos = [i for i in (0, 1) if filas[i] and filas[i][0][0] < melhor]
+            if not ativos:
+                break
+            lado = ativos[0] if len(ativos) == 1 else 1 - lado
+
+            distancia_atual, u = heapq.heappop(filas[lado])
+            if distancia_atual > distancias[lado][u]:
+                continue  # Entrada obsoleta
+
+            outro = distancias[1 - lado].get(u)
+            if outro is not None and distancia_atual + outro < melhor:
+                melhor = distancia_atual + outro
+                encontro = u
+
+            for posicao in range(self.deslocamentos[u], self.deslocamentos[u + 1]):
+                v = self.destinos[posicao]
+                nova_distancia = distancia_atual + self.pesos[posicao]
+                if nova_distancia < distancias[lado].get(v, infinito):
+                    distancias[lado][v] = nova_distancia
+                    predecessores[lado][v] = u
+                    heapq.heappush(filas[lado], (nova_distancia, v))
+
+        if encontro == -1:
+            return [origem], infinito
+
+        # Reconstrução: origem -> encontro -> destino, desempacotando os atalhos
+        subida = [encontro]
+        while subida[-1] in predecessores[0]:
+            subida.append(predecessores[0][subida[-1]])
+        subida.reverse()
+        descida = [encontro]
+        while descida[-1] in predecessores[1]:
+            descida.append(predecessores[1][descida[-1]])
+        vertices = subida + descida[1:]
+
+        caminho = [vertices[0]]
+        for a, b in zip(vertices, vertices[1:]):
+            self.desempacotar(a, b, caminho)
+
+        return [self.nomes[v] for v in caminho], melhor
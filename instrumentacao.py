@@ -0,0 +1,70 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class Estatisticas:
+    # Contadores de execuções instrumentadas de GrafoPoderado.dijkstra,
+    # GrafoAlgoritmoPrim.prim e floyd_warshall. Quem quer medir cria um objeto
+    # e o passa no parâmetro estatisticas; sem ele (None), cada algoritmo roda
+    # o laço original, sem nenhum contador. Os valores se acumulam entre
+    # chamadas até zerar().
+    # - assentados: vértices com resultado definitivo (no Floyd-Warshall,
+    #   vértices usados como intermediários);
+    # - relaxadas: arestas (ou pares) examinadas;
+    # - melhorias: distâncias ou custos que diminuíram;
+    # - operacoes_heap: inserções e remoções na fila de prioridade;
+    # - tempos: segundos acumulados em cada fase, por nome.
+    # ao_terminar, se dado, é chamado como ao_terminar(algoritmo, self) ao fim
+    # de cada execução instrumentada.
+    def __init__(self, ao_terminar=None):
+        self.ao_terminar = ao_terminar
+        self.zerar()
+
+    def zerar(self):
+        self.execucoes = 0
+        self.assentados = 0
+        self.relaxadas = 0
+        self.melhorias = 0
+        self.operacoes_heap = 0
+        self.tempos = {}
+
+    def somar(self, assentados=0, relaxadas=0, melhorias=0, operacoes_heap=0):
+        # Acumula os contadores locais de um laço instrumentado.
+        self.assentados += assentados
+        self.relaxadas += relaxadas
+        self.melhorias += melhorias
+        self.operacoes_heap += operacoes_heap
+
+    @contextmanager
+    def fase(self, nome):
+        # Mede o tempo do bloco with e o soma ao da fase nome.
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            decorrido = time.perf_counter() - inicio
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + decorrido
+
+    def concluir(self, algoritmo):
+        # Fecha uma execução instrumentada e avisa ao_terminar.
+        self.execucoes += 1
+        if self.ao_terminar is not None:
+            self.ao_terminar(algoritmo, self)
+
+    def como_dict(self):
+        return {
+            "execucoes": self.execucoes,
+            "assentados": self.assentados,
+            "relaxadas": self.relaxadas,
+            "melhorias": self.melhorias,
+            "operacoes_heap": self.operacoes_heap,
+            "tempos": dict(self.tempos),
+        }
+
+
+def fase(estatisticas, nome):
+    # estatisticas.fase(nome), ou um bloco que não mede nada se não houver
+    # estatísticas. Para fases de uma chamada, fora dos laços internos.
+    if estatisticas is None:
+        return nullcontext()
+    return estatisticas.fase(nome)
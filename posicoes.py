@@ -0,0 +1,61 @@
+import glob
+import hashlib
+import os
+import pickle
+
+import networkx as nx
+
+# Pasta onde ficam as posições já calculadas (relativa ao diretório atual).
+PASTA_CACHE = ".cache_posicoes"
+
+# Iterações do spring_layout quando ele parte de um desenho anterior do mesmo
+# grafo com poucas mudanças, em vez das 50 de uma simulação do zero.
+ITERACOES_AQUECIDO = 15
+
+
+def chave_layout(G, parametros):
+    # Resumo do conjunto de vértices, de arestas (com pesos) e dos parâmetros
+    # do layout. Qualquer mudança nesses dados gera outra chave.
+    resumo = hashlib.sha256()
+    for vertice in sorted(map(repr, G.nodes)):
+        resumo.update(vertice.encode())
+        resumo.update(b"\0")
+    resumo.update(b"\1")
+    arestas = sorted(
+        (*sorted((repr(u), repr(v))), repr(dados.get("weight")))
+        for u, v, dados in G.edges(data=True)
+    )
+    for aresta in arestas:
+        resumo.update("\0".join(aresta).encode())
+        resumo.update(b"\1")
+    resumo.update(repr(sorted(parametros.items())).encode())
+    return resumo.hexdigest()[:16]
+
+
+def posicoes_em_cache(G, nome, pasta=PASTA_CACHE, **parametros):
+    # nx.spring_layout(G, **parametros) com as posições guardadas em disco,
+    # em pasta/<nome>-<chave>.pkl. Se o mesmo grafo já foi desenhado com os
+    # mesmos parâmetros, as posições são só lidas. Se não, e houver um desenho
+    # anterior com o mesmo nome, a simulação parte das posições dele (os
+    # vértices novos começam em posições aleatórias) e roda menos iterações.
+    chave = chave_layout(G, parametros)
+    caminho = os.path.join(pasta, f"{nome}-{chave}.pkl")
+    if os.path.exists(caminho):
+        with open(caminho, "rb") as arquivo:
+            return pickle.load(arquivo)
+
+    anteriores = glob.glob(os.path.join(glob.escape(pasta), f"{nome}-*.pkl"))
+    if anteriores and "pos" not in parametros:
+        with open(max(anteriores, key=os.path.getmtime), "rb") as arquivo:
+            anterior = pickle.load(arquivo)
+        inicial = {v: anterior[v] for v in G.nodes if v in anterior}
+        if inicial:
+            parametros = dict(parametros, pos=inicial)
+            parametros.setdefault("iterations", ITERACOES_AQUECIDO)
+
+    posicoes = nx.spring_layout(G, **parametros)
+
+    os.makedirs(pasta, exist_ok=True)
+    with open(caminho, "wb") as arquivo:
+        pickle.dump(posicoes, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+    return posicoes